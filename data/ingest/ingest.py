@@ -0,0 +1,61 @@
+"""Ingest data/raw into the LanceDB knowledge base used by the agents' search_knowledge_base tool.
+
+    python data/ingest/ingest.py                        # incremental: only new or modified files are embedded
+    python data/ingest/ingest.py --workers 8 --index IVF_PQ
+    python data/ingest/ingest.py --rebuild-index          # retrain the ANN index over the whole table
+    python data/ingest/ingest.py --embedder sentence-transformers:all-MiniLM-L6-v2 --reembed
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from utils.retrieval.embeddings import get_embedder
+from utils.retrieval.ingestion import IngestionPipeline
+from utils.retrieval.store import DEFAULT_TABLE, KnowledgeStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--raw", default=os.path.join("data", "raw"), help="directory of source documents")
+    parser.add_argument("--manifest", default=os.path.join("data", "processed", "manifest.json"))
+    parser.add_argument("--db", default=None, help="LanceDB path (defaults to $LANCEDB_PATH or data/lancedb)")
+    parser.add_argument("--table", default=DEFAULT_TABLE)
+    parser.add_argument("--embedder", default=None, help="e.g. hashing, hashing:768, sentence-transformers:all-MiniLM-L6-v2")
+    parser.add_argument("--workers", type=int, default=None, help="embedding processes (0 = embed in this process)")
+    parser.add_argument("--batch-size", type=int, default=256, help="chunks per embedding batch")
+    parser.add_argument("--write-batch-size", type=int, default=4096, help="rows per LanceDB write")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--overlap", type=int, default=200)
+    parser.add_argument("--index", choices=["IVF_PQ", "IVF_HNSW_SQ", "none"], default="IVF_PQ")
+    parser.add_argument("--rebuild-index", action="store_true",
+                        help="retrain the ANN index; by default it is built once and then updated incrementally")
+    parser.add_argument("--no-prune", action="store_true", help="keep chunks of files that were deleted from --raw")
+    parser.add_argument("--prune-all", action="store_true", help="allow pruning every chunk when --raw has no documents")
+    parser.add_argument("--reembed", action="store_true", help="rebuild the table when --embedder differs from the one it was built with")
+    args = parser.parse_args()
+
+    store = KnowledgeStore(path=args.db, table_name=args.table, embedder=get_embedder(args.embedder))
+    pipeline = IngestionPipeline(
+        raw_dir=args.raw,
+        manifest_path=args.manifest,
+        store=store,
+        embedder_spec=args.embedder,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        write_batch_size=args.write_batch_size,
+        chunk_size=args.chunk_size,
+        overlap=args.overlap,
+        reembed=args.reembed,
+    )
+    stats = pipeline.run(prune=not args.no_prune, prune_all=args.prune_all).to_dict()
+    if args.index != "none" and (stats["chunks_written"] or stats["files_removed"] or args.rebuild_index):
+        # A re-embed dropped the table, so its index is rebuilt anyway
+        stats["index"] = store.update_index(index_type=args.index, rebuild=args.rebuild_index)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
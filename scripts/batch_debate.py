@@ -0,0 +1,55 @@
+"""Run a sweep of topics through the Judge Team on a bounded worker pool.
+
+Topics come from a file (one per line, or JSONL with ``topic`` and an optional ``id``) or from stdin with
+``-``. Each result is appended to the output as soon as its topic finishes (``.jsonl``, or a ``.parquet``
+dataset directory). Re-running the same command after a crash or Ctrl-C skips the topics already written.
+
+    python scripts/batch_debate.py topics.jsonl --output data/batch/nightly.jsonl --concurrency 8
+    python scripts/batch_debate.py topics.txt --output data/batch/nightly.parquet --mode routing --retry-failed
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+from src.teams.judge.judge_team import JudgeTeam  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("topics", help="topics file (.txt or .jsonl), or - for stdin")
+    parser.add_argument("--output", required=True, help="results file: .jsonl, or .parquet for a Parquet dataset")
+    parser.add_argument("--concurrency", type=int, default=4, help="topics debated at the same time")
+    parser.add_argument("--mode", choices=["team", "fan_out", "routing"], default="fan_out")
+    parser.add_argument("--restart", action="store_true", help="discard existing results instead of resuming")
+    parser.add_argument("--retry-failed", action="store_true", help="re-run topics whose recorded result is an error")
+    parser.add_argument("--no-reorder", action="store_true", help="keep the input order instead of grouping overlapping topics")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds allowed per topic")
+    parser.add_argument("--rows-per-part", type=int, default=100, help="rows per Parquet part file")
+    args = parser.parse_args()
+
+    team = JudgeTeam(fan_out=args.mode == "fan_out", routing=args.mode == "routing")
+
+    def progress(record):
+        print(f"{record['status']:>9}  {record['elapsed']:7.1f}s  {record['id']}  {record['topic'][:70]}", flush=True)
+
+    summary = team.run_batch(
+        args.topics,
+        args.output,
+        concurrency=args.concurrency,
+        resume=not args.restart,
+        retry_failed=args.retry_failed,
+        reorder=not args.no_reorder,
+        topic_timeout=args.timeout,
+        rows_per_part=args.rows_per_part,
+        on_result=progress,
+    )
+    print(json.dumps(summary.to_dict(), indent=2))
+    sys.exit(1 if summary.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
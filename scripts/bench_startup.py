@@ -0,0 +1,108 @@
+"""Cold-start benchmark for the AgentOS app and its agent modules.
+
+Each target is imported in a fresh interpreter so every measurement is a true cold import. Results are
+compared against ``scripts/startup_budget.json`` and the script exits non-zero when a target goes over
+budget, so it can gate CI.
+
+    python scripts/bench_startup.py                  # measure and check against the budget
+    python scripts/bench_startup.py --update-budget  # re-baseline the budget from this machine
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BUDGET_FILE = os.path.join(ROOT, "scripts", "startup_budget.json")
+
+TARGETS = [
+    "src.agentos",
+    "src.teams.judge.judge_team",
+    "src.agents.optimist.optimist_agent",
+    "src.agents.pessimist.pessimist_agent",
+    "src.agents.historian.historian_agent",
+    "src.agents.forecaster.forecaster_agent",
+]
+
+# Runs in the child interpreter; prints a single JSON line with the import time and resident memory
+PROBE = """
+import importlib, json, sys, time
+started = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - started
+try:
+    import psutil
+    rss = psutil.Process().memory_info().rss
+except ImportError:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+print(json.dumps({"import_seconds": elapsed, "rss_mb": rss / (1024 * 1024)}))
+"""
+
+
+def measure(target: str, repeats: int) -> dict:
+    samples = []
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", PROBE, target],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {target} failed:\n{result.stderr}")
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return {
+        "import_seconds": statistics.median(s["import_seconds"] for s in samples),
+        "rss_mb": max(s["rss_mb"] for s in samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--budget", default=BUDGET_FILE)
+    parser.add_argument("--update-budget", action="store_true", help="write the measured values (plus headroom) as the new budget")
+    parser.add_argument("--headroom", type=float, default=1.5, help="multiplier applied when updating the budget")
+    parser.add_argument("--output", help="optional path to write the raw results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for target in TARGETS:
+        results[target] = measure(target, args.repeats)
+        print(f"{target:45s} {results[target]['import_seconds']:7.3f}s {results[target]['rss_mb']:8.1f} MB")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_budget:
+        budget = {
+            target: {metric: round(value * args.headroom, 3) for metric, value in values.items()}
+            for target, values in results.items()
+        }
+        with open(args.budget, "w") as f:
+            json.dump(budget, f, indent=2)
+            f.write("\n")
+        print(f"Budget written to {args.budget}")
+        return 0
+
+    with open(args.budget) as f:
+        budget = json.load(f)
+
+    failures = []
+    for target, values in results.items():
+        for metric, limit in budget.get(target, {}).items():
+            if values[metric] > limit:
+                failures.append(f"{target}: {metric} {values[metric]:.3f} > budget {limit}")
+
+    for failure in failures:
+        print(f"OVER BUDGET  {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
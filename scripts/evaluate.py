@@ -0,0 +1,78 @@
+"""Score Judge Team configurations on a fixed question set: answer quality next to latency and token cost.
+
+Every case runs under every configuration on a process pool. The first configuration is the baseline the
+others are compared with; configurations that no other one beats on quality, cost and latency at once are
+marked as on the frontier. Backends:
+
+- ``mock``: local mock OpenAI endpoint and fake research tools, no network or API key (the default)
+- ``record``: live calls, recording LLM responses and tool results under ``--cassette``
+- ``replay``: re-runs a recording without the network, sleeping the recorded LLM latency
+- ``live``: live calls, nothing recorded
+
+    python scripts/evaluate.py --configs team team+compact fan_out fan_out+compact routing --workers 4
+    python scripts/evaluate.py --backend record --cassette data/eval/cassette --limit 4
+    python scripts/evaluate.py --backend replay --cassette data/eval/cassette --limit 4 --output data/eval/replay.json
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+from utils.evaluation.runner import PRESETS, evaluate, load_cases, resolve_configs  # noqa: E402
+
+
+def _fmt(value, spec: str = ".3f") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def print_table(report):
+    print(f"\nbackend={report.backend}  baseline={report.baseline}")
+    print(f"{'config':<17} {'err':>3} {'deg':>3} {'p50 s':>7} {'p95 s':>7} {'tokens':>8} {'cost $':>9} {'quality':>7} "
+          f"{'agree':>6} {'cover':>6} {'fast':>5}  frontier")
+    for s in report.configs:
+        print(
+            f"{s['config']:<17} {s['errors']:>3} {s['degraded']:>3} {_fmt(s['latency']['p50'], '.2f'):>7} {_fmt(s['latency']['p95'], '.2f'):>7} "
+            f"{_fmt(s['tokens'], '.0f'):>8} {_fmt(s['cost'], '.5f'):>9} {_fmt(s['quality']):>7} {_fmt(s['agreement']):>6} "
+            f"{_fmt(s['coverage']):>6} {_fmt(s['fast_path_share'], '.2f'):>5}  {'*' if s['frontier'] else ''}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", help="JSONL question set (default: utils/evaluation/questions.jsonl)")
+    parser.add_argument("--limit", type=int, default=None, help="only the first N questions")
+    parser.add_argument("--configs", nargs="+", default=list(PRESETS), choices=list(PRESETS),
+                        help="configurations to compare; the first is the baseline")
+    parser.add_argument("--backend", choices=["mock", "record", "replay", "live"], default="mock")
+    parser.add_argument("--cassette", default=os.path.join("data", "eval", "cassette"), help="recording directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="mock backend: seconds before the first token")
+    parser.add_argument("--completion-tokens", type=int, default=200, help="mock backend: tokens per completion")
+    parser.add_argument("--disagreement", type=float, default=0.1, help="mock backend: chance of a dissenting verdict")
+    parser.add_argument("--output", default=os.path.join("data", "eval", "report.json"), help="JSON report path")
+    args = parser.parse_args()
+
+    cases = load_cases(args.questions, limit=args.limit)
+    configs = resolve_configs(args.configs)
+    mock_options = {"latency": args.llm_latency, "completion_tokens": args.completion_tokens, "disagreement": args.disagreement}
+
+    def progress(result):
+        print(f"{result.status:>9}  {result.latency:7.2f}s  {result.config:<17} {result.case_id}"
+              + (f"  {result.error}" if result.error else ""), flush=True)
+
+    report = evaluate(cases, configs, backend=args.backend, workers=args.workers, directory=args.cassette,
+                      mock_options=mock_options, on_result=progress)
+    print_table(report)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report.to_dict(), f, indent=2)
+    print(f"\nReport written to {args.output}")
+    sys.exit(1 if any(s["errors"] for s in report.configs) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""A local stand-in for the OpenAI chat completions endpoint.
+
+Speaks enough of ``POST /v1/chat/completions`` (plain, streamed and structured-output requests, plus tool
+calls) for agno's ``OpenAIChat`` to drive the agents, the Judge Team and its reasoning step against it. Point
+the app at it with ``OPENAI_BASE_URL=http://127.0.0.1:8765/v1``.
+
+Timing is configurable: ``latency`` is the delay before the first token and ``tokens_per_second`` paces the
+rest, for both streamed and non-streamed responses. Only the standard library is used, so it runs anywhere.
+
+    python scripts/loadtest/mock_openai.py --port 8765 --latency 0.4 --tokens-per-second 60
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+WORDS = (
+    "the outlook depends on adoption costs regulation and investment while history suggests that early "
+    "forecasts often overestimate short term change and underestimate long term impact across markets"
+).split()
+
+# Tools the mock model calls (once per user turn) when they are offered; delegation first so a team run
+# actually reaches its members.
+TOOL_PREFERENCE = [
+    "delegate_task_to_members",
+    "delegate_task_to_member",
+    "search_knowledge_base",
+    "google_search",
+    "duckduckgo_search",
+    "get_top_hackernews_stories",
+]
+
+
+def _resolve(schema: dict[str, Any], root: dict[str, Any]) -> dict[str, Any]:
+    while "$ref" in schema:
+        node = root
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        schema = node
+    return schema
+
+
+def example_for_schema(schema: dict[str, Any], root: dict[str, Any], text: str) -> Any:
+    """Builds a value that validates against a (pydantic-generated) JSON schema."""
+    schema = _resolve(schema, root)
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            options = [s for s in schema[key] if _resolve(s, root).get("type") != "null"]
+            return example_for_schema(options[0] if options else schema[key][0], root, text)
+    if "enum" in schema:
+        # Terminal values keep multi-step loops (e.g. agno's reasoning steps) to a single round trip
+        return "final_answer" if "final_answer" in schema["enum"] else schema["enum"][0]
+    kind = schema.get("type", "object" if "properties" in schema else "string")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "object":
+        return {name: example_for_schema(prop, root, text) for name, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [example_for_schema(schema.get("items", {}), root, text)]
+    if kind == "integer":
+        return 3
+    if kind == "number":
+        return 0.9
+    if kind == "boolean":
+        return True
+    if kind == "null":
+        return None
+    return text
+
+
+class MockOpenAIServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.3,
+        tokens_per_second: float = 50,
+        completion_tokens: int = 200,
+        tool_calls: bool = True,
+        jitter: float = 0.2,
+        disagreement: float = 0.1,
+    ):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.completion_tokens = completion_tokens
+        self.tool_calls = tool_calls
+        self.jitter = jitter
+        # Chance that a requested `Verdict:` line departs from "positive" (drives JudgeTeam routing decisions)
+        self.disagreement = disagreement
+        self.requests = 0
+        self.streamed = 0
+        self.tool_call_responses = 0
+        # Responses the client abandoned part-way (cancelled runs stop reading their stream)
+        self.disconnects = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockOpenAIServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-openai", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "streamed": self.streamed,
+            "tool_call_responses": self.tool_call_responses,
+            "disconnects": self.disconnects,
+        }
+
+    def _jittered(self, seconds: float) -> float:
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _pick_tool(self, body: dict[str, Any]) -> dict[str, Any] | None:
+        tools = body.get("tools") or []
+        if not self.tool_calls or not tools or body.get("response_format"):
+            return None
+        for message in reversed(body.get("messages", [])):
+            if message.get("role") == "tool":
+                return None
+            if message.get("role") == "user":
+                break
+        offered = {t["function"]["name"]: t["function"] for t in tools if t.get("type") == "function"}
+        return next((offered[name] for name in TOOL_PREFERENCE if name in offered), None)
+
+    def _tool_arguments(self, function: dict[str, Any], prompt: str) -> str:
+        params = function.get("parameters") or {}
+        properties = params.get("properties", {})
+        arguments = {
+            name: example_for_schema(properties.get(name, {}), params, prompt[:200])
+            for name in params.get("required", list(properties)[:1])
+        }
+        return json.dumps(arguments)
+
+    def _completion(self, body: dict[str, Any]):
+        """Returns (message, finish_reason, prompt_tokens) for a request; the content is deterministic per system and user prompt."""
+        messages = body.get("messages", [])
+        prompt = next((str(m.get("content")) for m in reversed(messages) if m.get("role") == "user"), "")
+        prompt_tokens = len(json.dumps(messages)) // 4
+
+        function = self._pick_tool(body)
+        if function is not None:
+            call = {
+                "id": f"call_{uuid.uuid4().hex[:24]}",
+                "type": "function",
+                "function": {"name": function["name"], "arguments": self._tool_arguments(function, prompt)},
+            }
+            return {"role": "assistant", "content": None, "tool_calls": [call]}, "tool_calls", prompt_tokens
+
+        response_format = body.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            schema = response_format["json_schema"].get("schema", {})
+            content = json.dumps(example_for_schema(schema, schema, "mock"))
+        elif response_format.get("type") == "json_object":
+            content = json.dumps({"content": "mock"})
+        else:
+            # Seeded by the system prompt too, so members given the same topic still write different reports
+            system = next((str(m.get("content")) for m in messages if m.get("role") in ("system", "developer")), "")
+            rng = random.Random(hashlib.sha256(f"{system}\n{prompt}".encode()).hexdigest())
+            content = " ".join(rng.choice(WORDS) for _ in range(self.completion_tokens))
+            if "Verdict:" in prompt:
+                verdict = random.choice(["negative", "mixed"]) if random.random() < self.disagreement else "positive"
+                content += f"\n\nVerdict: {verdict}"
+        return {"role": "assistant", "content": content}, "stop", prompt_tokens
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: dict[str, Any]):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.rstrip("/").endswith("/models"):
+                    self._send_json(200, {"object": "list", "data": [{"id": "gpt-4o", "object": "model", "owned_by": "mock"}]})
+                else:
+                    self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+                    return
+
+                message, finish_reason, prompt_tokens = server._completion(body)
+                completion_tokens = len((message.get("content") or "").split()) or 20
+                with server._lock:
+                    server.requests += 1
+                    server.streamed += bool(body.get("stream"))
+                    server.tool_call_responses += finish_reason == "tool_calls"
+                usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                         "total_tokens": prompt_tokens + completion_tokens}
+                base = {"id": f"chatcmpl-{uuid.uuid4().hex}", "created": int(time.time()), "model": body.get("model", "gpt-4o")}
+                try:
+                    if body.get("stream"):
+                        self._stream(base, message, finish_reason, usage, body)
+                    else:
+                        time.sleep(server._jittered(server.latency) + completion_tokens / server.tokens_per_second)
+                        choice = {"index": 0, "message": message, "finish_reason": finish_reason}
+                        self._send_json(200, {**base, "object": "chat.completion", "choices": [choice], "usage": usage})
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up (cancelled run or load generator timeout)
+                    with server._lock:
+                        server.disconnects += 1
+
+            def _stream(self, base, message, finish_reason, usage, body):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                def chunk(delta, finish=None, **extra):
+                    payload = {**base, "object": "chat.completion.chunk",
+                               "choices": [{"index": 0, "delta": delta, "finish_reason": finish}], **extra}
+                    self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+                    self.wfile.flush()
+
+                time.sleep(server._jittered(server.latency))
+                chunk({"role": "assistant", "content": ""})
+                if message.get("tool_calls"):
+                    calls = [{"index": i, **call} for i, call in enumerate(message["tool_calls"])]
+                    chunk({"tool_calls": calls})
+                else:
+                    started = time.perf_counter()
+                    words = message["content"].split(" ")
+                    for i, word in enumerate(words):
+                        # Pace against the wall clock so per-chunk overhead does not slow the stream down
+                        delay = started + i / server.tokens_per_second - time.perf_counter()
+                        if delay > 0:
+                            time.sleep(delay)
+                        chunk({"content": word if i == 0 else " " + word})
+                chunk({}, finish_reason)
+                if (body.get("stream_options") or {}).get("include_usage"):
+                    payload = {**base, "object": "chat.completion.chunk", "choices": [], "usage": usage}
+                    self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=50)
+    parser.add_argument("--completion-tokens", type=int, default=200)
+    parser.add_argument("--no-tool-calls", action="store_true", help="never answer with a tool call")
+    parser.add_argument("--disagreement", type=float, default=0.1, help="chance a requested verdict is not 'positive'")
+    args = parser.parse_args()
+
+    server = MockOpenAIServer(args.host, args.port, args.latency, args.tokens_per_second, args.completion_tokens,
+                              tool_calls=not args.no_tool_calls, disagreement=args.disagreement)
+    print(f"Mock OpenAI endpoint listening on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
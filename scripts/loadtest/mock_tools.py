@@ -0,0 +1,129 @@
+"""Offline stand-ins for the research toolkits.
+
+The real ``Lazy*Tools`` classes are reused as-is (same function names, signatures and docstrings, so the model
+sees an identical tool schema and the research cache/telemetry hooks behave the same); only the toolkit they
+lazily delegate to is replaced with :class:`FakeResearchBackend`, which sleeps for a configurable latency and
+returns deterministic, realistically sized payloads.
+"""
+import functools
+import hashlib
+import json
+import random
+import time
+
+from agno.tools import Toolkit
+from agno.tools.reasoning import ReasoningTools
+
+from src.agents.registry import AGENT_FACTORIES, AgentRegistry
+from src.tools.knowledge_tools import KnowledgeTools
+from src.tools.research_tools import (
+    LazyDuckDuckGoTools,
+    LazyGoogleSearchTools,
+    LazyHackerNewsTools,
+    LazyNewspaper4kTools,
+)
+
+WORDS = (
+    "market adoption policy energy risk growth supply demand cost forecast history regulation capital "
+    "research labour climate infrastructure investment safety trend scale network productivity"
+).split()
+
+
+class FakeResearchBackend:
+    """Implements every function the lazy research toolkits delegate to, without touching the network."""
+
+    def __init__(self, latency: float = 0.2, jitter: float = 0.5, article_words: int = 600):
+        self.latency = latency
+        self.jitter = jitter
+        self.article_words = article_words
+
+    def _sleep(self):
+        if self.latency > 0:
+            time.sleep(self.latency * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    @staticmethod
+    def _rng(*parts) -> random.Random:
+        seed = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+        return random.Random(int(seed[:16], 16))
+
+    def _text(self, rng: random.Random, words: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(words))
+
+    def _results(self, kind: str, query: str, max_results: int) -> str:
+        self._sleep()
+        rng = self._rng(kind, query)
+        return json.dumps([
+            {
+                "title": self._text(rng, 6).title(),
+                "url": f"https://example.com/{kind}/{rng.getrandbits(32):08x}",
+                "description": self._text(rng, 40),
+            }
+            for _ in range(max_results)
+        ])
+
+    def google_search(self, query: str, max_results: int = 5, language: str = "en") -> str:
+        return self._results("google", query, max_results)
+
+    def duckduckgo_search(self, query: str, max_results: int = 5) -> str:
+        return self._results("ddg", query, max_results)
+
+    def duckduckgo_news(self, query: str, max_results: int = 5) -> str:
+        return self._results("ddg-news", query, max_results)
+
+    def read_article(self, url: str) -> str:
+        self._sleep()
+        rng = self._rng("article", url)
+        return json.dumps({"title": self._text(rng, 6).title(), "authors": ["Jane Doe"], "text": self._text(rng, self.article_words)})
+
+    def get_top_hackernews_stories(self, num_stories: int = 10) -> str:
+        self._sleep()
+        rng = self._rng("hn", num_stories)
+        return json.dumps([
+            {"id": rng.getrandbits(24), "title": self._text(rng, 8).title(), "score": rng.randint(1, 900), "by": f"user{i}"}
+            for i in range(num_stories)
+        ])
+
+    def get_user_details(self, username: str) -> str:
+        self._sleep()
+        rng = self._rng("hn-user", username)
+        return json.dumps({"id": username, "karma": rng.randint(1, 50000), "about": self._text(rng, 20)})
+
+
+class MockKnowledgeTools(KnowledgeTools):
+    def __init__(self, backend: FakeResearchBackend, **kwargs):
+        self.backend = backend
+        super().__init__(**kwargs)
+
+    def search_knowledge_base(self, query: str, num_results: int = 5) -> str:
+        return self.backend._results("knowledge", query, num_results)
+
+    search_knowledge_base.__doc__ = KnowledgeTools.search_knowledge_base.__doc__
+
+
+def _offline(toolkit, backend: FakeResearchBackend):
+    toolkit._toolkit = backend
+    return toolkit
+
+
+def mock_research_tools(backend: FakeResearchBackend) -> list[Toolkit]:
+    """Same toolkits as :func:`src.tools.research_tools.research_tools`, backed by ``backend``."""
+    return [
+        MockKnowledgeTools(backend),
+        _offline(LazyHackerNewsTools(), backend),
+        _offline(LazyNewspaper4kTools(), backend),
+        _offline(LazyGoogleSearchTools(), backend),
+    ]
+
+
+def mock_judge_tools(backend: FakeResearchBackend) -> list[Toolkit]:
+    """Same toolkits as the JudgeTeam default, with DuckDuckGo backed by ``backend``."""
+    return [ReasoningTools(add_instructions=True), _offline(LazyDuckDuckGoTools(), backend)]
+
+
+def offline_registry(backend: FakeResearchBackend) -> AgentRegistry:
+    """An agent registry whose agents use :func:`mock_research_tools` (each agent gets its own toolkits)."""
+    factories = {
+        name: functools.partial(AgentRegistry._resolve(factory), tools=mock_research_tools(backend))
+        for name, factory in AGENT_FACTORIES.items()
+    }
+    return AgentRegistry(factories)
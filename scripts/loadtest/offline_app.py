@@ -0,0 +1,25 @@
+"""``agentos:app`` wired to offline research tools, for load tests.
+
+The agent registry is swapped for one whose agents use :mod:`mock_tools` before ``src.agentos`` is imported,
+so the app, its routes and the Judge Team are otherwise exactly what production serves. The model endpoint
+comes from ``OPENAI_BASE_URL`` (see :mod:`mock_openai`).
+
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=mock \\
+        uvicorn scripts.loadtest.offline_app:app --port 7777
+"""
+import functools
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from scripts.loadtest.mock_tools import FakeResearchBackend, mock_judge_tools, offline_registry
+from src.agents.registry import set_agent_registry
+
+backend = FakeResearchBackend(latency=float(os.getenv("POLYMIND_LOADTEST_TOOL_LATENCY", "0.2")))
+set_agent_registry(offline_registry(backend))
+
+from src import agentos  # noqa: E402
+
+agentos.debate_team.tool_factory = functools.partial(mock_judge_tools, backend)
+app = agentos.app
@@ -0,0 +1,406 @@
+"""Offline load test for the AgentOS HTTP endpoints and ``JudgeTeam.run``.
+
+Everything runs against local stand-ins (a mock OpenAI endpoint and fake research tools), so results are
+reproducible and need no network or API key. Each run writes a JSON report with throughput,
+p50/p95/p99 latency, time-to-first-token and peak RSS. Pass ``--compare`` with an earlier report to diff them.
+
+    # AgentOS under uvicorn: every agent endpoint plus the judge team, 8 concurrent streaming clients
+    python scripts/loadtest/run.py agentos --concurrency 8 --requests 64
+
+    # JudgeTeam.run in-process, using the deadline-bound fan-out path
+    python scripts/loadtest/run.py judge --mode fan_out --concurrency 4 --requests 16
+
+    # Routing mode, with members disagreeing on a third of the verdicts
+    python scripts/loadtest/run.py judge --mode routing --disagreement 0.33
+
+    # Point at an already running server (its own model/tool configuration is used as-is)
+    python scripts/loadtest/run.py agentos --url http://localhost:7777 --server-pid 12345
+"""
+import argparse
+import asyncio
+import functools
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.append(ROOT)
+
+from scripts.loadtest.mock_openai import MockOpenAIServer  # noqa: E402
+
+TOPICS = [
+    "The future of renewable energy",
+    "Will remote work remain the norm for software teams?",
+    "The impact of AI on construction site safety",
+    "Prospects for commercial fusion power",
+    "Should cities ban private cars from their centres?",
+    "The outlook for global semiconductor supply chains",
+    "Will lab-grown meat reach price parity?",
+    "The long-term effects of central bank digital currencies",
+]
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    ok: bool
+    latency: float
+    ttft: float | None = None
+    error: str | None = None
+    # fast | full, for JudgeTeam routing mode
+    route: str | None = None
+
+
+class RssSampler:
+    """Polls the resident set size of a process in the background and keeps the peak."""
+
+    def __init__(self, pid: int | None = None, interval: float = 0.05):
+        self.pid = pid or os.getpid()
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _rss(self) -> int:
+        try:
+            import psutil
+
+            return psutil.Process(self.pid).memory_info().rss
+        except ImportError:
+            with open(f"/proc/{self.pid}/status") as f:
+                line = next(line for line in f if line.startswith("VmRSS:"))
+            return int(line.split()[1]) * 1024
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.peak = max(self.peak, self._rss())
+            except Exception:
+                return
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def peak_mb(self) -> float:
+        return self.peak / (1024 * 1024)
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    millis = [v * 1000 for v in values]
+    return {
+        "p50": percentile(millis, 0.50),
+        "p95": percentile(millis, 0.95),
+        "p99": percentile(millis, 0.99),
+        "mean": sum(millis) / len(millis),
+        "max": max(millis),
+    }
+
+
+async def drive(jobs: list[Callable], concurrency: int) -> list[Sample]:
+    """Runs the (async) jobs with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(job):
+        async with semaphore:
+            return await job()
+
+    return await asyncio.gather(*(bounded(job) for job in jobs))
+
+
+# AgentOS over HTTP
+
+def is_content_event(name: str, data: str) -> bool:
+    if not name.endswith("RunContent"):
+        return False
+    try:
+        return bool(json.loads(data).get("content"))
+    except ValueError:
+        return False
+
+
+async def http_run(client, endpoint: str, path: str, topic: str, stream: bool, timeout: float) -> Sample:
+    started = time.perf_counter()
+    ttft = None
+    error = None
+    form = {"message": topic, "stream": str(stream).lower()}
+    try:
+        async with client.stream("POST", path, data=form, timeout=timeout) as response:
+            if response.status_code != 200:
+                body = await response.aread()
+                error = f"HTTP {response.status_code}: {body[:200]!r}"
+            elif stream:
+                event = ""
+                async for line in response.aiter_lines():
+                    if line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        if event.endswith("RunError"):
+                            error = line[5:].strip()[:200]
+                        elif ttft is None and is_content_event(event, line[5:].strip()):
+                            ttft = time.perf_counter() - started
+            else:
+                await response.aread()
+    except Exception as e:
+        error = repr(e)
+    return Sample(endpoint, error is None, time.perf_counter() - started, ttft, error)
+
+
+def start_server(args, env: dict[str, str]) -> subprocess.Popen:
+    command = [sys.executable, "-m", "uvicorn", "scripts.loadtest.offline_app:app", "--host", "127.0.0.1",
+               "--port", str(args.port), "--log-level", "warning", "--workers", "1"]
+    return subprocess.Popen(command, cwd=ROOT, env={**os.environ, **env})
+
+
+def wait_until_ready(url: str, process: subprocess.Popen | None, timeout: float = 120):
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"AgentOS server exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{url}/health", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise TimeoutError(f"AgentOS server at {url} did not become ready within {timeout}s")
+
+
+async def run_agentos(args, url: str) -> list[Sample]:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.concurrency * 2, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+        routes = []
+        if args.endpoints in ("agents", "all"):
+            agents = (await client.get("/agents")).json()
+            routes += [(a["name"], f"/agents/{a['id']}/runs") for a in agents]
+        if args.endpoints in ("team", "all"):
+            teams = (await client.get("/teams")).json()
+            routes += [(t["name"], f"/teams/{t['id']}/runs") for t in teams]
+        if not routes:
+            raise RuntimeError(f"No endpoints found at {url}")
+
+        jobs = []
+        for i in range(args.requests):
+            endpoint, path = routes[i % len(routes)]
+            topic = TOPICS[i % len(TOPICS)]
+            jobs.append(lambda e=endpoint, p=path, t=topic: http_run(client, e, p, t, args.stream, args.timeout))
+        return await drive(jobs, args.concurrency)
+
+
+# JudgeTeam.run in-process
+
+def judge_run(judge_team, topic: str, stream: bool) -> Sample:
+    started = time.perf_counter()
+    ttft = None
+    error = None
+    route = None
+    try:
+        response = judge_team.run(topic, stream=stream)
+        if stream and (judge_team.fan_out or judge_team.routing):
+            # Debate event dicts, see JudgeTeam.astream
+            for event in response:
+                if event["event"] in ("RunError", "DebateError"):
+                    error = str(event.get("error"))[:200]
+                elif ttft is None and event["event"] in ("MemberContent", "JudgeContent"):
+                    ttft = time.perf_counter() - started
+                elif event["event"] == "DebateCompleted":
+                    route = (event["metadata"].get("routing") or {}).get("path")
+        elif stream:
+            for event in response:
+                name = str(getattr(event, "event", ""))
+                if name.endswith("RunError"):
+                    error = str(getattr(event, "content", ""))[:200]
+                elif ttft is None and name.endswith("RunContent") and getattr(event, "content", None):
+                    ttft = time.perf_counter() - started
+        elif str(getattr(response, "status", "")).upper().endswith("ERROR"):
+            error = str(response.content)[:200]
+        else:
+            route = ((getattr(response, "metadata", None) or {}).get("routing") or {}).get("path")
+    except Exception as e:
+        error = repr(e)
+    return Sample("judge_team", error is None, time.perf_counter() - started, ttft, error, route)
+
+
+def build_judge_team(args):
+    from scripts.loadtest.mock_tools import FakeResearchBackend, mock_judge_tools, offline_registry
+    from src.teams.judge.judge_team import JudgeTeam
+
+    backend = FakeResearchBackend(latency=args.tool_latency)
+    return JudgeTeam(
+        registry=offline_registry(backend),
+        fan_out=args.mode == "fan_out",
+        routing=args.mode == "routing",
+        soft_deadline=args.timeout / 2,
+        hard_deadline=args.timeout,
+        tools=functools.partial(mock_judge_tools, backend),
+    )
+
+
+async def run_judge(args) -> list[Sample]:
+    judge_team = build_judge_team(args)
+    jobs = [
+        lambda t=TOPICS[i % len(TOPICS)]: asyncio.to_thread(judge_run, judge_team, t, args.stream)
+        for i in range(args.requests)
+    ]
+    return await drive(jobs, args.concurrency)
+
+
+def build_report(args, samples: list[Sample], duration: float, peak_rss_mb: float, mock: MockOpenAIServer | None):
+    ok = [s for s in samples if s.ok]
+    endpoints = {}
+    for name in sorted({s.endpoint for s in samples}):
+        group = [s for s in samples if s.endpoint == name]
+        endpoints[name] = {
+            "requests": len(group),
+            "errors": sum(not s.ok for s in group),
+            "latency_ms": summarize([s.latency for s in group if s.ok]),
+            "ttft_ms": summarize([s.ttft for s in group if s.ttft is not None]),
+        }
+    config = {k: v for k, v in vars(args).items() if k not in ("output", "compare")}
+    return {
+        "target": args.target,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "host": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "config": config,
+        "requests": len(samples),
+        "errors": len(samples) - len(ok),
+        "duration_seconds": duration,
+        "throughput_rps": len(ok) / duration if duration else 0.0,
+        "latency_ms": summarize([s.latency for s in ok]),
+        "ttft_ms": summarize([s.ttft for s in ok if s.ttft is not None]),
+        "peak_rss_mb": peak_rss_mb,
+        "endpoints": endpoints,
+        "routes": {route: sum(s.route == route for s in samples) for route in sorted({s.route for s in samples if s.route})},
+        "mock_llm": mock.stats() if mock else None,
+        "sample_errors": [asdict(s) for s in samples if not s.ok][:10],
+    }
+
+
+def compare(report: dict, baseline: dict):
+    rows = [("throughput_rps", report["throughput_rps"], baseline.get("throughput_rps")),
+            ("peak_rss_mb", report["peak_rss_mb"], baseline.get("peak_rss_mb"))]
+    for metric in ("latency_ms", "ttft_ms"):
+        for q in ("p50", "p95", "p99"):
+            rows.append((f"{metric}.{q}", (report.get(metric) or {}).get(q), (baseline.get(metric) or {}).get(q)))
+    print(f"{'metric':<18}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, current, previous in rows:
+        change = f"{(current - previous) / previous:+.1%}" if current is not None and previous else "-"
+        fmt = lambda v: f"{v:12.2f}" if v is not None else f"{'-':>12}"  # noqa: E731
+        print(f"{name:<18}{fmt(previous)}{fmt(current)}{change:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("target", choices=["agentos", "judge"])
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=16, help="total number of runs to issue")
+    parser.add_argument("--stream", action=argparse.BooleanOptionalAction, default=None,
+                        help="stream responses (default: on, except for the judge's fan_out and routing modes)")
+    parser.add_argument("--timeout", type=float, default=120, help="per-request timeout in seconds")
+    parser.add_argument("--endpoints", choices=["agents", "team", "all"], default="all", help="agentos only")
+    parser.add_argument("--mode", choices=["team", "fan_out", "routing"], default="team", help="judge only")
+    parser.add_argument("--url", help="load an already running AgentOS server instead of starting one")
+    parser.add_argument("--server-pid", type=int, help="pid of the --url server, for peak RSS")
+    parser.add_argument("--port", type=int, default=7799, help="port for the AgentOS server started by this script")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="mock model delay before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=50, help="mock model streaming rate")
+    parser.add_argument("--completion-tokens", type=int, default=200, help="mock model answer length")
+    parser.add_argument("--disagreement", type=float, default=0.1, help="chance a mock member verdict is not 'positive'")
+    parser.add_argument("--tool-latency", type=float, default=0.2, help="fake research tool latency")
+    parser.add_argument("--response-cache", action="store_true", help="turn the in-memory response cache on (off by default)")
+    parser.add_argument("--output", help="report path (default: data/loadtest/<target>-<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier report to print a comparison against")
+    args = parser.parse_args()
+    if args.stream is None:
+        # Those modes answer with one response; streaming them measures the debate event stream instead
+        args.stream = not (args.target == "judge" and args.mode in ("fan_out", "routing"))
+
+    mock = None
+    env = {}
+    if not args.url:
+        mock = MockOpenAIServer(port=0, latency=args.llm_latency, tokens_per_second=args.tokens_per_second,
+                                completion_tokens=args.completion_tokens, disagreement=args.disagreement).start()
+        env = {
+            "OPENAI_BASE_URL": mock.base_url,
+            "OPENAI_API_KEY": "mock",
+            "POLYMIND_LOADTEST_TOOL_LATENCY": str(args.tool_latency),
+        }
+        env["POLYMIND_RESPONSE_CACHE"] = "memory" if args.response_cache else "off"
+
+    server = None
+    try:
+        if args.target == "agentos":
+            url = args.url
+            if url is None:
+                server = start_server(args, env)
+                url = f"http://127.0.0.1:{args.port}"
+            wait_until_ready(url, server)
+            pid = server.pid if server else args.server_pid
+            with RssSampler(pid) as rss:
+                started = time.perf_counter()
+                samples = asyncio.run(run_agentos(args, url))
+                duration = time.perf_counter() - started
+        else:
+            os.environ.update(env)
+            with RssSampler() as rss:
+                started = time.perf_counter()
+                samples = asyncio.run(run_judge(args))
+                duration = time.perf_counter() - started
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+        if mock is not None:
+            mock.stop()
+
+    report = build_report(args, samples, duration, rss.peak_mb, mock)
+    output = args.output or os.path.join(
+        ROOT, "data", "loadtest", f"{args.target}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    latency = report["latency_ms"] or {}
+    ttft = report["ttft_ms"] or {}
+    print(f"{report['requests']} requests, {report['errors']} errors in {duration:.1f}s "
+          f"({report['throughput_rps']:.2f} req/s), peak RSS {report['peak_rss_mb']:.0f} MB")
+    print(f"latency p50/p95/p99: {latency.get('p50', 0):.0f}/{latency.get('p95', 0):.0f}/{latency.get('p99', 0):.0f} ms"
+          + (f", TTFT p50: {ttft['p50']:.0f} ms" if ttft else ""))
+    print(f"Report written to {output}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,31 @@
-from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.os import AgentOS
-from agno.db.sqlite import SqliteDb
-from agno.tools.duckduckgo import DuckDuckGoTools
-from agno.tools.yfinance import YFinanceTools
 
-from src.agents.forecaster.forecaster_agent import ForecasterAgent
-from src.agents.historian.historian_agent import HistorianAgent 
-from src.agents.optimist.optimist_agent import OptimistAgent
-from src.agents.pessimist.pessimist_agent import PessimistAgent
+from src.agents.registry import get_agent_registry
+from src.api.debate import get_debate_router
+from src.api.history import get_history_router
 from src.teams.judge.judge_team import JudgeTeam
+from utils.shared.session_db import get_session_db
+from utils.telemetry.router import get_telemetry_router
 
-forecaster_agent = ForecasterAgent().agent
-historian_agent = HistorianAgent().agent
-optimist_agent = OptimistAgent().agent
-pessimist_agent = PessimistAgent().agent
-judge_team = JudgeTeam().team
+# One registry per worker: each agent (model client and toolkits) is built once and served by the standalone
+# endpoints; the judge team runs it through its own Agent object, which shares that model client and those toolkits
+registry = get_agent_registry()
+forecaster_agent = registry.agent("forecaster")
+historian_agent = registry.agent("historian")
+optimist_agent = registry.agent("optimist")
+pessimist_agent = registry.agent("pessimist")
+# Sessions and member responses persist to SQLite; only a bounded window of recent runs stays on each session
+db = get_session_db()
+for agent in (forecaster_agent, historian_agent, optimist_agent, pessimist_agent):
+    agent.db = db
+debate_team = JudgeTeam(registry=registry, db=db)
+judge_team = debate_team.team
 
 agent_os = AgentOS(agents=[forecaster_agent, historian_agent, optimist_agent, pessimist_agent], teams=[judge_team])
 app = agent_os.get_app()
+app.include_router(get_telemetry_router(agent_os.settings))
+app.include_router(get_debate_router(debate_team, agent_os.settings))
+app.include_router(get_history_router(db, agent_os.settings))
 
 if __name__ == "__main__":
-    agent_os.serve("agentos:app", reload=True)
\ No newline at end of file
+    agent_os.serve("agentos:app", reload=True)
@@ -1,27 +1,32 @@
-import sys
 import os
+import sys
+
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.tools.hackernews import HackerNewsTools
-from agno.tools.newspaper4k import Newspaper4kTools
-from agno.tools.googlesearch import GoogleSearchTools
+
+from src.models.pooled_openai import PooledOpenAIChat
 from src.prompts.agent_prompts import AgentPrompts
+from src.tools.research_tools import research_tools
+from utils.shared.research_cache import research_cache_hook
+from utils.shared.response_cache import cached_run
+from utils.telemetry.instrument import telemetry_tool_hook
+
 
-class HistorianAgent():
-    def __init__(self):
+class HistorianAgent:
+    def __init__(self, tools: list | None = None):
         self.agent = Agent(
             name="Historian Agent",
-            model=OpenAIChat(id="gpt-4o", temperature=0.5),
-            tools=[HackerNewsTools(), Newspaper4kTools(), GoogleSearchTools()],
+            model=PooledOpenAIChat(id="gpt-4o", temperature=0.5),
+            tools=research_tools() if tools is None else tools,
+            tool_hooks=[telemetry_tool_hook, research_cache_hook],
             instructions=AgentPrompts.HISTORIAN_INSTRUCTIONS,
             markdown=True,
         )
 
     def run(self, topic: str, stream: bool = False):
-        return self.agent.run(f"Write a detailed report on the topic: {topic}", stream=stream)
-    
+        return cached_run(self.agent, topic, lambda: self.agent.run(f"Write a detailed report on the topic: {topic}", stream=stream), stream=stream)
+
 if __name__ == "__main__":
     historian_agent = HistorianAgent()
     try:
@@ -31,4 +36,4 @@ if __name__ == "__main__":
             print(getattr(response, 'content', str(response)))
 
     except Exception as e:
-        print(f"Error occurred in HistorianAgent: {e}")
\ No newline at end of file
+        print(f"Error occurred in HistorianAgent: {e}")
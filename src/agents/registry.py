@@ -0,0 +1,73 @@
+import importlib
+import threading
+from collections.abc import Sequence
+
+from agno.agent import Agent
+
+from utils.telemetry.instrument import instrument
+
+# Agent name -> "module:Class" of its wrapper. Modules are only imported when the agent is first requested.
+AGENT_FACTORIES = {
+    "optimist": "src.agents.optimist.optimist_agent:OptimistAgent",
+    "pessimist": "src.agents.pessimist.pessimist_agent:PessimistAgent",
+    "historian": "src.agents.historian.historian_agent:HistorianAgent",
+    "forecaster": "src.agents.forecaster.forecaster_agent:ForecasterAgent",
+}
+
+
+class AgentRegistry:
+    """Builds each agent (with its model client and tools) once and hands out the same instance to every caller."""
+
+    def __init__(self, factories: dict[str, object] | None = None):
+        self.factories = dict(AGENT_FACTORIES if factories is None else factories)
+        self._instances: dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str):
+        """Return the wrapper (OptimistAgent, ...) for ``name``, constructing it on first use."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            if name not in self._instances:
+                if name not in self.factories:
+                    raise KeyError(f"Unknown agent: {name}")
+                instance = self._resolve(self.factories[name])()
+                instrument(instance.agent, kind="agent")
+                self._instances[name] = instance
+            return self._instances[name]
+
+    def agent(self, name: str) -> Agent:
+        return self.get(name).agent
+
+    def agents(self, names: Sequence[str] | None = None) -> list[Agent]:
+        return [self.agent(name) for name in (names or self.factories)]
+
+    def is_built(self, name: str) -> bool:
+        return name in self._instances
+
+    @staticmethod
+    def _resolve(factory):
+        if isinstance(factory, str):
+            module_name, attr = factory.split(":")
+            return getattr(importlib.import_module(module_name), attr)
+        return factory
+
+
+_registry: AgentRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_agent_registry() -> AgentRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AgentRegistry()
+    return _registry
+
+
+def set_agent_registry(registry: AgentRegistry):
+    global _registry
+    with _registry_lock:
+        _registry = registry
@@ -0,0 +1,78 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from agno.os.auth import get_authentication_dependency
+from agno.os.settings import AgnoAPISettings
+from fastapi import APIRouter, Depends, Form, Request
+from fastapi.responses import StreamingResponse
+
+from src.teams.judge.streaming import format_sse
+
+
+async def wait_for_disconnect(request: Request):
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def sse_until_disconnect(request: Request, events: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """Format debate events as SSE and stop them as soon as the client goes away.
+
+    Starlette only notices a disconnect on its next write, which can be a long time coming while members
+    are busy in tool calls; racing every read against ``http.disconnect`` cancels the debate straight away.
+    """
+    disconnect = asyncio.ensure_future(wait_for_disconnect(request))
+    next_event: asyncio.Future | None = None
+    try:
+        while True:
+            next_event = asyncio.ensure_future(events.__anext__())
+            await asyncio.wait({next_event, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+            if not next_event.done():
+                return
+            try:
+                payload = next_event.result()
+            except StopAsyncIteration:
+                return
+            yield format_sse(payload)
+    finally:
+        # Only synchronous cleanup here: when Starlette itself notices the disconnect this block runs inside a
+        # cancelled scope, where any await would be cancelled again before the debate was stopped
+        disconnect.cancel()
+        if next_event is not None and not next_event.done():
+            # The pending read owns the debate stream; cancelling it unwinds the stream, which cancels the members
+            next_event.cancel()
+        else:
+            asyncio.ensure_future(events.aclose())
+
+
+def get_debate_router(judge_team, settings: AgnoAPISettings | None = None) -> APIRouter:
+    """Debate endpoints, behind the same bearer-token check as AgentOS's own routes (``OS_SECURITY_KEY``)."""
+    router = APIRouter(
+        prefix="/debate",
+        tags=["Debate"],
+        dependencies=[Depends(get_authentication_dependency(settings or AgnoAPISettings()))],
+    )
+
+    @router.post("/stream")
+    async def stream_debate(
+        request: Request,
+        topic: str = Form(...),
+        routing: bool | None = Form(None, description="Use the routed (cheap members, early exit) path; defaults to the team's setting"),
+        max_buffered: int = Form(256, ge=1, le=4096),
+    ):
+        """Run one debate and stream it as server-sent events.
+
+        Member tokens (``MemberContent``) and tool calls (``ToolCallStarted``/``ToolCallCompleted``) from all
+        four members arrive interleaved as they are produced, followed by ``ReportsReady``, the judge's
+        tokens (``JudgeContent``) and a final ``DebateCompleted`` carrying the full assessment and metadata.
+        Disconnecting cancels the in-flight runs.
+        """
+        events = judge_team.astream(topic, routed=routing, max_buffered=max_buffered)
+        return StreamingResponse(
+            sse_until_disconnect(request, events),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return router
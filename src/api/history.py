@@ -0,0 +1,31 @@
+from agno.os.auth import get_authentication_dependency
+from agno.os.settings import AgnoAPISettings
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+
+def get_history_router(db, settings: AgnoAPISettings | None = None) -> APIRouter:
+    """Full run history of a session, including the runs evicted from the session row (see ``SessionDb``).
+
+    Guarded by the AgentOS security key like the rest of the API. The handlers are plain functions so FastAPI
+    runs their blocking SQLite reads on its threadpool instead of the event loop.
+    """
+    router = APIRouter(
+        prefix="/history",
+        tags=["History"],
+        dependencies=[Depends(get_authentication_dependency(settings or AgnoAPISettings()))],
+    )
+
+    @router.get("/{session_id}/runs")
+    def list_runs(session_id: str, limit: int = Query(20, ge=1, le=200), offset: int = Query(0, ge=0)):
+        """A page of the session's runs, newest first. AgentOS's own session endpoints only see the recent window."""
+        runs = db.get_runs(session_id, limit=limit, offset=offset)
+        return {"session_id": session_id, "runs": runs, "total": db.count_runs(session_id), "limit": limit, "offset": offset}
+
+    @router.get("/{session_id}/runs/{run_id}")
+    def get_run(session_id: str, run_id: str):
+        run = db.get_run(session_id, run_id)
+        if run is None:
+            raise HTTPException(status_code=404, detail=f"Run {run_id} not found in session {session_id}")
+        return run
+
+    return router
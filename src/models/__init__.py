@@ -0,0 +1,5 @@
+from .pooled_openai import PooledOpenAIChat
+
+__all__ = [
+    "PooledOpenAIChat",
+]
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from agno.models.openai import OpenAIChat
+from openai import AsyncOpenAI as AsyncOpenAIClient
+from openai import OpenAI as OpenAIClient
+
+from utils.shared.http import get_async_http_client, get_http_client
+
+
+@dataclass
+class PooledOpenAIChat(OpenAIChat):
+    """OpenAIChat on the process-wide pooled HTTP clients from ``utils.shared.http``.
+
+    The stock model opens a fresh connection pool for every async call and only accepts one kind of
+    ``http_client``; this one keeps connections alive across all agents and goes through the shared host
+    limits. Retries are left to the shared transport (which honours Retry-After), so the OpenAI client's own
+    retries are off by default to avoid multiplying them.
+    """
+
+    max_retries: int | None = 0
+
+    def get_client(self) -> OpenAIClient:
+        if self.http_client is not None:
+            return super().get_client()
+        return OpenAIClient(**self._get_client_params(), http_client=get_http_client())
+
+    def get_async_client(self) -> AsyncOpenAIClient:
+        if self.http_client is not None:
+            return super().get_async_client()
+        return AsyncOpenAIClient(**self._get_client_params(), http_client=get_async_http_client())
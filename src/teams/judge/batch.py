@@ -0,0 +1,342 @@
+import asyncio
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+from agno.utils.log import log_warning
+
+from utils.shared.research_cache import get_research_cache
+from utils.telemetry.spans import get_tracer
+
+# Greedy overlap ordering keeps an n x n similarity matrix in memory, so very large sweeps keep their input order
+MAX_REORDER = 5000
+
+
+@dataclass
+class BatchItem:
+    id: str
+    topic: str
+
+
+def topic_id(topic: str) -> str:
+    return hashlib.sha256(" ".join(topic.lower().split()).encode()).hexdigest()[:16]
+
+
+def _item(value: Any) -> BatchItem | None:
+    if isinstance(value, dict):
+        topic = value.get("topic") or value.get("question")
+        if not topic:
+            return None
+        return BatchItem(str(value.get("id") or topic_id(topic)), str(topic))
+    topic = str(value).strip()
+    return BatchItem(topic_id(topic), topic) if topic else None
+
+
+def load_topics(source: str | Iterable[Any]) -> list[BatchItem]:
+    """Topics from a list (strings or ``{"id", "topic"}`` dicts), or from a file path ("-" for stdin).
+
+    Files are read line by line: JSON objects, JSON strings or plain text. A line that only looks like JSON
+    (``"Quoted" question``, ``{Draft} topic``) is taken as plain text, with a warning naming the line. Topics
+    without an id get a stable hash of their text, so the same sweep resumes against the same ids; duplicates
+    are only run once.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        handle = sys.stdin if source == "-" else open(source, encoding="utf-8")
+        try:
+            values = []
+            for number, line in enumerate(handle, start=1):
+                line = line.strip()
+                if line and line[0] in "{\"":
+                    try:
+                        values.append(json.loads(line))
+                        continue
+                    except json.JSONDecodeError as e:
+                        log_warning(f"{getattr(handle, 'name', source)}:{number} is not valid JSON ({e.msg}); reading it as plain text")
+                if line:
+                    values.append(line)
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+    else:
+        values = list(source)
+
+    items: dict[str, BatchItem] = {}
+    for value in values:
+        item = _item(value)
+        if item is not None and item.id not in items:
+            items[item.id] = item
+    return list(items.values())
+
+
+def order_by_overlap(items: list[BatchItem], embedder=None) -> list[BatchItem]:
+    """Chain topics by nearest neighbour over their embeddings, so topics likely to run the same searches are
+    scheduled next to each other and share research results while they are in flight or still cached."""
+    if len(items) < 3 or len(items) > MAX_REORDER:
+        return list(items)
+    if embedder is None:
+        from utils.retrieval.embeddings import HashingEmbedder
+
+        embedder = HashingEmbedder()
+    vectors = embedder.embed([item.topic for item in items])
+    similarity = vectors @ vectors.T
+    visited = np.zeros(len(items), dtype=bool)
+    order = [0]
+    visited[0] = True
+    for _ in range(len(items) - 1):
+        candidates = np.where(visited, -np.inf, similarity[order[-1]])
+        nearest = int(candidates.argmax())
+        visited[nearest] = True
+        order.append(nearest)
+    return [items[i] for i in order]
+
+
+class JsonlResultWriter:
+    """One JSON line per finished topic, flushed as it is written. The file doubles as the checkpoint."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = None
+
+    def completed(self) -> dict[str, str]:
+        """{id: status} of the topics already in the file (the last line wins for re-run ids)."""
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "rb") as f:
+            data = f.read()
+        # A killed run can leave half a line behind; cut it so appended records start on a fresh line
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+        done = {}
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            done[record["id"]] = record.get("status")
+        return done
+
+    def reset(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def write(self, record: dict[str, Any]):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+
+class ParquetResultWriter:
+    """Results as a Parquet dataset: a directory of part files, readable with ``pyarrow.dataset``, pandas or
+    DuckDB. Rows are buffered and written ``rows_per_part`` at a time, so a killed run redoes at most one part."""
+
+    def __init__(self, path: str, rows_per_part: int = 100):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet output needs pyarrow (`pip install pyarrow`); use a .jsonl output instead") from e
+
+        self.path = path
+        self.rows_per_part = rows_per_part
+        self._pq = pq
+        self._schema = pa.schema([
+            ("id", pa.string()), ("topic", pa.string()), ("status", pa.string()), ("content", pa.string()),
+            ("error", pa.string()), ("route", pa.string()), ("elapsed", pa.float64()), ("tokens", pa.int64()),
+            ("members", pa.string()), ("finished_at", pa.string()),
+        ])
+        self._table = pa.Table
+        self._rows: list[dict[str, Any]] = []
+        os.makedirs(path, exist_ok=True)
+
+    def _parts(self) -> list[str]:
+        return sorted(glob.glob(os.path.join(self.path, "part-*.parquet")))
+
+    def completed(self) -> dict[str, str]:
+        done = {}
+        for part in self._parts():
+            table = self._pq.read_table(part, columns=["id", "status"])
+            done.update(zip(table.column("id").to_pylist(), table.column("status").to_pylist(), strict=True))
+        return done
+
+    def reset(self):
+        for part in self._parts():
+            os.remove(part)
+
+    def write(self, record: dict[str, Any]):
+        self._rows.append({**record, "members": json.dumps(record["members"])})
+        if len(self._rows) >= self.rows_per_part:
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+        part = os.path.join(self.path, f"part-{time.time_ns()}.parquet")
+        self._pq.write_table(self._table.from_pylist(self._rows, schema=self._schema), f"{part}.tmp")
+        # The rename is atomic, so a part file is either complete or absent
+        os.replace(f"{part}.tmp", part)
+        self._rows.clear()
+
+    def close(self):
+        self.flush()
+
+
+def open_result_writer(path: str, rows_per_part: int = 100):
+    if path.endswith(".parquet"):
+        return ParquetResultWriter(path, rows_per_part)
+    return JsonlResultWriter(path)
+
+
+def result_record(item: BatchItem, response: Any, elapsed: float, error: str | None = None) -> dict[str, Any]:
+    metadata = getattr(response, "metadata", None) or {}
+    status = getattr(response, "status", None)
+    status = getattr(status, "value", status)
+    if error is None and response is None:
+        error = "no response"
+    elif error is None and str(status).lower() == "error":
+        error = str(getattr(response, "content", None))
+    metrics = getattr(response, "metrics", None)
+    return {
+        "id": item.id,
+        "topic": item.topic,
+        "status": "error" if error is not None else "completed",
+        "content": None if error is not None else getattr(response, "content", None),
+        "error": error,
+        "route": metadata.get("routing", {}).get("path"),
+        "elapsed": round(elapsed, 3),
+        "tokens": getattr(metrics, "total_tokens", None),
+        "members": {r["name"]: r["status"] for r in metadata.get("member_reports", [])},
+        "finished_at": datetime.now(UTC).isoformat(),
+    }
+
+
+@dataclass
+class BatchSummary:
+    total: int
+    skipped: int
+    completed: int
+    failed: int
+    elapsed: float
+    concurrency: int
+    output: str | None
+    research_cache: dict[str, Any] = field(default_factory=dict)
+    # Only kept when there is no output file to write them to
+    results: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Topics per minute over the topics this run actually executed."""
+        return (self.completed + self.failed) / self.elapsed * 60 if self.elapsed else 0.0
+
+    def to_dict(self):
+        return {
+            "total": self.total,
+            "skipped": self.skipped,
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed": round(self.elapsed, 3),
+            "topics_per_minute": round(self.throughput, 2),
+            "concurrency": self.concurrency,
+            "output": self.output,
+            "research_cache": self.research_cache,
+        }
+
+
+async def run_batch(
+    team,
+    topics: str | Iterable[Any],
+    output: str | None = None,
+    concurrency: int = 4,
+    resume: bool = True,
+    retry_failed: bool = False,
+    reorder: bool = True,
+    topic_timeout: float | None = None,
+    rows_per_part: int = 100,
+    on_result: Callable[[dict[str, Any]], None] | None = None,
+) -> BatchSummary:
+    """Run many topics through a :class:`JudgeTeam` on a pool of ``concurrency`` workers.
+
+    Each result is written to ``output`` (``.jsonl``, or ``.parquet`` for a Parquet dataset) as soon as its
+    topic finishes. With ``resume`` the topics already in the output are skipped, so a killed sweep picks up
+    where it stopped; ``retry_failed`` also re-runs the ones that errored. Topics that overlap are scheduled
+    together (see :func:`order_by_overlap`) so their searches are shared through the research cache.
+    """
+    items = load_topics(topics)
+    writer = open_result_writer(output, rows_per_part) if output else None
+    done: dict[str, str] = {}
+    if writer is not None:
+        if resume:
+            done = writer.completed()
+        else:
+            writer.reset()
+    skip = {id for id, status in done.items() if status == "completed" or not retry_failed}
+    pending = [item for item in items if item.id not in skip]
+    if reorder:
+        pending = order_by_overlap(pending)
+
+    cache = get_research_cache()
+    cache_before = cache.stats()
+    summary = BatchSummary(len(items), len(items) - len(pending), 0, 0, 0.0, concurrency, output)
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in pending:
+        queue.put_nowait(item)
+
+    async def worker():
+        while not queue.empty():
+            item = queue.get_nowait()
+            started = time.monotonic()
+            deadline = asyncio.timeout(topic_timeout)
+            try:
+                async with deadline:
+                    response = await team.arun(item.topic)
+                record = result_record(item, response, time.monotonic() - started)
+            except TimeoutError as e:
+                # Only the topic's own deadline is reported as such; other timeouts (e.g. an HTTP read) come from the run
+                error = f"timed out after {topic_timeout:.0f}s" if deadline.expired() else f"{type(e).__name__}: {e}"
+                record = result_record(item, None, time.monotonic() - started, error)
+            except Exception as e:
+                record = result_record(item, None, time.monotonic() - started, f"{type(e).__name__}: {e}")
+            if record["status"] == "completed":
+                summary.completed += 1
+            else:
+                summary.failed += 1
+            if writer is not None:
+                writer.write(record)
+            else:
+                summary.results.append(record)
+            if on_result is not None:
+                on_result(record)
+
+    started_at = time.monotonic()
+    try:
+        with get_tracer().span(team.team.name, "team", mode="batch", topics=len(pending), concurrency=concurrency):
+            await asyncio.gather(*(worker() for _ in range(min(concurrency, len(pending)))))
+    finally:
+        # Also on cancellation (Ctrl-C), so every finished topic is on disk for the next resume
+        if writer is not None:
+            writer.close()
+        summary.elapsed = time.monotonic() - started_at
+        cache_after = cache.stats()
+        summary.research_cache = {
+            key: cache_after[key] - cache_before[key] for key in ("hits", "misses", "coalesced")
+        }
+    return summary
@@ -0,0 +1,180 @@
+import hashlib
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+
+from agno.utils.log import log_debug
+
+from src.teams.judge.fan_out import MemberReport
+from utils.telemetry.spans import get_tracer
+
+# Lines that are tool-call traces rather than analysis
+_TOOL_LINE = re.compile(
+    r"^\s*(running:|tool call|calling tool|\w+\(.*\)\s*completed in|"
+    r"-?\s*(google_search|read_article|get_top_hackernews_stories|get_user_details|"
+    r"duckduckgo_search|duckduckgo_news|search_knowledge_base|think|analyze)\()",
+    re.IGNORECASE,
+)
+_JSON_FENCE = re.compile(r"```(?:json)?\s*[\[{].*?```", re.DOTALL)
+_HEADING = re.compile(r"^\s*#{1,6}\s")
+_EVIDENCE = re.compile(r"\d|%|\bhttps?://|\[[^\]]+\]\(")
+_SHINGLE = 5
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Local token count (gpt-4o's o200k_base when tiktoken is installed, ~4 chars per token otherwise)."""
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def strip_tool_noise(text: str) -> str:
+    text = _JSON_FENCE.sub("", text)
+    lines = [line for line in text.splitlines() if not _TOOL_LINE.match(line)]
+    return "\n".join(lines)
+
+
+def _paragraphs(text: str) -> list[str]:
+    return [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+
+
+def _hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+def _shingles(paragraph: str) -> set[int]:
+    words = re.findall(r"\w+", paragraph.lower())
+    if len(words) < _SHINGLE:
+        return {_hash(" ".join(words))} if words else set()
+    return {_hash(" ".join(words[i:i + _SHINGLE])) for i in range(len(words) - _SHINGLE + 1)}
+
+
+def _priority(index: int, total: int, paragraph: str) -> float:
+    # Openings and conclusions carry a member's position; numbers and links carry its evidence
+    score = 0.0
+    if index == 0 or index == total - 1:
+        score += 3
+    if _EVIDENCE.search(paragraph):
+        score += 1
+    return score - index / max(total, 1)
+
+
+@dataclass
+class CompactionStats:
+    tokens_before: dict[str, int] = field(default_factory=dict)
+    tokens_after: dict[str, int] = field(default_factory=dict)
+    duplicates_dropped: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return sum(self.tokens_before.values()) - sum(self.tokens_after.values())
+
+    def to_dict(self):
+        return {
+            "tokens_before": sum(self.tokens_before.values()),
+            "tokens_after": sum(self.tokens_after.values()),
+            "tokens_saved": self.tokens_saved,
+            "duplicates_dropped": self.duplicates_dropped,
+            "per_member": {name: [self.tokens_before[name], self.tokens_after[name]] for name in self.tokens_before},
+        }
+
+
+def compact_reports(reports: Sequence[MemberReport], member_token_budget: int | None = 1500,
+                    dedupe_threshold: float = 0.6):
+    """Shrink member reports before they reach the judge.
+
+    Tool-call traces are dropped, paragraphs that mostly repeat evidence an earlier member already passed on
+    are removed, and each report is cut to ``member_token_budget`` tokens keeping its highest-priority
+    paragraphs in their original order. Only paragraphs that survive the budget count as passed on, so
+    evidence cut from one report is still kept where another member repeats it. Returns the compacted
+    reports and a CompactionStats.
+    """
+    stats = CompactionStats()
+    seen: set[int] = set()
+    compacted = []
+    for report in reports:
+        stats.tokens_before[report.name] = count_tokens(report.content)
+        if report.status in ("timed_out", "error"):
+            stats.tokens_after[report.name] = stats.tokens_before[report.name]
+            compacted.append(report)
+            continue
+
+        kept = []
+        # Repeats within this report are dropped too, against its own paragraphs before the budget cut
+        own: set[int] = set()
+        for paragraph in _paragraphs(strip_tool_noise(report.content)):
+            shingles = _shingles(paragraph)
+            repeated = (shingles & seen) | (shingles & own)
+            if not _HEADING.match(paragraph) and shingles and len(repeated) / len(shingles) >= dedupe_threshold:
+                stats.duplicates_dropped += 1
+                continue
+            own |= shingles
+            kept.append(paragraph)
+
+        if member_token_budget is not None:
+            kept = _fit_budget(kept, member_token_budget)
+        for paragraph in kept:
+            seen |= _shingles(paragraph)
+        content = "\n\n".join(kept)
+        stats.tokens_after[report.name] = count_tokens(content)
+        compacted.append(replace(report, content=content))
+
+    log_debug(f"Compacted member reports: {stats.to_dict()}")
+    return compacted, stats
+
+
+def record_compaction(stats: CompactionStats, mode: str):
+    """Add a compaction's savings to the telemetry counters (``kind=compaction`` on ``/telemetry/latency``)."""
+    metrics = get_tracer().metrics
+    metrics.increment("compaction", mode, "runs")
+    for counter, value in stats.to_dict().items():
+        if counter != "per_member":
+            metrics.increment("compaction", mode, counter, value)
+
+
+def compaction_hook(member_token_budget: int | None = 1500):
+    """Agent post-hook that compacts a member's output before a Team hands it to the team leader.
+
+    Team members run concurrently, so each output is compacted on its own: tool traces, repeats within the
+    report and the budget cut apply, but not the dedupe against the other members' reports.
+    """
+
+    def compact_member_output(run_output, agent):
+        if not isinstance(run_output.content, str) or not run_output.content.strip():
+            return
+        (report,), stats = compact_reports([MemberReport(agent.name, run_output.content, "completed", 0)], member_token_budget)
+        run_output.content = report.content
+        run_output.metadata = {**(run_output.metadata or {}), "compaction": stats.to_dict()}
+        record_compaction(stats, "team")
+
+    return compact_member_output
+
+
+def _fit_budget(paragraphs: list[str], budget: int) -> list[str]:
+    costs = [count_tokens(p) for p in paragraphs]
+    if sum(costs) <= budget:
+        return paragraphs
+    order = sorted(range(len(paragraphs)), key=lambda i: _priority(i, len(paragraphs), paragraphs[i]), reverse=True)
+    selected, used = set(), 0
+    for i in order:
+        if used + costs[i] <= budget:
+            selected.add(i)
+            used += costs[i]
+    if not selected and paragraphs:
+        # A single paragraph larger than the budget: keep its head
+        first = order[0]
+        words = paragraphs[first].split()
+        return [" ".join(words[: max(budget * 3 // 4, 1)]) + " ..."]
+    return [paragraphs[i] for i in sorted(selected)]
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from agno.agent import Agent
+from agno.run.agent import RunEvent, RunOutput
+from agno.utils.log import log_warning
+
+# Receives (member name, agno run event) for every event a member streams; awaited, so a slow consumer
+# slows the member down instead of letting events pile up
+EventCallback = Callable[[str, Any], Awaitable[None]]
+
+
+@dataclass
+class MemberReport:
+    name: str
+    content: str
+    # completed | partial | timed_out | error
+    status: str
+    elapsed: float
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def member_prompt(topic: str) -> str:
+    return f"Write a detailed report on the topic: {topic}"
+
+
+async def run_member(
+    agent: Agent,
+    topic: str,
+    semaphore: asyncio.Semaphore,
+    soft_deadline: float,
+    hard_deadline: float,
+    started_at: float | None = None,
+    prompt: str | None = None,
+    on_event: EventCallback | None = None,
+) -> MemberReport:
+    """Run one member and return whatever it produced before its hard deadline.
+
+    Deadlines are measured from ``started_at`` (the start of the fan-out) so that time spent waiting
+    on the semaphore counts against the member. Cancelling the caller cancels the member's run.
+    """
+    started_at = time.monotonic() if started_at is None else started_at
+    chunks: list[str] = []
+    final: list[str] = []
+
+    async def consume():
+        async with semaphore:
+            # The closing RunOutput carries the run's token usage, which telemetry records per member
+            stream = agent.arun(prompt or member_prompt(topic), stream=True, stream_events=on_event is not None, yield_run_response=True)
+            async for event in stream:
+                if isinstance(event, RunOutput):
+                    continue
+                if on_event is not None:
+                    await on_event(agent.name, event)
+                if event.event == RunEvent.run_content.value and isinstance(event.content, str):
+                    chunks.append(event.content)
+                elif event.event == RunEvent.run_completed.value and isinstance(event.content, str):
+                    final.append(event.content)
+
+    task = asyncio.ensure_future(consume())
+    try:
+        remaining = max(soft_deadline - (time.monotonic() - started_at), 0)
+        done, _ = await asyncio.wait({task}, timeout=remaining)
+        if not done:
+            log_warning(f"{agent.name} passed its soft deadline of {soft_deadline}s")
+            remaining = max(hard_deadline - (time.monotonic() - started_at), 0)
+            done, _ = await asyncio.wait({task}, timeout=remaining)
+    except asyncio.CancelledError:
+        # asyncio.wait does not cancel what it waits on; without this the member keeps generating tokens
+        task.cancel()
+        raise
+
+    elapsed = time.monotonic() - started_at
+    if not done:
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+        log_warning(f"{agent.name} missed its hard deadline of {hard_deadline}s")
+        if chunks:
+            return MemberReport(agent.name, "".join(chunks), "partial", elapsed)
+        return MemberReport(agent.name, f"[{agent.name} timed out after {hard_deadline:.0f}s without a report]", "timed_out", elapsed)
+
+    if task.exception() is not None:
+        log_warning(f"{agent.name} failed: {task.exception()}")
+        return MemberReport(agent.name, f"[{agent.name} failed: {task.exception()}]", "error", elapsed)
+
+    content = final[-1] if final else "".join(chunks)
+    return MemberReport(agent.name, content, "completed", elapsed)
+
+
+async def fan_out(
+    members: Sequence[Agent],
+    topic: str,
+    max_concurrency: int = 4,
+    soft_deadline: float = 60,
+    hard_deadline: float = 120,
+    deadlines: dict[str, tuple[float, float]] | None = None,
+    prompt: str | None = None,
+    on_event: EventCallback | None = None,
+) -> list[MemberReport]:
+    """Run all members concurrently; per-member (soft, hard) deadlines in ``deadlines`` override the defaults.
+
+    ``prompt`` replaces the default :func:`member_prompt` for every member; ``on_event`` sees every event
+    the members stream (content, tool calls, ...).
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    started_at = time.monotonic()
+    deadlines = deadlines or {}
+    return list(await asyncio.gather(*[
+        run_member(member, topic, semaphore, *deadlines.get(member.name, (soft_deadline, hard_deadline)), started_at=started_at, prompt=prompt, on_event=on_event)
+        for member in members
+    ]))
+
+
+def judge_prompt(topic: str, reports: Sequence[MemberReport]) -> str:
+    sections = []
+    for report in reports:
+        note = ""
+        if report.status == "partial":
+            note = " (partial - the member timed out before finishing)"
+        elif report.status in ("timed_out", "error"):
+            note = " (unavailable)"
+        sections.append(f"## {report.name}{note}\n\n{report.content}")
+    return (
+        "Based on the reports from all agents, provide a comprehensive and balanced final assessment "
+        f"on the topic: {topic}\n\n" + "\n\n".join(sections)
+    )
@@ -1,35 +1,113 @@
+import asyncio
+import copy
 import os
 import sys
+from collections.abc import Callable
 
-from agno.team import Team
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.tools.duckduckgo import DuckDuckGoTools
+from agno.team import Team
 from agno.tools.reasoning import ReasoningTools
 
 # Add the project root to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
 
+from src.agents.registry import AgentRegistry, get_agent_registry
+from src.models.pooled_openai import PooledOpenAIChat
 from src.prompts.agent_prompts import AgentPrompts
-from src.agents.forecaster.forecaster_agent import ForecasterAgent
-from src.agents.historian.historian_agent import HistorianAgent 
-from src.agents.optimist.optimist_agent import OptimistAgent
-from src.agents.pessimist.pessimist_agent import PessimistAgent
-
-
-class JudgeTeam():
-    def __init__(self):
-        optimist_agent = OptimistAgent()
-        pessimist_agent = PessimistAgent()
-        historian_agent = HistorianAgent()
-        forecaster_agent = ForecasterAgent()
+from src.teams.judge.batch import run_batch
+from src.teams.judge.compaction import compact_reports, compaction_hook, record_compaction
+from src.teams.judge.fan_out import EventCallback, MemberReport, fan_out, judge_prompt
+from src.teams.judge.routing import assess_agreement, fast_judge_prompt, routed_member_prompt
+from src.teams.judge.streaming import stream_debate
+from src.tools.research_tools import LazyDuckDuckGoTools
+from utils.shared.research_cache import research_cache_hook
+from utils.shared.response_cache import acached_run, cached_run
+from utils.telemetry.instrument import hook_toolkits, instrument, telemetry_tool_hook
+from utils.telemetry.spans import get_tracer
+
+MEMBER_NAMES = ["optimist", "pessimist", "historian", "forecaster"]
+TOOL_HOOKS = [telemetry_tool_hook, research_cache_hook]
+
+
+def member_copy(agent: Agent, **update) -> Agent:
+    """A separate Agent for ``agent`` (agno keeps run and team state on the instance) that shares its model client
+    and toolkits unless ``update`` replaces them. ``agent`` itself is left untouched."""
+    # deep_copy hands every set field back to Agent(): it would deep-copy the model and toolkits, and Agent()
+    # rejects the team_id a Team run leaves on its members. Copy from a detached view and pass the shared parts in
+    source = copy.copy(agent)
+    source.team_id = source.model = source.tools = None
+    update = {"model": agent.model, "tools": list(agent.tools or []), **update}
+    return instrument(source.deep_copy(update=update), kind="agent")
+
+
+def default_judge_tools() -> list:
+    return [ReasoningTools(add_instructions=True), LazyDuckDuckGoTools()]
+
+
+class JudgeTeam:
+    def __init__(
+        self,
+        registry: AgentRegistry | None = None,
+        fan_out: bool = False,
+        max_concurrency: int = 4,
+        soft_deadline: float = 60,
+        hard_deadline: float = 120,
+        member_deadlines: dict[str, tuple[float, float]] | None = None,
+        member_token_budget: int | None = 1500,
+        compact: bool = True,
+        tools: Callable[[], list] | None = None,
+        routing: bool = False,
+        member_model: str = "gpt-4o-mini",
+        agreement_threshold: float = 0.75,
+        db=None,
+    ):
+        # Members are built once by the shared registry. The team runs them through separate Agent objects that share
+        # the registry agents' model clients and toolkits: a Team run sets team_id on its members, which would stop
+        # the registry's agents (served standalone by AgentOS) saving sessions. The team stores its members' runs
+        # in its own session, so the copies carry no db.
+        self.registry = registry or get_agent_registry()
+        self.members = [member_copy(agent, db=None) for agent in self.registry.agents(MEMBER_NAMES)]
+
+        # Fan-out mode runs the members ourselves under deadlines and hands their reports to a standalone judge
+        self.fan_out = fan_out
+        # Members in flight per debate. Every member call also takes a slot of the process-wide per-host HTTP limit
+        # (POLYMIND_HTTP_HOST_CONCURRENCY, api.openai.com=64 by default), which bounds all debates together
+        self.max_concurrency = max_concurrency
+        self.soft_deadline = soft_deadline
+        self.hard_deadline = hard_deadline
+        self.member_deadlines = member_deadlines
+        # Member reports are compacted to this many tokens each before they reach the judge
+        self.member_token_budget = member_token_budget
+        self.compact = compact
+        self.judge: Agent | None = None
+        # Routing mode: members run on the cheaper member_model and, when they agree, a judge on the same model
+        # without the reasoning loop writes the verdict; gpt-4o with reasoning is kept for real disagreements
+        self.routing = routing
+        self.member_model = member_model
+        self.agreement_threshold = agreement_threshold
+        self.routed_members: list[Agent] | None = None
+        self.fast_judge: Agent | None = None
+        self.team: Team | None = None
+        # Builds the judge-level toolkits; reasoning plus DuckDuckGo by default, overridable so benchmarks can run
+        # offline. The team and the fan-out judge each build their own, since agno keeps per-agent state on them
+        self.tool_factory = tools or default_judge_tools
+
+        # The default path hands each member's output straight to the team leader, so the team runs its own copies
+        # that compact it in a post-hook. Fan-out and routing compact the collected reports in prepare_judge instead
+        team_members = self.members
+        if compact:
+            team_members = [member_copy(member, post_hooks=[compaction_hook(member_token_budget)]) for member in self.members]
+
         self.team = Team(
             name="Judge Team",
-            members=[optimist_agent.agent, pessimist_agent.agent, historian_agent.agent, forecaster_agent.agent],
-            model=OpenAIChat(id="gpt-4o"),
+            members=team_members,
+            model=PooledOpenAIChat(id="gpt-4o"),
             instructions=AgentPrompts.JUDGE_INSTRUCTIONS,
-            tools=[ReasoningTools(add_instructions=True), DuckDuckGoTools()],
+            tools=self.tools,
             reasoning=True,
+            # Sessions live in the db (bounded to a window of recent runs), never in the team instance
+            db=db,
+            cache_session=False,
             show_members_responses=True,
             share_member_interactions=True,
             delegate_task_to_all_members=True,
@@ -38,10 +116,158 @@ class JudgeTeam():
             store_member_responses=True,
             markdown=True
         )
-    
+        instrument(self.team, kind="team")
+
+    @property
+    def tool_factory(self) -> Callable[[], list]:
+        return self._tool_factory
+
+    @tool_factory.setter
+    def tool_factory(self, factory: Callable[[], list]):
+        self._tool_factory = factory
+        self.tools = self.build_tools()
+        if self.team is not None:
+            self.team.tools = self.tools
+            self.judge = None
+
+    def build_tools(self) -> list:
+        # Hooked per function, not via Team(tool_hooks=...), which would also wrap the async delegation tool
+        return hook_toolkits(self.tool_factory(), TOOL_HOOKS)
+
     def run(self, topic: str, stream: bool = False):
-        return self.team.run(f"Based on the reports from all agents, provide a comprehensive and balanced final assessment on the topic: {topic}", stream=stream)
-    
+        """Run a debate. With ``stream`` the team mode yields agno run events; fan-out and routing modes yield the
+        debate event dicts of :meth:`astream`."""
+        if (self.routing or self.fan_out) and stream:
+            return self._iter_stream(topic)
+        if self.routing:
+            return asyncio.run(self.arun_routed(topic))
+        if self.fan_out:
+            return asyncio.run(self.arun_fan_out(topic))
+        return cached_run(self.team, topic, lambda: self.team.run(self._team_prompt(topic), stream=stream), stream=stream)
+
+    def _iter_stream(self, topic: str):
+        # Drives astream on a private loop between yields, so a slow consumer pauses the debate like astream does.
+        # Closing the runner cancels whatever the debate still has in flight
+        events = self.astream(topic)
+
+        async def next_event():
+            return await anext(events, None)
+
+        with asyncio.Runner() as runner:
+            try:
+                while (event := runner.run(next_event())) is not None:
+                    yield event
+            finally:
+                runner.run(events.aclose())
+
+    async def arun(self, topic: str):
+        """Async counterpart of ``run`` (non-streaming), used by the batch runner."""
+        if self.routing:
+            return await self.arun_routed(topic)
+        if self.fan_out:
+            return await self.arun_fan_out(topic)
+        return await acached_run(self.team, topic, lambda: self.team.arun(self._team_prompt(topic)))
+
+    def run_batch(self, topics, output: str | None = None, concurrency: int = 4, **kwargs):
+        """Run many topics on a bounded worker pool with incremental output and resume; see ``batch.run_batch``."""
+        return asyncio.run(self.arun_batch(topics, output, concurrency, **kwargs))
+
+    async def arun_batch(self, topics, output: str | None = None, concurrency: int = 4, **kwargs):
+        return await run_batch(self, topics, output=output, concurrency=concurrency, **kwargs)
+
+    @staticmethod
+    def _team_prompt(topic: str) -> str:
+        return f"Based on the reports from all agents, provide a comprehensive and balanced final assessment on the topic: {topic}"
+
+    async def arun_fan_out(self, topic: str):
+        return await acached_run(self.get_judge(), topic, lambda: self._arun_fan_out(topic), variant="fan_out", members=self.members)
+
+    async def arun_routed(self, topic: str):
+        return await acached_run(self.get_judge(), topic, lambda: self._arun_routed(topic), variant="routing",
+                                 members=self.get_routed_members())
+
+    async def _arun_fan_out(self, topic: str):
+        with get_tracer().span(self.team.name, "team", mode="fan_out"):
+            return await self._debate(topic)
+
+    async def _arun_routed(self, topic: str):
+        with get_tracer().span(self.team.name, "team", mode="routing", member_model=self.member_model) as span:
+            response = await self._debate(topic, routed=True)
+            span.set(path=response.metadata["routing"]["path"])
+            return response
+
+    async def _debate(self, topic: str, routed: bool = False):
+        reports = await self.gather_reports(topic, routed)
+        judge, prompt, metadata = self.prepare_judge(topic, reports, routed)
+        response = await judge.arun(prompt)
+        response.metadata = {**(response.metadata or {}), **metadata}
+        return response
+
+    async def gather_reports(self, topic: str, routed: bool = False, on_event: EventCallback | None = None) -> list[MemberReport]:
+        return await fan_out(
+            self.get_routed_members() if routed else self.members,
+            topic,
+            max_concurrency=self.max_concurrency,
+            soft_deadline=self.soft_deadline,
+            hard_deadline=self.hard_deadline,
+            deadlines=self.member_deadlines,
+            prompt=routed_member_prompt(topic) if routed else None,
+            on_event=on_event,
+        )
+
+    def prepare_judge(self, topic: str, reports: list[MemberReport], routed: bool = False) -> tuple[Agent, str, dict]:
+        """Pick the judge and build its prompt from the member reports; returns (judge, prompt, metadata)."""
+        metadata = {"member_reports": [r.to_dict() for r in reports]}
+        # Agreement is judged on the raw reports, before compaction can trim the verdict lines
+        agreement = assess_agreement(reports, self.agreement_threshold) if routed else None
+        if self.compact:
+            reports, compaction = compact_reports(reports, self.member_token_budget)
+            metadata["compaction"] = compaction.to_dict()
+            record_compaction(compaction, "routing" if routed else "fan_out")
+        if agreement is not None:
+            metadata["routing"] = {"path": "fast" if agreement.consensus else "full", **agreement.to_dict()}
+        if agreement is not None and agreement.consensus:
+            return self.get_fast_judge(), fast_judge_prompt(topic, reports, agreement), metadata
+        return self.get_judge(), judge_prompt(topic, reports), metadata
+
+    def astream(self, topic: str, routed: bool | None = None, max_buffered: int = 256):
+        """Stream the debate as event dicts (member tokens, tool calls, judge tokens); see ``streaming.stream_debate``."""
+        return stream_debate(self, topic, self.routing if routed is None else routed, max_buffered)
+
+    def get_routed_members(self) -> list[Agent]:
+        """Copies of the members on ``member_model`` (built on first routed run); the team's own members stay on
+        their model."""
+        if self.routed_members is None:
+            self.routed_members = [
+                member_copy(member, model=PooledOpenAIChat(id=self.member_model, temperature=getattr(member.model, "temperature", None)))
+                for member in self.members
+            ]
+        return self.routed_members
+
+    def get_fast_judge(self) -> Agent:
+        if self.fast_judge is None:
+            self.fast_judge = Agent(
+                name="Fast Judge",
+                model=PooledOpenAIChat(id=self.member_model),
+                instructions=AgentPrompts.JUDGE_INSTRUCTIONS,
+                markdown=True,
+            )
+            instrument(self.fast_judge, kind="judge")
+        return self.fast_judge
+
+    def get_judge(self) -> Agent:
+        if self.judge is None:
+            self.judge = Agent(
+                name="Judge",
+                model=PooledOpenAIChat(id="gpt-4o"),
+                instructions=AgentPrompts.JUDGE_INSTRUCTIONS,
+                tools=self.build_tools(),
+                reasoning=True,
+                markdown=True,
+            )
+            instrument(self.judge, kind="judge")
+        return self.judge
+
 if __name__ == "__main__":
     judge_team = JudgeTeam()
     try:
@@ -49,8 +275,8 @@ if __name__ == "__main__":
         # if response is not None:
         #     # Access the content attribute from the RunOutput object
         #     print(getattr(response, 'content', str(response)))
-        
+
         judge_team.team.print_response("Will companies be open to using AI to prevent accidents in construction sites?", stream=True)
 
     except Exception as e:
-        print(f"Error occurred in JudgeTeam: {e}")
\ No newline at end of file
+        print(f"Error occurred in JudgeTeam: {e}")
@@ -0,0 +1,104 @@
+import re
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+from src.teams.judge.fan_out import MemberReport, judge_prompt, member_prompt
+
+VERDICTS = ("positive", "negative", "mixed")
+
+_VERDICT_RE = re.compile(r"verdict\W{0,3}\s*(positive|negative|mixed)\b", re.IGNORECASE)
+
+
+def routed_member_prompt(topic: str) -> str:
+    """The member prompt plus a machine-readable verdict line, which is what the agreement check keys on."""
+    return (
+        f"{member_prompt(topic)}\n\n"
+        "Finish your report with a single line of the form `Verdict: positive`, `Verdict: negative` or "
+        "`Verdict: mixed`, giving your overall conclusion on the topic."
+    )
+
+
+def extract_verdict(text: str) -> str | None:
+    """The last verdict stated in a report, if any."""
+    matches = _VERDICT_RE.findall(text or "")
+    return matches[-1].lower() if matches else None
+
+
+def conclusion(text: str, max_chars: int = 1500) -> str:
+    """The closing part of a report (where the personas state their conclusions), minus the verdict line."""
+    text = _VERDICT_RE.sub("", text or "").strip()
+    paragraphs = [p for p in re.split(r"\n\s*\n", text) if p.strip()]
+    closing: list[str] = []
+    for paragraph in reversed(paragraphs):
+        if closing and sum(map(len, closing)) + len(paragraph) > max_chars:
+            break
+        closing.insert(0, paragraph)
+    return "\n\n".join(closing)[-max_chars:]
+
+
+@dataclass
+class Agreement:
+    # Share of members behind the majority verdict, or the conclusion similarity when verdicts are missing
+    score: float
+    consensus: bool
+    majority: str | None
+    similarity: float | None
+    verdicts: dict[str, str | None] = field(default_factory=dict)
+    reason: str = ""
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def conclusion_similarity(reports: Sequence[MemberReport], embedder=None) -> float | None:
+    """Mean pairwise cosine similarity between the members' conclusions (embeddings are unit-normalised)."""
+    if len(reports) < 2:
+        return None
+    if embedder is None:
+        from utils.retrieval.embeddings import HashingEmbedder
+
+        embedder = HashingEmbedder()
+    vectors = embedder.embed([conclusion(r.content) for r in reports])
+    upper = np.triu_indices(len(reports), k=1)
+    return float((vectors @ vectors.T)[upper].mean())
+
+
+def assess_agreement(
+    reports: Sequence[MemberReport],
+    threshold: float = 0.75,
+    similarity_threshold: float = 0.8,
+    embedder=None,
+) -> Agreement:
+    """Cheap consensus check over member reports, run before the judge so it can pick the fast or full path.
+
+    Verdict lines decide when every member gave one; otherwise the lexical similarity of their conclusions
+    has to clear ``similarity_threshold``. A member that failed, timed out or was cut off at its deadline
+    (``partial``) always forces the full path: a truncated report may be missing its conclusion and verdict.
+    """
+    verdicts = {r.name: extract_verdict(r.content) for r in reports}
+    usable = [r for r in reports if r.status == "completed"]
+    if len(usable) < len(reports) or len(usable) < 2:
+        return Agreement(0.0, False, None, None, verdicts, "missing_reports")
+
+    similarity = conclusion_similarity(usable, embedder)
+    stated = [verdicts[r.name] for r in usable if verdicts[r.name]]
+    if len(stated) == len(usable):
+        majority = max(VERDICTS, key=stated.count)
+        score = stated.count(majority) / len(stated)
+        # A "mixed" majority means the question itself is contested, which is what the full judge is for
+        consensus = score >= threshold and majority != "mixed"
+        return Agreement(score, consensus, majority, similarity, verdicts, "verdicts")
+
+    consensus = similarity is not None and similarity >= similarity_threshold
+    return Agreement(similarity or 0.0, consensus, None, similarity, verdicts, "similarity")
+
+
+def fast_judge_prompt(topic: str, reports: Sequence[MemberReport], agreement: Agreement) -> str:
+    note = f" on an overall verdict of '{agreement.majority}'" if agreement.majority else ""
+    return (
+        f"{judge_prompt(topic, reports)}\n\n"
+        f"The members largely agree{note}. Synthesize their reports into a concise final assessment, noting "
+        "any caveats they raise, without re-deriving the shared conclusion."
+    )
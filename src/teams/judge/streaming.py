@@ -0,0 +1,87 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from agno.run.agent import RunEvent
+
+from utils.telemetry.spans import get_tracer
+
+_DONE = object()
+
+
+def event_payload(role: str, source: str, event: Any) -> dict[str, Any] | None:
+    """Map an agno run event from a member or the judge onto the debate stream; None drops it."""
+    name = getattr(event, "event", None)
+    if name == RunEvent.run_content.value and isinstance(event.content, str) and event.content:
+        return {"event": "MemberContent" if role == "member" else "JudgeContent", "source": source, "content": event.content}
+    if name in (RunEvent.tool_call_started.value, RunEvent.tool_call_completed.value) and event.tool is not None:
+        payload = {"event": name, "role": role, "source": source, "tool": event.tool.tool_name}
+        if name == RunEvent.tool_call_started.value:
+            payload["args"] = event.tool.tool_args
+        else:
+            payload["error"] = bool(event.tool.tool_call_error)
+        return payload
+    if name == RunEvent.reasoning_step.value:
+        return {"event": "JudgeReasoningStep", "source": source, "content": getattr(event, "reasoning_content", None)}
+    if name == RunEvent.run_completed.value and role == "member":
+        return {"event": "MemberCompleted", "source": source}
+    if name == RunEvent.run_error.value:
+        return {"event": "RunError", "role": role, "source": source, "error": event.content}
+    return None
+
+
+async def stream_debate(team, topic: str, routed: bool = False, max_buffered: int = 256) -> AsyncIterator[dict[str, Any]]:
+    """Run a fan-out debate and yield its events as they happen: member tokens and tool calls interleaved,
+    then the judge's tokens, then a final ``DebateCompleted`` with the full verdict and metadata.
+
+    Events pass through a queue of ``max_buffered`` items. When the consumer falls behind, the members
+    block on it instead of buffering without bound. When the consumer stops (the client disconnected and
+    the generator was closed), the debate task is cancelled. That cancels the in-flight member and judge
+    runs and their model streams, so abandoned debates stop spending tokens.
+    """
+    queue: asyncio.Queue = asyncio.Queue(max_buffered)
+
+    async def emit(role: str, source: str, event: Any):
+        payload = event_payload(role, source, event)
+        if payload is not None:
+            await queue.put(payload)
+
+    async def debate():
+        try:
+            with get_tracer().span(team.team.name, "team", mode="stream", routed=routed):
+                members = team.get_routed_members() if routed else team.members
+                await queue.put({"event": "DebateStarted", "topic": topic, "routed": routed, "members": [m.name for m in members]})
+                reports = await team.gather_reports(topic, routed, on_event=lambda source, event: emit("member", source, event))
+                await queue.put({
+                    "event": "ReportsReady",
+                    "reports": [{"source": r.name, "status": r.status, "elapsed": r.elapsed} for r in reports],
+                })
+
+                judge, prompt, metadata = team.prepare_judge(topic, reports, routed)
+                await queue.put({"event": "JudgeStarted", "source": judge.name, "path": metadata.get("routing", {}).get("path")})
+                content = []
+                async for event in judge.arun(prompt, stream=True, stream_events=True):
+                    if getattr(event, "event", None) == RunEvent.run_content.value and isinstance(event.content, str):
+                        content.append(event.content)
+                    await emit("judge", judge.name, event)
+                await queue.put({"event": "DebateCompleted", "content": "".join(content), "metadata": metadata})
+        except Exception as e:
+            await queue.put({"event": "DebateError", "error": str(e)})
+        # Only the consumer cancels this task, and then nobody is left to read the end marker
+        await queue.put(_DONE)
+
+    task = asyncio.ensure_future(debate())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        # Synchronous on purpose: this also runs inside a cancelled scope when the client disconnects
+        task.cancel()
+
+
+def format_sse(payload: dict[str, Any]) -> str:
+    return f"event: {payload['event']}\ndata: {json.dumps(payload, default=str)}\n\n"
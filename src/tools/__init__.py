@@ -0,0 +1,19 @@
+from .knowledge_tools import KnowledgeTools
+from .research_tools import (
+    LazyDuckDuckGoTools,
+    LazyGoogleSearchTools,
+    LazyHackerNewsTools,
+    LazyNewspaper4kTools,
+    LazyToolkit,
+    research_tools,
+)
+
+__all__ = [
+    "KnowledgeTools",
+    "LazyDuckDuckGoTools",
+    "LazyGoogleSearchTools",
+    "LazyHackerNewsTools",
+    "LazyNewspaper4kTools",
+    "LazyToolkit",
+    "research_tools",
+]
@@ -0,0 +1,51 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from agno.utils.log import log_debug, logger
+
+from utils.shared.http import get_http_client
+
+HN_API = "https://hacker-news.firebaseio.com/v0"
+
+
+class HackerNewsClient:
+    """Same functions and output as agno's HackerNewsTools, over the shared pooled client.
+
+    agno's version calls ``httpx.get`` per story, which opens a new connection (and TLS handshake) for each
+    of the N+1 requests and fetches the stories one after another.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+
+    def _get(self, path: str):
+        response = get_http_client().get(f"{HN_API}/{path}")
+        response.raise_for_status()
+        return response.json()
+
+    def _story(self, story_id: int):
+        story = self._get(f"item/{story_id}.json")
+        story["username"] = story["by"]
+        return story
+
+    def get_top_hackernews_stories(self, num_stories: int = 10) -> str:
+        log_debug(f"Getting top {num_stories} stories from Hacker News")
+        story_ids = self._get("topstories.json")[:num_stories]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(story_ids)))) as pool:
+            stories = list(pool.map(self._story, story_ids))
+        return json.dumps(stories)
+
+    def get_user_details(self, username: str) -> str:
+        try:
+            log_debug(f"Getting details for user: {username}")
+            user = self._get(f"user/{username}.json")
+            user_details = {
+                "id": user.get("user_id"),
+                "karma": user.get("karma"),
+                "about": user.get("about"),
+                "total_items_submitted": len(user.get("submitted", [])),
+            }
+            return json.dumps(user_details)
+        except Exception as e:
+            logger.exception(e)
+            return f"Error getting user details: {e}"
@@ -0,0 +1,37 @@
+import json
+from typing import Any
+
+from agno.tools import Toolkit
+
+
+class KnowledgeTools(Toolkit):
+    """Search the local LanceDB knowledge base built by the ingestion pipeline.
+
+    The store (and lancedb/pyarrow) is only loaded on the first search so it stays off the cold-start path.
+    """
+
+    def __init__(self, path: str | None = None, table_name: str = "knowledge", **kwargs: Any):
+        self.path = path
+        self.table_name = table_name
+        super().__init__(name="knowledge_tools", tools=[self.search_knowledge_base], **kwargs)
+
+    def search_knowledge_base(self, query: str, num_results: int = 5) -> str:
+        """Use this function to search the local knowledge base for background context before going to the web.
+
+        Args:
+            query (str): The query to search for.
+            num_results (int, optional): The number of passages to return. Default is 5.
+
+        Returns:
+            str: A JSON formatted list of passages with their source, or a message if nothing is indexed.
+        """
+        from utils.retrieval.store import get_knowledge_store
+
+        store = get_knowledge_store(self.path, self.table_name)
+        if not store.exists():
+            return "The local knowledge base is empty."
+        results = store.search(query, k=num_results)
+        return json.dumps([
+            {"source": r["source"], "chunk": r["chunk"], "text": r["text"], "distance": round(r["_distance"], 4)}
+            for r in results
+        ], indent=2)
@@ -0,0 +1,139 @@
+import importlib
+import threading
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlparse
+
+from agno.tools import Toolkit
+
+from src.tools.knowledge_tools import KnowledgeTools
+from utils.shared.http import get_host_policy
+
+
+class LazyToolkit(Toolkit):
+    """Toolkit that exposes the same functions as an agno toolkit but only imports and builds it on first call.
+
+    newspaper4k, googlesearch and ddgs pull in lxml, requests, bs4 and friends at import time, which dominated
+    the cold start of ``agentos:app`` even though most workers never call most tools.
+    """
+
+    def __init__(self, name: str, import_path: str, tools: list[Callable], **toolkit_kwargs: Any):
+        self._import_path = import_path
+        self._toolkit_kwargs: dict[str, Any] = toolkit_kwargs
+        self._toolkit = None
+        self._toolkit_lock = threading.Lock()
+        super().__init__(name=name, tools=tools)
+
+    def get_toolkit(self):
+        if self._toolkit is None:
+            with self._toolkit_lock:
+                if self._toolkit is None:
+                    module_name, attr = self._import_path.split(":")
+                    self._toolkit = getattr(importlib.import_module(module_name), attr)(**self._toolkit_kwargs)
+        return self._toolkit
+
+    @property
+    def loaded(self) -> bool:
+        return self._toolkit is not None
+
+
+class LazyHackerNewsTools(LazyToolkit):
+    def __init__(self, **kwargs: Any):
+        tools = [self.get_top_hackernews_stories, self.get_user_details]
+        super().__init__("hackers_news", "src.tools.hackernews:HackerNewsClient", tools, **kwargs)
+
+    def get_top_hackernews_stories(self, num_stories: int = 10) -> str:
+        """Use this function to get top stories from Hacker News.
+
+        Args:
+            num_stories (int): Number of stories to return. Defaults to 10.
+
+        Returns:
+            str: JSON string of top stories.
+        """
+        return self.get_toolkit().get_top_hackernews_stories(num_stories=num_stories)
+
+    def get_user_details(self, username: str) -> str:
+        """Use this function to get the details of a Hacker News user using their username.
+
+        Args:
+            username (str): Username of the user to get details for.
+
+        Returns:
+            str: JSON string of the user details.
+        """
+        return self.get_toolkit().get_user_details(username=username)
+
+
+class LazyNewspaper4kTools(LazyToolkit):
+    def __init__(self, **kwargs: Any):
+        super().__init__("newspaper4k_tools", "agno.tools.newspaper4k:Newspaper4kTools", [self.read_article], **kwargs)
+
+    def read_article(self, url: str) -> str:
+        """Use this function to read an article from a URL.
+
+        Args:
+            url (str): The URL of the article.
+
+        Returns:
+            str: JSON containing the article author, publish date, and text.
+        """
+        with get_host_policy().limit(urlparse(url).hostname or url):
+            return self.get_toolkit().read_article(url=url)
+
+
+class LazyGoogleSearchTools(LazyToolkit):
+    def __init__(self, **kwargs: Any):
+        super().__init__("google_search_tools", "agno.tools.googlesearch:GoogleSearchTools", [self.google_search], **kwargs)
+
+    def google_search(self, query: str, max_results: int = 5, language: str = "en") -> str:
+        """
+        Use this function to search Google for a specified query.
+
+        Args:
+            query (str): The query to search for.
+            max_results (int, optional): The maximum number of results to return. Default is 5.
+            language (str, optional): The language of the search results. Default is "en".
+
+        Returns:
+            str: A JSON formatted string containing the search results.
+        """
+        with get_host_policy().limit("www.google.com"):
+            return self.get_toolkit().google_search(query=query, max_results=max_results, language=language)
+
+
+class LazyDuckDuckGoTools(LazyToolkit):
+    def __init__(self, **kwargs: Any):
+        tools = [self.duckduckgo_search, self.duckduckgo_news]
+        super().__init__("duckduckgo", "agno.tools.duckduckgo:DuckDuckGoTools", tools, **kwargs)
+
+    def duckduckgo_search(self, query: str, max_results: int = 5) -> str:
+        """Use this function to search DDGS for a query.
+
+        Args:
+            query(str): The query to search for.
+            max_results (optional, default=5): The maximum number of results to return.
+
+        Returns:
+            The result from DDGS.
+        """
+        with get_host_policy().limit("duckduckgo.com"):
+            return self.get_toolkit().duckduckgo_search(query=query, max_results=max_results)
+
+    def duckduckgo_news(self, query: str, max_results: int = 5) -> str:
+        """Use this function to get the latest news from DDGS.
+
+        Args:
+            query(str): The query to search for.
+            max_results (optional, default=5): The maximum number of results to return.
+
+        Returns:
+            The latest news from DDGS.
+        """
+        with get_host_policy().limit("duckduckgo.com"):
+            return self.get_toolkit().duckduckgo_news(query=query, max_results=max_results)
+
+
+def research_tools() -> list[Toolkit]:
+    """The research toolkits shared by the four perspective agents: the local knowledge base plus the web."""
+    return [KnowledgeTools(), LazyHackerNewsTools(), LazyNewspaper4kTools(), LazyGoogleSearchTools()]
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def mock_openai():
+    """A local mock of the OpenAI chat endpoint (see scripts/loadtest/mock_openai.py), fast enough for tests."""
+    from scripts.loadtest.mock_openai import MockOpenAIServer
+
+    server = MockOpenAIServer(latency=0.01, tokens_per_second=5000, completion_tokens=20, jitter=0).start()
+    saved = {key: os.environ.get(key) for key in ("OPENAI_BASE_URL", "OPENAI_API_KEY")}
+    os.environ.update(OPENAI_BASE_URL=server.base_url, OPENAI_API_KEY="mock")
+    yield server
+    server.stop()
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+@pytest.fixture
+def session_db(tmp_path):
+    from utils.shared.session_db import SessionDb
+
+    db = SessionDb(db_file=str(tmp_path / "sessions.db"), flush_interval=60)
+    yield db
+    db.close()
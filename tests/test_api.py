@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from agno.os.settings import AgnoAPISettings
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.debate import get_debate_router
+from src.api.history import get_history_router
+
+
+class FakeDebate:
+    def astream(self, topic, routed=None, max_buffered=256):
+        async def events():
+            yield {"event": "DebateStarted", "topic": topic}
+            yield {"event": "DebateCompleted", "content": "verdict"}
+
+        return events()
+
+
+@pytest.fixture
+def debate_client():
+    app = FastAPI()
+    app.include_router(get_debate_router(FakeDebate(), AgnoAPISettings(os_security_key="secret")))
+    return TestClient(app)
+
+
+def test_debate_requires_the_security_key(debate_client):
+    assert debate_client.post("/debate/stream", data={"topic": "t"}).status_code == 401
+    response = debate_client.post("/debate/stream", data={"topic": "t"}, headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == 401
+
+
+def test_debate_streams_with_the_security_key(debate_client):
+    response = debate_client.post("/debate/stream", data={"topic": "t"}, headers={"Authorization": "Bearer secret"})
+    assert response.status_code == 200
+    assert "event: DebateStarted" in response.text
+    assert "event: DebateCompleted" in response.text
+
+
+class FakeHistory:
+    """Records whether each read ran on the event loop, where blocking SQLite calls would stall every request."""
+
+    def __init__(self):
+        self.on_loop = []
+        self.runs = [{"run_id": "r2"}, {"run_id": "r1"}]
+
+    def _called(self):
+        try:
+            asyncio.get_running_loop()
+            self.on_loop.append(True)
+        except RuntimeError:
+            self.on_loop.append(False)
+
+    def get_runs(self, session_id, limit=20, offset=0):
+        self._called()
+        return self.runs[offset:offset + limit]
+
+    def count_runs(self, session_id):
+        self._called()
+        return len(self.runs)
+
+    def get_run(self, session_id, run_id):
+        self._called()
+        return next((run for run in self.runs if run["run_id"] == run_id), None)
+
+
+@pytest.fixture
+def history():
+    return FakeHistory()
+
+
+@pytest.fixture
+def history_client(history):
+    app = FastAPI()
+    app.include_router(get_history_router(history, AgnoAPISettings(os_security_key="secret")))
+    return TestClient(app, headers={"Authorization": "Bearer secret"})
+
+
+def test_history_requires_the_security_key(history_client):
+    history_client.headers.pop("Authorization")
+    assert history_client.get("/history/s1/runs").status_code == 401
+    assert history_client.get("/history/s1/runs/r1").status_code == 401
+
+
+def test_history_pages_and_fetches_runs_off_the_event_loop(history_client, history):
+    page = history_client.get("/history/s1/runs", params={"limit": 1}).json()
+    assert page["runs"] == [{"run_id": "r2"}] and page["total"] == 2
+    assert history_client.get("/history/s1/runs/r1").json() == {"run_id": "r1"}
+    assert history_client.get("/history/s1/runs/missing").status_code == 404
+    assert history.on_loop and not any(history.on_loop)
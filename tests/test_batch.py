@@ -0,0 +1,108 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.teams.judge.batch import load_topics, result_record, run_batch, topic_id
+
+
+class FakeTeam:
+    """Stands in for JudgeTeam: ``outcomes`` maps a topic to a response, an exception, or a delay in seconds."""
+
+    def __init__(self, outcomes=None):
+        self.team = SimpleNamespace(name="Judge Team")
+        self.outcomes = outcomes or {}
+        self.calls = []
+
+    async def arun(self, topic):
+        self.calls.append(topic)
+        outcome = self.outcomes.get(topic, "done")
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if isinstance(outcome, (int, float)):
+            await asyncio.sleep(outcome)
+            outcome = "done"
+        if outcome is None:
+            return None
+        return SimpleNamespace(content=f"{outcome}: {topic}", status="COMPLETED", metadata={}, metrics=None)
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_topics_get_stable_ids_and_duplicates_run_once():
+    items = load_topics(["Solar outlook", " solar   OUTLOOK", {"id": "q2", "topic": "Wind outlook"}])
+    assert [item.id for item in items] == [topic_id("Solar outlook"), "q2"]
+
+
+def test_topic_files_mix_json_and_plain_text(tmp_path):
+    path = tmp_path / "topics.jsonl"
+    path.write_text(
+        '{"id": "q1", "topic": "Solar outlook"}\n'
+        '"Wind outlook"\n'
+        '\n'
+        '"Is nuclear safe?" asked the panel\n'
+        '{Draft} grid storage costs\n'
+        'Fusion timeline\n'
+    )
+    assert [item.topic for item in load_topics(str(path))] == [
+        "Solar outlook", "Wind outlook", '"Is nuclear safe?" asked the panel', "{Draft} grid storage costs", "Fusion timeline",
+    ]
+
+
+async def test_results_are_written_and_a_rerun_resumes(tmp_path):
+    output = tmp_path / "results.jsonl"
+    team = FakeTeam({"b": RuntimeError("boom")})
+    summary = await run_batch(team, ["a", "b", "c"], output=str(output), reorder=False)
+    assert (summary.completed, summary.failed) == (2, 1)
+    assert {r["topic"]: r["status"] for r in _records(output)} == {"a": "completed", "b": "error", "c": "completed"}
+
+    rerun = FakeTeam()
+    summary = await run_batch(rerun, ["a", "b", "c", "d"], output=str(output), reorder=False)
+    assert rerun.calls == ["d"]
+    assert summary.skipped == 3
+
+    retry = FakeTeam()
+    await run_batch(retry, ["a", "b", "c", "d"], output=str(output), reorder=False, retry_failed=True)
+    assert retry.calls == ["b"]
+
+
+async def test_resume_discards_a_half_written_last_line(tmp_path):
+    output = tmp_path / "results.jsonl"
+    await run_batch(FakeTeam(), ["a"], output=str(output), reorder=False)
+    with open(output, "a") as f:
+        f.write('{"id": "trunc')
+    team = FakeTeam()
+    await run_batch(team, ["a", "b"], output=str(output), reorder=False)
+    assert team.calls == ["b"]
+    assert [r["topic"] for r in _records(output)] == ["a", "b"]
+
+
+async def test_topic_timeout_fails_only_that_topic():
+    summary = await run_batch(FakeTeam({"slow": 5}), ["slow", "fast"], reorder=False, topic_timeout=0.05)
+    records = {r["topic"]: r for r in summary.results}
+    assert records["slow"]["status"] == "error"
+    assert records["slow"]["error"] == "timed out after 0s"
+    assert records["fast"]["status"] == "completed"
+
+
+async def test_inner_timeout_without_a_topic_timeout_fails_only_that_topic():
+    team = FakeTeam({"a": TimeoutError("member deadline")})
+    summary = await run_batch(team, ["a", "b"], reorder=False, topic_timeout=None)
+    records = {r["topic"]: r for r in summary.results}
+    assert records["a"]["status"] == "error"
+    assert records["a"]["error"] == "TimeoutError: member deadline"
+    assert records["b"]["status"] == "completed"
+
+
+async def test_missing_response_is_recorded_as_an_error():
+    summary = await run_batch(FakeTeam({"a": None}), ["a"], reorder=False)
+    assert summary.results[0]["status"] == "error"
+    assert summary.failed == 1
+
+
+def test_error_status_response_is_recorded_as_an_error():
+    item = load_topics(["a"])[0]
+    response = SimpleNamespace(content="rate limited", status="ERROR", metadata=None, metrics=None)
+    record = result_record(item, response, 1.0)
+    assert (record["status"], record["error"], record["content"]) == ("error", "rate limited", None)
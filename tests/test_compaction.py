@@ -0,0 +1,99 @@
+from src.teams.judge.compaction import compact_reports, count_tokens, strip_tool_noise
+from src.teams.judge.fan_out import MemberReport
+
+OPENING = "Solar capacity keeps growing and the outlook for the sector is broadly positive overall."
+CLOSING = "On balance the transition looks likely to continue at a steady pace through the decade."
+SHARED = "Global installations reached 447 gigawatts in 2023 according to the international energy agency report."
+
+
+def _filler(n):
+    return f"Supporting point {n} notes that 2{n} regional markets saw storage costs fall by {n}0 percent last year."
+
+
+def _report(name, *paragraphs, status="completed"):
+    return MemberReport(name, "\n\n".join(paragraphs), status, 1.0)
+
+
+def test_tool_traces_are_stripped():
+    text = "Running: google_search(query='solar')\nThe analysis itself.\n```json\n{\"results\": []}\n```"
+    assert strip_tool_noise(text).strip() == "The analysis itself."
+
+
+def test_repeated_evidence_is_dropped_from_later_reports():
+    reports = [
+        _report("Optimist", OPENING, SHARED, CLOSING),
+        _report("Pessimist", "Costs remain a concern for grid operators in most regions.", SHARED),
+    ]
+    compacted, stats = compact_reports(reports, member_token_budget=None)
+    assert SHARED in compacted[0].content
+    assert SHARED not in compacted[1].content
+    assert stats.duplicates_dropped == 1
+
+
+def test_reports_are_cut_to_the_budget_keeping_opening_and_conclusion():
+    paragraphs = [OPENING, *(_filler(i) for i in range(1, 8)), CLOSING]
+    budget = count_tokens(OPENING) + count_tokens(CLOSING) + count_tokens(_filler(1)) + 2
+    compacted, stats = compact_reports([_report("Optimist", *paragraphs)], member_token_budget=budget)
+    content = compacted[0].content
+    assert content.startswith(OPENING) and content.endswith(CLOSING)
+    assert count_tokens(content) <= budget + 2
+    assert stats.tokens_saved > 0
+
+
+def test_evidence_cut_by_the_budget_survives_in_the_other_report():
+    # The shared paragraph ranks last in the first report, so the budget cuts it there
+    first = [OPENING, _filler(1), _filler(2), SHARED, CLOSING]
+    budget = count_tokens(OPENING) + count_tokens(CLOSING) + count_tokens(_filler(1)) + 2
+    reports = [_report("Optimist", *first), _report("Historian", SHARED)]
+    compacted, _ = compact_reports(reports, member_token_budget=budget)
+    assert SHARED not in compacted[0].content
+    assert SHARED in compacted[1].content
+
+
+def test_failed_reports_pass_through_untouched():
+    failed = _report("Forecaster", "[Forecaster timed out after 120s without a report]", status="timed_out")
+    compacted, _ = compact_reports([failed], member_token_budget=5)
+    assert compacted[0] is failed
+
+
+def _tracer(monkeypatch):
+    from utils.telemetry import spans
+
+    tracer = spans.Tracer()
+    monkeypatch.setattr(spans, "_tracer", tracer)
+    return tracer
+
+
+def test_member_hook_compacts_the_output_and_counts_the_savings(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.teams.judge.compaction import compaction_hook
+
+    tracer = _tracer(monkeypatch)
+    paragraphs = [OPENING, *(_filler(i) for i in range(1, 8)), CLOSING]
+    output = SimpleNamespace(content="Running: google_search(query='solar')\n\n" + "\n\n".join(paragraphs), metadata=None)
+    budget = count_tokens(OPENING) + count_tokens(CLOSING) + 2
+    compaction_hook(budget)(output, SimpleNamespace(name="Optimist"))
+
+    assert output.content == f"{OPENING}\n\n{CLOSING}"
+    saved = output.metadata["compaction"]["tokens_saved"]
+    assert saved > 0
+    counters = tracer.metrics.snapshot(["compaction"])["compaction"]["team"]
+    assert counters["runs"] == 1 and counters["tokens_saved"] == saved
+
+
+def test_default_team_run_compacts_member_outputs(mock_openai, monkeypatch):
+    import functools
+
+    from scripts.loadtest.mock_tools import FakeResearchBackend, mock_judge_tools, offline_registry
+    from src.teams.judge.judge_team import JudgeTeam
+
+    monkeypatch.setenv("POLYMIND_RESPONSE_CACHE", "off")
+    tracer = _tracer(monkeypatch)
+    backend = FakeResearchBackend(latency=0)
+    team = JudgeTeam(registry=offline_registry(backend), tools=functools.partial(mock_judge_tools, backend))
+    assert all(member.post_hooks for member in team.team.members)
+    assert not any(member.post_hooks for member in team.members)
+
+    team.run("Will fusion power be commercial by 2040?")
+    assert tracer.metrics.snapshot(["compaction"])["compaction"]["team"]["runs"] == len(team.members)
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from utils.evaluation.cassette import Cassette, CassetteMiss
+from utils.evaluation.runner import CaseResult, EvalCase, EvalConfig, _status, summarize_results
+
+
+def _response(statuses, status="COMPLETED"):
+    reports = [{"name": f"m{i}", "status": s, "content": "Verdict: yes"} for i, s in enumerate(statuses)]
+    return SimpleNamespace(status=status, content="answer", metadata={"member_reports": reports})
+
+
+def test_status_follows_member_reports():
+    assert _status(_response(["completed"] * 4)) == ("completed", None)
+    assert _status(_response(["completed", "timed_out", "partial"])) == ("degraded", "m1: timed_out, m2: partial")
+    assert _status(_response(["completed"], status="ERROR")) == ("error", "answer")
+    # Team mode has no member reports of its own
+    assert _status(SimpleNamespace(status="COMPLETED", content="answer", metadata=None)) == ("completed", None)
+
+
+def _result(case_id, config, status="completed", latency=1.0):
+    reports = {"optimist": "renewables will grow", "pessimist": "grids cannot keep up"}
+    return CaseResult(case_id, config, status, latency, answer="renewables will grow", reports=reports, cost=0.01)
+
+
+def test_degraded_runs_are_counted_but_not_scored():
+    cases = [EvalCase("1", "q1"), EvalCase("2", "q2")]
+    configs = [EvalConfig("team"), EvalConfig("fan_out", {"fan_out": True})]
+    results = [
+        _result("1", "team"),
+        _result("2", "team"),
+        _result("1", "fan_out"),
+        _result("2", "fan_out", status="degraded", latency=9.0),
+    ]
+    report = summarize_results(results, cases, configs, backend="mock")
+    fan_out = report.configs[1]
+    assert (fan_out["cases"], fan_out["errors"], fan_out["degraded"]) == (2, 0, 1)
+    assert fan_out["latency"]["p95"] == 1.0
+    assert "baseline_similarity" not in report.cases[3]
+    assert report.cases[2]["baseline_similarity"] == pytest.approx(1.0)
+
+
+def test_cassette_replays_recorded_exchanges(tmp_path):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions", json={"model": "gpt-4o", "n": 1})
+    recorder = Cassette(str(tmp_path), mode="record")
+    recorder.put(request, httpx.Response(200, headers={"content-length": "2"}), b"{}", elapsed=0.25)
+
+    replay = Cassette(str(tmp_path), replay_latency=False)
+    # Key order in the JSON body does not matter
+    same = httpx.Request("POST", "https://api.openai.com/v1/chat/completions", json={"n": 1, "model": "gpt-4o"})
+    response, delay = replay.get(same)
+    assert (response.status_code, response.content, delay) == (200, b"{}", 0.0)
+    with pytest.raises(CassetteMiss):
+        replay.get(httpx.Request("GET", "https://api.openai.com/v1/models"))
+    assert (replay.hits, replay.misses) == (1, 1)
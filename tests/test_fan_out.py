@@ -0,0 +1,81 @@
+import asyncio
+import functools
+
+from agno.run.agent import RunCompletedEvent, RunContentEvent
+
+from src.teams.judge.fan_out import fan_out, judge_prompt
+
+
+class FakeMember:
+    """Streams ``chunks`` with ``delay`` seconds before each one; records whether its run was cancelled."""
+
+    def __init__(self, name, chunks, delay=0.0, fail=False):
+        self.name = name
+        self.chunks = chunks
+        self.delay = delay
+        self.fail = fail
+        self.cancelled = False
+
+    async def arun(self, prompt, stream=True, stream_events=False, yield_run_response=False):
+        try:
+            for chunk in self.chunks:
+                await asyncio.sleep(self.delay)
+                if self.fail:
+                    raise RuntimeError("model unavailable")
+                yield RunContentEvent(content=chunk)
+            yield RunCompletedEvent(content="".join(self.chunks))
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+async def test_member_deadlines_give_partial_and_timed_out_reports():
+    fast = FakeMember("Optimist", ["Solar ", "wins."])
+    slow = FakeMember("Pessimist", ["Costs ", "remain ", "high."], delay=0.1)
+    stuck = FakeMember("Historian", ["Never sent."], delay=10)
+    failing = FakeMember("Forecaster", ["x"], fail=True)
+
+    reports = await fan_out([fast, slow, stuck, failing], "solar", soft_deadline=0.05, hard_deadline=0.25)
+    by_name = {r.name: r for r in reports}
+
+    assert by_name["Optimist"].status == "completed" and by_name["Optimist"].content == "Solar wins."
+    assert by_name["Pessimist"].status == "partial" and by_name["Pessimist"].content == "Costs remain "
+    assert by_name["Historian"].status == "timed_out"
+    assert by_name["Historian"].content == "[Historian timed out after 0s without a report]"
+    assert by_name["Forecaster"].status == "error" and "model unavailable" in by_name["Forecaster"].content
+    assert slow.cancelled and stuck.cancelled
+    assert max(r.elapsed for r in reports) < 1
+
+
+async def test_per_member_deadlines_override_the_defaults():
+    slow = FakeMember("Pessimist", ["Costs ", "remain ", "high."], delay=0.05)
+    reports = await fan_out([slow], "solar", soft_deadline=0.01, hard_deadline=0.02, deadlines={"Pessimist": (1, 2)})
+    assert reports[0].status == "completed"
+
+
+def test_judge_prompt_marks_incomplete_reports():
+    from src.teams.judge.fan_out import MemberReport
+
+    prompt = judge_prompt("solar", [
+        MemberReport("Pessimist", "Costs remain", "partial", 1.0),
+        MemberReport("Historian", "[Historian timed out after 2s without a report]", "timed_out", 2.0),
+    ])
+    assert "## Pessimist (partial - the member timed out before finishing)" in prompt
+    assert "## Historian (unavailable)" in prompt
+
+
+def test_streaming_run_in_fan_out_mode_streams_the_debate(mock_openai, monkeypatch):
+    from scripts.loadtest.mock_tools import FakeResearchBackend, mock_judge_tools, offline_registry
+    from src.teams.judge.judge_team import JudgeTeam
+
+    monkeypatch.setenv("POLYMIND_RESPONSE_CACHE", "off")
+    backend = FakeResearchBackend(latency=0)
+    team = JudgeTeam(registry=offline_registry(backend), fan_out=True, tools=functools.partial(mock_judge_tools, backend))
+
+    events = [event["event"] for event in team.run("Will fusion power be commercial by 2040?", stream=True)]
+    assert events[0] == "DebateStarted" and events[-1] == "DebateCompleted"
+    assert "MemberContent" in events and "JudgeContent" in events
+
+    stream = team.run("Will fusion power be commercial by 2040?", stream=True)
+    assert next(stream)["event"] == "DebateStarted"
+    stream.close()
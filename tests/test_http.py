@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from utils.shared import http
+from utils.shared.http import (
+    HostPolicy,
+    get_async_http_client,
+    parse_host_concurrency,
+    set_host_policy,
+)
+
+
+@pytest.fixture(autouse=True)
+def policy():
+    policy = HostPolicy(max_per_host=16, host_concurrency={"api.openai.com": 64})
+    set_host_policy(policy)
+    yield policy
+    set_host_policy(None)
+
+
+def test_parse_host_concurrency():
+    assert parse_host_concurrency("api.openai.com=64, hn.example=8,") == {"api.openai.com": 64, "hn.example": 8}
+    assert parse_host_concurrency("") == {}
+
+
+def test_host_override_raises_the_limit_for_that_host_only(policy):
+    assert policy.concurrency("api.openai.com") == 64
+    assert policy.concurrency("duckduckgo.com") == 16
+    assert policy.semaphore("api.openai.com")._value == 64
+
+
+def test_async_client_is_closed_when_its_loop_shuts_down():
+    async def client():
+        return get_async_http_client()
+
+    first = asyncio.run(client())
+    assert first.is_closed
+    assert len(http._async_clients) == 0
+    second = asyncio.run(client())
+    assert second is not first
+    assert second.is_closed
+
+
+def test_client_is_shared_within_a_loop():
+    async def clients():
+        first = get_async_http_client()
+        await asyncio.sleep(0)
+        return first, get_async_http_client()
+
+    first, second = asyncio.run(clients())
+    assert first is second
+
+
+def test_clients_of_loops_closed_by_hand_are_dropped():
+    loop = asyncio.new_event_loop()
+
+    async def client():
+        return get_async_http_client()
+
+    # Closed without shutdown_asyncgens(), so only the next lookup can notice
+    loop.run_until_complete(client())
+    loop.close()
+    assert loop in http._async_clients
+    asyncio.run(client())
+    assert loop not in http._async_clients
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from utils.retrieval.embeddings import HashingEmbedder
+from utils.retrieval.ingestion import IngestionPipeline, Manifest
+from utils.retrieval.store import KnowledgeStore
+
+
+@pytest.fixture
+def raw(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "solar.txt").write_text("Solar capacity grew quickly last year. " * 20)
+    (raw / "wind.md").write_text("Offshore wind costs fell sharply. " * 20)
+    return raw
+
+
+def _pipeline(tmp_path, raw, dim=64, **kwargs):
+    store = KnowledgeStore(path=str(tmp_path / "lancedb"), embedder=HashingEmbedder(dim=dim))
+    return IngestionPipeline(
+        raw_dir=str(raw), manifest_path=str(tmp_path / "manifest.json"), store=store,
+        embedder_spec=f"hashing:{dim}", workers=0, **kwargs,
+    )
+
+
+def test_reruns_skip_unchanged_files_and_prune_deleted_ones(tmp_path, raw):
+    first = _pipeline(tmp_path, raw).run()
+    assert first.files_ingested == 2 and first.chunks_written > 0
+
+    second = _pipeline(tmp_path, raw).run()
+    assert (second.files_skipped, second.files_ingested) == (2, 0)
+
+    (raw / "wind.md").unlink()
+    pipeline = _pipeline(tmp_path, raw)
+    third = pipeline.run()
+    assert third.files_removed == 1
+    assert {row["source"] for row in pipeline.store.table.to_arrow().to_pylist()} == {"solar.txt"}
+
+
+def test_manifest_records_the_embedder(tmp_path, raw):
+    _pipeline(tmp_path, raw).run()
+    data = json.loads((tmp_path / "manifest.json").read_text())
+    assert data["embedder"] == {"name": "hashing-64", "dim": 64}
+    assert set(data["files"]) == {"solar.txt", "wind.md"}
+
+
+def test_switching_embedder_is_refused_without_reembed(tmp_path, raw):
+    _pipeline(tmp_path, raw).run()
+    with pytest.raises(ValueError, match="hashing-64"):
+        _pipeline(tmp_path, raw, dim=128).run()
+
+
+def test_reembed_rebuilds_the_table_for_the_new_embedder(tmp_path, raw):
+    _pipeline(tmp_path, raw).run()
+    pipeline = _pipeline(tmp_path, raw, dim=128, reembed=True)
+    stats = pipeline.run()
+    assert stats.files_ingested == 2
+    assert pipeline.store.dimension() == 128
+    assert Manifest(str(tmp_path / "manifest.json")).embedder == {"name": "hashing-128", "dim": 128}
+
+
+def test_missing_raw_dir_raises(tmp_path, raw):
+    with pytest.raises(FileNotFoundError):
+        _pipeline(tmp_path, tmp_path / "not-mounted").run()
+
+
+def test_empty_raw_dir_does_not_prune_everything(tmp_path, raw):
+    pipeline = _pipeline(tmp_path, raw)
+    pipeline.run()
+    count = pipeline.store.count()
+    for path in raw.iterdir():
+        path.unlink()
+
+    with pytest.raises(ValueError, match="refusing to prune"):
+        _pipeline(tmp_path, raw).run()
+    assert pipeline.store.count() == count
+
+    stats = _pipeline(tmp_path, raw).run(prune_all=True)
+    assert stats.files_removed == 2
+
+
+def test_index_is_trained_once_then_updated_incrementally(tmp_path):
+    store = KnowledgeStore(path=str(tmp_path / "lancedb"), embedder=HashingEmbedder(dim=64))
+    records = [{"id": str(i), "source": f"doc{i % 7}.txt", "chunk": i, "text": f"note {i} on grid storage"} for i in range(300)]
+    store.add(records[:256])
+    assert store.update_index(force=True, num_partitions=2) == "built"
+    assert store.has_index()
+
+    store.add(records[256:])
+    assert store.update_index(force=True, num_partitions=2) == "optimized"
+    stats = store.table.index_stats(store.table.list_indices()[0].name)
+    assert (stats.num_indexed_rows, stats.num_unindexed_rows) == (300, 0)
+
+    assert store.update_index(rebuild=True, force=True, num_partitions=2) == "built"
@@ -0,0 +1,17 @@
+import functools
+
+from src.teams.judge.judge_team import TOOL_HOOKS, JudgeTeam
+
+
+def test_judge_builds_its_own_hooked_toolkits():
+    from scripts.loadtest.mock_tools import FakeResearchBackend, mock_judge_tools, offline_registry
+
+    backend = FakeResearchBackend(latency=0)
+    team = JudgeTeam(registry=offline_registry(backend), tools=functools.partial(mock_judge_tools, backend))
+    judge = team.get_judge()
+
+    assert team.team.tools is team.tools
+    assert not {id(toolkit) for toolkit in judge.tools} & {id(toolkit) for toolkit in team.tools}
+    assert judge.tool_hooks is None
+    for toolkit in judge.tools:
+        assert all(function.tool_hooks == TOOL_HOOKS for function in toolkit.functions.values())
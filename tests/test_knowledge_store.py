@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from utils.retrieval.embeddings import HashingEmbedder
+from utils.retrieval.store import KnowledgeStore
+
+DOCUMENTS = {
+    "solar.txt": "solar panels and photovoltaic capacity on rooftops",
+    "wind.txt": "offshore wind turbines in the north sea",
+    "fusion.txt": "fusion reactors and tokamak plasma confinement",
+}
+
+
+class OtherModel(HashingEmbedder):
+    """Same dimension as the default embedder, different vector space."""
+
+    @property
+    def spec(self) -> str:
+        return "sentence-transformers:other-384"
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self, dim):
+        super().__init__(dim)
+        self.calls = 0
+
+    def embed(self, texts):
+        self.calls += 1
+        return super().embed(texts)
+
+
+@pytest.fixture
+def path(tmp_path):
+    store = KnowledgeStore(path=str(tmp_path / "lancedb"), embedder=HashingEmbedder(dim=64))
+    store.add([{"id": source, "source": source, "chunk": 0, "text": text} for source, text in DOCUMENTS.items()])
+    return str(tmp_path / "lancedb")
+
+
+def test_search_batch_embeds_once_and_keeps_query_order(path):
+    embedder = CountingEmbedder(64)
+    store = KnowledgeStore(path=path, embedder=embedder)
+    results = store.search_batch(["tokamak plasma", "wind turbines offshore", "rooftop solar panels"], k=2)
+    assert [rows[0]["source"] for rows in results] == ["fusion.txt", "wind.txt", "solar.txt"]
+    assert all(len(rows) == 2 for rows in results)
+    assert embedder.calls == 1
+    assert store.search_batch([]) == []
+
+
+def test_queries_use_the_embedder_recorded_with_the_table(path, monkeypatch):
+    monkeypatch.setenv("POLYMIND_EMBEDDER", "hashing")
+    store = KnowledgeStore(path=path)
+    assert store.recorded_embedder() == "hashing:64"
+    assert store.embedder.spec == "hashing:64"
+    assert store.search("tokamak plasma")[0]["source"] == "fusion.txt"
+
+
+def test_a_different_embedder_of_the_same_dimension_is_refused(tmp_path):
+    built = KnowledgeStore(path=str(tmp_path / "lancedb"), embedder=OtherModel(dim=384))
+    built.add([{"id": "a", "source": "a.txt", "chunk": 0, "text": "grid storage"}])
+
+    store = KnowledgeStore(path=str(tmp_path / "lancedb"), embedder=HashingEmbedder(dim=384))
+    with pytest.raises(ValueError, match="other-384"):
+        store.search("grid storage")
+    with pytest.raises(ValueError):
+        store.add([{"id": "b", "source": "b.txt", "chunk": 0, "text": "more"}])
+
+
+def test_knowledge_tool_searches_the_recorded_space(path, monkeypatch):
+    from src.tools.knowledge_tools import KnowledgeTools
+    from utils.retrieval import store as store_module
+
+    monkeypatch.setattr(store_module, "_stores", {})
+    results = json.loads(KnowledgeTools(path=path).search_knowledge_base("offshore wind", num_results=1))
+    assert [r["source"] for r in results] == ["wind.txt"]
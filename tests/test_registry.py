@@ -0,0 +1,58 @@
+import importlib
+import sys
+from types import SimpleNamespace
+
+import pytest
+from agno.os.utils import get_agent_by_id
+
+from src.agents.registry import AgentRegistry, get_agent_registry, set_agent_registry
+from src.teams.judge.judge_team import MEMBER_NAMES
+
+
+@pytest.fixture
+def agentos(tmp_path, monkeypatch):
+    """``src.agentos`` imported fresh against an offline registry and a throwaway session db."""
+    from scripts.loadtest.mock_tools import FakeResearchBackend, offline_registry
+    from utils.shared import session_db
+
+    monkeypatch.setenv("POLYMIND_DB_FILE", str(tmp_path / "polymind.db"))
+    monkeypatch.setattr(session_db, "_session_db", None)
+    set_agent_registry(offline_registry(FakeResearchBackend(latency=0)))
+    sys.modules.pop("src.agentos", None)
+    try:
+        yield importlib.import_module("src.agentos")
+    finally:
+        sys.modules.pop("src.agentos", None)
+        session_db.get_session_db().close()
+        set_agent_registry(None)
+
+
+def test_agents_are_built_once_on_first_use():
+    built = []
+
+    class Wrapper:
+        def __init__(self):
+            built.append(self)
+            self.agent = SimpleNamespace(name="fake", run=lambda *a, **k: None, arun=lambda *a, **k: None)
+
+    registry = AgentRegistry({"fake": Wrapper})
+    assert not registry.is_built("fake")
+    assert registry.agent("fake") is registry.agent("fake")
+    assert len(built) == 1
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+def test_endpoints_serve_the_registry_agents(agentos):
+    for name in MEMBER_NAMES:
+        agent = get_agent_registry().agent(name)
+        assert get_agent_by_id(agent.id, agentos.agent_os.agents) is agent
+
+
+def test_team_members_share_model_and_toolkits_with_the_registry_agents(agentos):
+    for name, member in zip(MEMBER_NAMES, agentos.debate_team.members, strict=True):
+        agent = get_agent_registry().agent(name)
+        assert member is not agent
+        assert member.model is agent.model
+        assert all(a is b for a, b in zip(member.tools, agent.tools, strict=True))
+        assert member.db is None and agent.db is agentos.db
@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.shared import cache as cache_module
+from utils.shared.research_cache import ResearchCache, research_cache_hook, set_research_cache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ResearchCache(ttl=60)
+    calls = []
+    key = cache.key("duckduckgo_search", {"query": "fusion"})
+
+    def fetch():
+        calls.append(1)
+        return f"results {len(calls)}"
+
+    assert cache.get_or_fetch(key, fetch) == "results 1"
+    now[0] += 59
+    assert cache.get_or_fetch(key, fetch) == "results 1"
+    now[0] += 2
+    assert cache.get_or_fetch(key, fetch) == "results 2"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_key_ignores_argument_order():
+    assert ResearchCache.key("google_search", {"query": "q", "max_results": 5}) == \
+        ResearchCache.key("google_search", {"max_results": 5, "query": "q"})
+    assert ResearchCache.key("google_search", {"query": "q"}) != ResearchCache.key("duckduckgo_search", {"query": "q"})
+
+
+def test_concurrent_identical_calls_are_coalesced():
+    cache = ResearchCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "results"
+
+    with ThreadPoolExecutor(4) as pool:
+        leader = pool.submit(cache.get_or_fetch, "k", fetch)
+        started.wait(5)
+        followers = [pool.submit(cache.get_or_fetch, "k", fetch) for _ in range(3)]
+        # The followers must be waiting on the leader's call before it finishes
+        while cache.coalesced < 3:
+            time.sleep(0.01)
+        release.set()
+        results = [leader.result(5)] + [f.result(5) for f in followers]
+
+    assert results == ["results"] * 4
+    assert len(calls) == 1
+    assert (cache.misses, cache.coalesced) == (1, 3)
+
+
+def test_failures_reach_waiters_and_are_not_cached():
+    cache = ResearchCache()
+
+    def fail():
+        raise ConnectionError("search unavailable")
+
+    with pytest.raises(ConnectionError):
+        cache.get_or_fetch("k", fail)
+    assert cache.get_or_fetch("k", lambda: "results") == "results"
+    assert cache.stats()["entries"] == 1
+
+
+def test_hook_only_caches_research_tools():
+    cache = ResearchCache()
+    set_research_cache(cache)
+    try:
+        calls = []
+
+        def tool(**arguments):
+            calls.append(arguments)
+            return "out"
+
+        for _ in range(2):
+            research_cache_hook("duckduckgo_search", tool, {"query": "fusion"})
+            research_cache_hook("think", tool, {"thought": "hmm"})
+    finally:
+        set_research_cache(None)
+    assert [c for c in calls if "query" in c] == [{"query": "fusion"}]
+    assert len([c for c in calls if "thought" in c]) == 2
+
+
+def test_error_strings_returned_by_tools_are_not_cached():
+    cache = ResearchCache()
+    results = iter(["Error reading article from https://example.com: timed out", "article text"])
+    assert cache.get_or_fetch("k", lambda: next(results)).startswith("Error")
+    assert cache.get_or_fetch("k", lambda: next(results)) == "article text"
+    assert cache.get_or_fetch("k", lambda: "not fetched again") == "article text"
+    assert (cache.misses, cache.hits) == (2, 1)
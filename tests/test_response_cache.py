@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils.shared import cache as cache_module
+from utils.shared.cache import MISSING
+from utils.shared.response_cache import ResponseCache, acached_run, cached_run, set_response_cache
+
+
+def _runner(name="Judge", instructions="weigh the reports", model_id="gpt-4o"):
+    return SimpleNamespace(name=name, instructions=instructions, model=SimpleNamespace(id=model_id, temperature=None))
+
+
+def _response(content="verdict", status="COMPLETED", member_statuses=None):
+    metadata = None
+    if member_statuses is not None:
+        metadata = {"member_reports": [{"name": f"m{i}", "status": s} for i, s in enumerate(member_statuses)]}
+    return SimpleNamespace(content=content, status=status, metadata=metadata)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setenv("POLYMIND_RESPONSE_CACHE", "memory")
+    cache = ResponseCache(ttl=60)
+    set_response_cache(cache)
+    yield cache
+    set_response_cache(None)
+
+
+class _Runs:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.response
+
+
+def test_normalized_topics_share_an_entry(cache):
+    scope = cache.scope_for(_runner())
+    cache.set(scope, "Will fusion power be commercial?", "answer")
+    assert cache.get(scope, "  will FUSION power be commercial ") == "answer"
+    assert cache.stats()["hits"] == 1
+
+
+def test_normalization_keeps_symbols_that_change_the_topic():
+    assert ResponseCache.normalize('Is "C++" faster than C?') == "is c++ faster than c"
+    assert ResponseCache.normalize("Is C++ faster than C") != ResponseCache.normalize("Is C faster than C")
+    assert ResponseCache.normalize("Should I learn C#?") != ResponseCache.normalize("Should I learn C?")
+    assert ResponseCache.normalize("GPT-3.5 vs GPT-4.") == "gpt-3.5 vs gpt-4"
+
+
+def test_team_scope_covers_its_members(cache):
+    def team(**member):
+        return SimpleNamespace(**vars(_runner(name="Judge Team")), members=[_runner(name="Optimist", **member)])
+
+    scope = cache.scope_for(team())
+    assert cache.scope_for(team()) == scope
+    assert cache.scope_for(team(model_id="gpt-4o-mini")) != scope
+    assert cache.scope_for(team(instructions="be upbeat")) != scope
+
+    # Fan-out and routing cache under the judge, with the members it judges passed in
+    judge = _runner()
+    assert cache.scope_for(judge, "fan_out", members=[_runner(name="Optimist")]) != \
+        cache.scope_for(judge, "fan_out", members=[_runner(name="Optimist", instructions="be upbeat")])
+
+
+def test_cache_is_off_by_default(monkeypatch):
+    from utils.shared.response_cache import get_response_cache
+
+    monkeypatch.delenv("POLYMIND_RESPONSE_CACHE", raising=False)
+    assert get_response_cache() is None
+
+
+def test_scope_changes_with_instructions_and_model(cache):
+    cache.set(cache.scope_for(_runner()), "topic", "answer")
+    assert cache.get(cache.scope_for(_runner(instructions="edited")), "topic") is MISSING
+    assert cache.get(cache.scope_for(_runner(model_id="gpt-4o-mini")), "topic") is MISSING
+
+
+def test_entries_expire_after_ttl(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    scope = cache.scope_for(_runner())
+    cache.set(scope, "topic", "answer")
+    now[0] += 59
+    assert cache.get(scope, "topic") == "answer"
+    now[0] += 2
+    assert cache.get(scope, "topic") is MISSING
+
+
+def test_semantic_lookup_matches_near_duplicates():
+    cache = ResponseCache(similarity_threshold=0.8)
+    scope = cache.scope_for(_runner())
+    cache.set(scope, "the future of renewable energy in europe", "answer")
+    assert cache.get(scope, "the future of renewable energy in europe today") == "answer"
+    assert cache.stats()["semantic_hits"] == 1
+    assert cache.get(scope, "quantum computing risks") is MISSING
+
+
+def test_completed_response_is_served_from_cache(cache):
+    run = _Runs(_response(member_statuses=["completed"] * 4))
+    first = cached_run(_runner(), "topic", run)
+    assert cached_run(_runner(), "topic", run) is first
+    assert run.calls == 1
+
+
+def test_streaming_runs_bypass_the_cache(cache):
+    run = _Runs(_response())
+    cached_run(_runner(), "topic", run, stream=True)
+    cached_run(_runner(), "topic", run, stream=True)
+    assert run.calls == 2
+
+
+def test_error_response_is_not_cached(cache):
+    run = _Runs(_response(status="ERROR"))
+    cached_run(_runner(), "topic", run)
+    cached_run(_runner(), "topic", run)
+    assert run.calls == 2
+
+
+@pytest.mark.parametrize("statuses", [
+    ["timed_out"] * 4,
+    ["completed", "completed", "error", "completed"],
+    ["completed", "partial", "completed", "completed"],
+])
+async def test_degraded_debate_is_not_cached(cache, statuses):
+    run = _Runs(_response(member_statuses=statuses))
+
+    async def arun():
+        return run()
+
+    await acached_run(_runner(), "topic", arun, variant="fan_out")
+    await acached_run(_runner(), "topic", arun, variant="fan_out")
+    assert run.calls == 2
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,38 @@
+import pytest
+
+from src.teams.judge.fan_out import MemberReport
+from src.teams.judge.routing import assess_agreement, extract_verdict
+
+NAMES = ["Optimist", "Pessimist", "Historian", "Forecaster"]
+
+
+def _reports(verdicts, statuses=None):
+    statuses = statuses or ["completed"] * len(verdicts)
+    return [
+        MemberReport(name, f"Analysis of the topic by {name}.\n\nVerdict: {verdict}", status, 1.0)
+        for name, verdict, status in zip(NAMES[:len(verdicts)], verdicts, statuses, strict=True)
+    ]
+
+
+def test_extract_verdict_takes_the_last_one():
+    assert extract_verdict("Verdict: negative\n\nOn reflection.\n\n**Verdict:** Positive") == "positive"
+    assert extract_verdict("no verdict here") is None
+
+
+def test_agreeing_verdicts_take_the_fast_path():
+    agreement = assess_agreement(_reports(["positive", "positive", "positive", "negative"]))
+    assert agreement.consensus
+    assert agreement.majority == "positive" and agreement.score == 0.75
+
+
+def test_split_or_mixed_verdicts_take_the_full_path():
+    assert not assess_agreement(_reports(["positive", "positive", "negative", "negative"])).consensus
+    assert not assess_agreement(_reports(["mixed"] * 4)).consensus
+
+
+@pytest.mark.parametrize("status", ["partial", "timed_out", "error"])
+def test_any_incomplete_member_forces_the_full_path(status):
+    statuses = ["completed", "completed", "completed", status]
+    agreement = assess_agreement(_reports(["positive"] * 4, statuses))
+    assert not agreement.consensus
+    assert agreement.reason == "missing_reports"
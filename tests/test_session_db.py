@@ -0,0 +1,127 @@
+import functools
+import time
+
+from agno.db.base import SessionType
+
+from src.teams.judge.judge_team import MEMBER_NAMES, JudgeTeam
+
+
+def test_standalone_agent_still_saves_after_a_team_run(mock_openai, session_db, monkeypatch):
+    from scripts.loadtest.mock_tools import FakeResearchBackend, mock_judge_tools, offline_registry
+
+    monkeypatch.setenv("POLYMIND_RESPONSE_CACHE", "off")
+    backend = FakeResearchBackend(latency=0)
+    registry = offline_registry(backend)
+    agents = registry.agents(MEMBER_NAMES)
+    for agent in agents:
+        agent.db = session_db
+    team = JudgeTeam(registry=registry, db=session_db, tools=functools.partial(mock_judge_tools, backend))
+
+    team.run("Will fusion power be commercial by 2040?")
+    assert all(agent.team_id is None for agent in agents)
+    assert all(member is not agent for member, agent in zip(team.members, agents, strict=True))
+
+    agents[0].run("Write a short note", session_id="standalone")
+    session_db.flush()
+    assert session_db.get_session("standalone", SessionType.AGENT) is not None
+
+
+def _session(session_id, runs):
+    from agno.run.agent import RunOutput
+    from agno.session import AgentSession
+
+    return AgentSession(session_id=session_id, agent_id="optimist", created_at=int(time.time()), runs=[
+        RunOutput(run_id=f"r{i}", session_id=session_id, content=f"run {i}", created_at=i) for i in range(runs)
+    ])
+
+
+def test_writes_are_batched_and_readable_before_the_flush(session_db):
+    session_db.upsert_session(_session("s1", 1))
+    session_db.upsert_session(_session("s1", 2))
+    session_db.upsert_session(_session("s2", 1))
+    assert session_db.stats()["pending"] == 2
+    assert [run.run_id for run in session_db.get_session("s1", SessionType.AGENT).runs] == ["r0", "r1"]
+    assert session_db.get_session("s1", SessionType.TEAM) is None
+
+    session_db.flush()
+    assert session_db.stats()["pending"] == 0
+    assert session_db.flushes == 1
+    assert [run.run_id for run in session_db.get_session("s1", SessionType.AGENT).runs] == ["r0", "r1"]
+
+
+def test_full_batch_wakes_the_writer(tmp_path):
+    from utils.shared.session_db import SessionDb
+
+    db = SessionDb(db_file=str(tmp_path / "sessions.db"), batch_size=2, flush_interval=60)
+    try:
+        db.upsert_session(_session("s1", 1))
+        db.upsert_session(_session("s2", 1))
+        deadline = time.monotonic() + 5
+        while db.stats()["pending"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert db.stats()["pending"] == 0
+    finally:
+        db.close()
+
+
+def test_old_runs_are_archived_and_paged_back(tmp_path):
+    from utils.shared.session_db import SessionDb
+
+    db = SessionDb(db_file=str(tmp_path / "sessions.db"), history_runs=3, flush_interval=60)
+    try:
+        db.upsert_session(_session("s1", 8))
+        db.flush()
+        assert [run.run_id for run in db.get_session("s1", SessionType.AGENT).runs] == ["r5", "r6", "r7"]
+        assert db.archived == 5
+        assert db.count_runs("s1") == 8
+        assert [run["run_id"] for run in db.get_runs("s1", limit=4)] == ["r7", "r6", "r5", "r4"]
+        assert [run["run_id"] for run in db.get_runs("s1", limit=4, offset=4)] == ["r3", "r2", "r1", "r0"]
+        assert db.get_run("s1", "r1")["content"] == "run 1"
+        assert db.get_run("s1", "missing") is None
+    finally:
+        db.close()
+
+
+def test_deleting_a_session_drops_its_archive(session_db):
+    session_db.history_runs = 1
+    session_db.upsert_session(_session("s1", 3))
+    session_db.flush()
+    assert session_db.delete_session("s1")
+    assert session_db.count_runs("s1") == 0
+
+
+def test_workers_sharing_the_file_keep_each_others_runs(tmp_path):
+    from agno.run.agent import RunOutput
+
+    from utils.shared.session_db import SessionDb
+
+    path = str(tmp_path / "sessions.db")
+    first, second = SessionDb(db_file=path, flush_interval=60), SessionDb(db_file=path, flush_interval=60)
+    try:
+        first.upsert_session(_session("s1", 1))
+        first.flush()
+        # Both workers load the session before either saves its next run
+        a, b = first.get_session("s1", SessionType.AGENT), second.get_session("s1", SessionType.AGENT)
+        a.runs.append(RunOutput(run_id="from-a", session_id="s1", content="a", created_at=5))
+        b.runs.append(RunOutput(run_id="from-b", session_id="s1", content="b", created_at=6))
+        first.upsert_session(a)
+        second.upsert_session(b)
+        second.flush()
+        first.flush()
+        assert [run.run_id for run in second.get_session("s1", SessionType.AGENT).runs] == ["r0", "from-a", "from-b"]
+    finally:
+        first.close()
+        second.close()
+
+
+def test_zero_flush_interval_writes_through(tmp_path):
+    from utils.shared.session_db import SessionDb
+
+    db = SessionDb(db_file=str(tmp_path / "sessions.db"), flush_interval=0)
+    try:
+        assert db._thread is None
+        db.upsert_session(_session("s1", 2))
+        assert db.stats()["pending"] == 0
+        assert db.flushes == 1
+    finally:
+        db.close()
@@ -0,0 +1,113 @@
+import asyncio
+from types import SimpleNamespace
+
+from agno.run.agent import RunCompletedEvent, RunContentEvent
+
+from src.api.debate import sse_until_disconnect
+from src.teams.judge.fan_out import fan_out, judge_prompt
+from src.teams.judge.streaming import stream_debate
+
+
+class FakeAgent:
+    """Streams ``tokens`` content events ``delay`` seconds apart; counts what it produced and notes cancellation."""
+
+    def __init__(self, name, tokens=3, delay=0.0):
+        self.name = name
+        self.tokens = tokens
+        self.delay = delay
+        self.produced = 0
+        self.cancelled = False
+
+    async def arun(self, prompt, stream=True, stream_events=False, yield_run_response=False):
+        try:
+            for i in range(self.tokens):
+                await asyncio.sleep(self.delay)
+                self.produced += 1
+                yield RunContentEvent(content=f"{self.name} {i} ")
+            yield RunCompletedEvent(content="done")
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class FakeTeam:
+    """The parts of JudgeTeam that stream_debate uses."""
+
+    def __init__(self, members, judge):
+        self.team = SimpleNamespace(name="Judge Team")
+        self.members = members
+        self.judge = judge
+
+    def get_routed_members(self):
+        return self.members
+
+    async def gather_reports(self, topic, routed=False, on_event=None):
+        return await fan_out(self.members, topic, soft_deadline=30, hard_deadline=60, on_event=on_event)
+
+    def prepare_judge(self, topic, reports, routed=False):
+        return self.judge, judge_prompt(topic, reports), {}
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+
+
+async def test_a_slow_consumer_holds_the_members_back():
+    member = FakeAgent("Optimist", tokens=50)
+    events = stream_debate(FakeTeam([member], FakeAgent("Judge", tokens=1)), "solar", max_buffered=4)
+
+    assert (await anext(events))["event"] == "DebateStarted"
+    await _settle()
+    # The queue holds max_buffered events and the member waits on the next one
+    assert member.produced <= 6
+
+    rest = [event async for event in events]
+    assert sum(event["event"] == "MemberContent" for event in rest) == 50
+    assert rest[-1]["event"] == "DebateCompleted"
+
+
+async def test_closing_the_stream_cancels_the_members():
+    members = [FakeAgent("Optimist", tokens=100, delay=0.01), FakeAgent("Pessimist", tokens=100, delay=0.01)]
+    events = stream_debate(FakeTeam(members, FakeAgent("Judge")), "solar")
+
+    async for event in events:
+        if event["event"] == "MemberContent":
+            break
+    await events.aclose()
+    await _settle()
+
+    assert all(member.cancelled for member in members)
+    assert all(member.produced < 100 for member in members)
+
+
+async def test_closing_the_stream_cancels_the_judge():
+    judge = FakeAgent("Judge", tokens=100, delay=0.01)
+    events = stream_debate(FakeTeam([FakeAgent("Optimist")], judge), "solar")
+
+    async for event in events:
+        if event["event"] == "JudgeContent":
+            break
+    await events.aclose()
+    await _settle()
+
+    assert judge.cancelled and judge.produced < 100
+
+
+async def test_client_disconnect_cancels_the_debate():
+    members = [FakeAgent("Optimist", tokens=100, delay=0.01)]
+    connected = asyncio.Event()
+
+    class Request:
+        async def receive(self):
+            await connected.wait()
+            return {"type": "http.disconnect"}
+
+    sse = sse_until_disconnect(Request(), stream_debate(FakeTeam(members, FakeAgent("Judge")), "solar"))
+    assert (await anext(sse)).startswith("event: DebateStarted")
+    connected.set()
+    remaining = [chunk async for chunk in sse]
+    await _settle()
+
+    assert not any("DebateCompleted" in chunk for chunk in remaining)
+    assert members[0].cancelled and members[0].produced < 100
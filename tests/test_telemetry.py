@@ -0,0 +1,78 @@
+import pytest
+from agno.os.settings import AgnoAPISettings
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils.shared import research_cache as research_cache_module
+from utils.shared.research_cache import ResearchCache, research_cache_hook
+from utils.telemetry import spans
+from utils.telemetry.exporters import InMemoryExporter
+from utils.telemetry.instrument import telemetry_tool_hook
+from utils.telemetry.metrics import LatencyHistogram
+from utils.telemetry.router import get_telemetry_router
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = InMemoryExporter()
+    monkeypatch.setattr(spans, "_tracer", spans.Tracer(exporters=[exporter]))
+    monkeypatch.setattr(research_cache_module, "_research_cache", ResearchCache())
+    return exporter
+
+
+def _call_tool(name, fetch, **arguments):
+    # The Judge Team's hook order: telemetry outside, so it sees the cache outcome
+    return telemetry_tool_hook(name, lambda **kwargs: research_cache_hook(name, fetch, kwargs), arguments)
+
+
+def test_tool_spans_record_the_tool_and_cache_status(exporter):
+    fetch = lambda query: f"results for {query}"  # noqa: E731
+    assert _call_tool("duckduckgo_search", fetch, query="fusion") == "results for fusion"
+    assert _call_tool("duckduckgo_search", fetch, query="fusion") == "results for fusion"
+    _call_tool("think", lambda thought: "noted", thought="hmm")
+
+    miss, hit, think = exporter.spans
+    assert (miss.kind, miss.name, miss.attributes["tool"]) == ("tool", "duckduckgo_search", "duckduckgo_search")
+    assert miss.attributes["cache_status"] == "miss"
+    assert miss.attributes["bytes_fetched"] == len("results for fusion")
+    assert hit.attributes["cache_status"] == "hit" and "bytes_fetched" not in hit.attributes
+    assert "cache_status" not in think.attributes
+
+    counters = spans.get_tracer().metrics.snapshot(["tool"])["tool"]["duckduckgo_search"]
+    assert (counters["cache_miss"], counters["cache_hit"], counters["bytes_fetched"]) == (1, 1, len("results for fusion"))
+    assert counters["latency"]["count"] == 2
+
+
+def test_failed_spans_are_marked_as_errors(exporter):
+    with pytest.raises(ValueError):
+        with spans.get_tracer().span("Optimist", "agent"):
+            raise ValueError("boom")
+    assert exporter.spans[0].status == "error" and "boom" in exporter.spans[0].attributes["error"]
+
+
+def test_histogram_quantiles_and_buckets():
+    histogram = LatencyHistogram(buckets=[10, 100, 1000])
+    for duration in [1, 2, 3, 4, 5, 6, 7, 8, 50, 5000]:
+        histogram.observe(duration)
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 10 and summary["max_ms"] == 5000
+    assert summary["mean_ms"] == pytest.approx(508.6)
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (10, 5000, 5000)
+    assert summary["buckets"] == [
+        {"le": 10, "count": 8}, {"le": 100, "count": 1}, {"le": 1000, "count": 0}, {"le": "+Inf", "count": 1},
+    ]
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+def test_latency_endpoint_requires_the_security_key(exporter):
+    with spans.get_tracer().span("Optimist", "agent"):
+        pass
+    app = FastAPI()
+    app.include_router(get_telemetry_router(AgnoAPISettings(os_security_key="secret")))
+    client = TestClient(app)
+
+    assert client.get("/telemetry/latency").status_code == 401
+    response = client.get("/telemetry/latency", params={"kind": "agent"}, headers={"Authorization": "Bearer secret"})
+    assert response.status_code == 200
+    assert response.json()["agent"]["Optimist"]["latency"]["count"] == 1
@@ -0,0 +1,33 @@
+from .cassette import (
+    AsyncCassetteTransport,
+    Cassette,
+    CassetteMiss,
+    CassetteTransport,
+    get_cassette,
+)
+from .runner import (
+    PRESETS,
+    CaseResult,
+    EvalCase,
+    EvalConfig,
+    EvalReport,
+    evaluate,
+    load_cases,
+    resolve_configs,
+)
+
+__all__ = [
+    "AsyncCassetteTransport",
+    "Cassette",
+    "CassetteMiss",
+    "CassetteTransport",
+    "get_cassette",
+    "PRESETS",
+    "CaseResult",
+    "EvalCase",
+    "EvalConfig",
+    "EvalReport",
+    "evaluate",
+    "load_cases",
+    "resolve_configs",
+]
@@ -0,0 +1,178 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any
+
+import httpx
+
+# Hop-by-hop and body-framing headers; a replayed body is always complete and already decoded
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+class CassetteMiss(LookupError):
+    """A replayed request has no recording."""
+
+
+class Cassette:
+    """HTTP exchanges recorded to disk and served back, so an evaluation can be re-run without the network.
+
+    Requests are keyed by method, host, path and body (JSON bodies are canonicalised), so the same prompt
+    replays the same completion whatever the headers or the client's request ids. Recordings are appended to
+    one JSONL file per process, which keeps parallel recorders from interleaving writes; every file in the
+    directory is loaded on replay. With ``replay_latency`` the recorded time to the full response is slept
+    before it is returned, so latency measured on a replay stays comparable with the recording.
+    """
+
+    def __init__(self, directory: str, mode: str = "replay", replay_latency: bool = True):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.directory = directory
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @staticmethod
+    def key(request: httpx.Request) -> str:
+        body = request.content
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True).encode()
+        except (ValueError, UnicodeDecodeError):
+            pass
+        digest = hashlib.sha256(f"{request.method} {request.url.host}{request.url.path}\n".encode() + body)
+        return digest.hexdigest()
+
+    def _load(self):
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(".jsonl"):
+                continue
+            with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A recorder killed mid-write leaves a partial last line
+                        continue
+                    self._entries[entry["key"]] = entry
+
+    def get(self, request: httpx.Request) -> tuple[httpx.Response, float]:
+        """The recorded response and how long to wait before returning it."""
+        key = self.key(request)
+        # put() adds entries from other threads while recording
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if entry is None:
+            raise CassetteMiss(f"No recording for {request.method} {request.url} in {self.directory}")
+        response = httpx.Response(entry["status"], headers=entry["headers"], content=base64.b64decode(entry["body"]), request=request)
+        return response, entry["elapsed"] if self.replay_latency else 0.0
+
+    def put(self, request: httpx.Request, response: httpx.Response, body: bytes, elapsed: float) -> httpx.Response:
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS}
+        entry = {
+            "key": self.key(request),
+            "method": request.method,
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": headers,
+            "body": base64.b64encode(body).decode(),
+            "elapsed": round(elapsed, 4),
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            # Failed calls are passed through but not recorded, so a re-record can fill them in
+            if response.status_code < 400:
+                with open(os.path.join(self.directory, f"cassette-{os.getpid()}.jsonl"), "a", encoding="utf-8") as f:
+                    f.write(line)
+                self._entries[entry["key"]] = entry
+                self.recorded += 1
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    def stats(self) -> dict[str, Any]:
+        return {"mode": self.mode, "entries": len(self._entries), "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """Records the wrapped transport's responses into a cassette, or serves them from it without the network.
+    Recorded responses are read in full before they are returned, so streams arrive in one piece."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.BaseTransport | None = None):
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        if self.cassette.mode == "replay":
+            response, delay = self.cassette.get(request)
+            time.sleep(delay)
+            return response
+        started = time.perf_counter()
+        response = self.transport.handle_request(request)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        return self.cassette.put(request, response, body, time.perf_counter() - started)
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`CassetteTransport`."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.AsyncBaseTransport | None = None):
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        if self.cassette.mode == "replay":
+            response, delay = self.cassette.get(request)
+            await asyncio.sleep(delay)
+            return response
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        return self.cassette.put(request, response, body, time.perf_counter() - started)
+
+    async def aclose(self):
+        if self.transport is not None:
+            await self.transport.aclose()
+
+
+_cassettes: dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(spec: str | None = None) -> Cassette | None:
+    """The process-wide cassette from a spec such as ``record:data/eval/cassette`` or ``replay:<dir>``
+    (default: ``POLYMIND_HTTP_CASSETTE``), or None when HTTP goes to the network as usual."""
+    spec = spec if spec is not None else os.getenv("POLYMIND_HTTP_CASSETTE", "")
+    if not spec:
+        return None
+    with _cassettes_lock:
+        if spec not in _cassettes:
+            mode, _, directory = spec.partition(":")
+            _cassettes[spec] = Cassette(
+                directory or os.path.join("data", "eval", "cassette"),
+                mode=mode,
+                replay_latency=os.getenv("POLYMIND_CASSETTE_REPLAY_LATENCY", "1") != "0",
+            )
+        return _cassettes[spec]
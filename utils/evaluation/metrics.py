@@ -0,0 +1,71 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+# Pairs (or members) that are missing from a run are masked out; a run with nothing to compare scores NaN
+
+
+def pairwise_agreement(members: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Mean pairwise cosine similarity between the members of each run.
+
+    ``members`` is (runs, members, dim) of unit vectors and ``mask`` (runs, members) marks the reports that exist.
+    Returns one score per run.
+    """
+    similarity = np.einsum("rmd,rnd->rmn", members, members)
+    upper = np.triu(np.ones((mask.shape[1], mask.shape[1]), dtype=bool), k=1)
+    pairs = mask[:, :, None] & mask[:, None, :] & upper
+    counts = pairs.sum(axis=(1, 2))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, (similarity * pairs).sum(axis=(1, 2)) / counts, np.nan)
+
+
+def coverage(answers: np.ndarray, members: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """How closely each final answer tracks the member reports it was built from: mean cosine similarity
+    between the answer (runs, dim) and every existing member report (runs, members, dim)."""
+    similarity = np.einsum("rd,rmd->rm", answers, members)
+    counts = mask.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, (similarity * mask).sum(axis=1) / counts, np.nan)
+
+
+def rowwise_similarity(a: np.ndarray, b: np.ndarray, mask: np.ndarray | None = None) -> np.ndarray:
+    """Cosine similarity between matching rows of two (runs, dim) arrays; NaN where ``mask`` is False."""
+    similarity = np.einsum("rd,rd->r", a, b)
+    return similarity if mask is None else np.where(mask, similarity, np.nan)
+
+
+def verdict_agreement(verdicts: Sequence[Sequence[str | None]]) -> np.ndarray:
+    """Share of the members behind the most common stated verdict, per run (NaN when nobody stated one)."""
+    labels = sorted({v for row in verdicts for v in row if v})
+    if not labels:
+        return np.full(len(verdicts), np.nan)
+    width = max((len(row) for row in verdicts), default=0)
+    codes = np.full((len(verdicts), width), -1)
+    for i, row in enumerate(verdicts):
+        codes[i, :len(row)] = [labels.index(v) if v else -1 for v in row]
+    counts = np.stack([(codes == k).sum(axis=1) for k in range(len(labels))], axis=1)
+    stated = (codes >= 0).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(stated > 0, counts.max(axis=1) / stated, np.nan)
+
+
+def pareto_front(quality: Sequence[float], cost: Sequence[float], latency: Sequence[float]) -> list[bool]:
+    """True for configurations no other configuration beats on quality, cost and latency at once."""
+    q, c, t = (np.asarray(x, dtype=float) for x in (quality, cost, latency))
+    q = np.nan_to_num(q, nan=-np.inf)
+    no_worse = (q[None, :] >= q[:, None]) & (c[None, :] <= c[:, None]) & (t[None, :] <= t[:, None])
+    better = (q[None, :] > q[:, None]) | (c[None, :] < c[:, None]) | (t[None, :] < t[:, None])
+    dominated = (no_worse & better).any(axis=1)
+    return [not d for d in dominated]
+
+
+def summarize(values: Sequence[float]) -> dict[str, float | None]:
+    array = np.asarray(values, dtype=float)
+    array = array[~np.isnan(array)]
+    if not array.size:
+        return {"mean": None, "p50": None, "p95": None}
+    return {
+        "mean": round(float(array.mean()), 4),
+        "p50": round(float(np.percentile(array, 50)), 4),
+        "p95": round(float(np.percentile(array, 95)), 4),
+    }
@@ -0,0 +1,366 @@
+import asyncio
+import functools
+import json
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+
+from utils.evaluation.metrics import (
+    coverage,
+    pairwise_agreement,
+    pareto_front,
+    rowwise_similarity,
+    summarize,
+    verdict_agreement,
+)
+
+QUESTIONS_FILE = os.path.join(os.path.dirname(__file__), "questions.jsonl")
+
+# USD per million (prompt, completion) tokens; models missing here are costed at zero
+MODEL_PRICES = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+}
+
+
+@dataclass
+class EvalCase:
+    id: str
+    question: str
+    # Optional gold answer; when present, answers are also scored against it
+    reference: str | None = None
+
+
+@dataclass
+class EvalConfig:
+    """A named JudgeTeam configuration; ``options`` are passed to ``JudgeTeam(...)``."""
+    name: str
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+PRESETS = {
+    "team": EvalConfig("team", {"compact": False}),
+    "team+compact": EvalConfig("team+compact"),
+    "fan_out": EvalConfig("fan_out", {"fan_out": True, "compact": False}),
+    "fan_out+compact": EvalConfig("fan_out+compact", {"fan_out": True}),
+    "routing": EvalConfig("routing", {"routing": True}),
+}
+
+
+@dataclass
+class CaseResult:
+    case_id: str
+    config: str
+    # completed | degraded (some member did not complete, so the answer is not scored) | error
+    status: str
+    latency: float
+    answer: str = ""
+    reports: dict[str, str] = field(default_factory=dict)
+    # fast | full in routing mode
+    route: str | None = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    error: str | None = None
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def load_cases(path: str | None = None, limit: int | None = None) -> list[EvalCase]:
+    """Cases from a JSONL file with ``question`` and optional ``id`` / ``reference`` (default: the bundled set)."""
+    cases = []
+    with open(path or QUESTIONS_FILE, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            cases.append(EvalCase(str(record.get("id") or len(cases) + 1), record["question"], record.get("reference")))
+    return cases[:limit] if limit else cases
+
+
+def resolve_configs(names: Sequence[str]) -> list[EvalConfig]:
+    unknown = [name for name in names if name not in PRESETS]
+    if unknown:
+        raise ValueError(f"Unknown configurations: {', '.join(unknown)} (known: {', '.join(PRESETS)})")
+    return [PRESETS[name] for name in names]
+
+
+def token_cost(model: str | None, prompt_tokens: int, completion_tokens: int) -> float:
+    prompt_price, completion_price = MODEL_PRICES.get(model or "", (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+# -- Worker process --
+
+# Set up once per worker by _init_worker; each worker runs one case at a time, so latencies do not contend
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(backend: str, directory: str | None, mock_options: dict[str, Any]):
+    """Point the worker's model and tool traffic at the chosen backend before anything imports agno.
+
+    - ``mock``: a local mock OpenAI endpoint and fake research tools (no network, no API key)
+    - ``record``: live calls, with LLM responses written to an HTTP cassette and tool results to a disk cache
+    - ``replay``: the cassette and tool cache from an earlier ``record`` run, without the network
+    - ``live``: live calls, nothing recorded
+    """
+    # Every case must really run; a response cache would score one configuration's answers as another's
+    os.environ["POLYMIND_RESPONSE_CACHE"] = "off"
+    if backend == "mock":
+        from scripts.loadtest.mock_openai import MockOpenAIServer
+        from scripts.loadtest.mock_tools import (
+            FakeResearchBackend,
+            mock_judge_tools,
+            offline_registry,
+        )
+
+        server = MockOpenAIServer(port=0, **mock_options).start()
+        os.environ["OPENAI_BASE_URL"] = server.base_url
+        os.environ["OPENAI_API_KEY"] = "mock"
+        tools = FakeResearchBackend(latency=mock_options.get("latency", 0.3) / 2)
+        _worker.update(server=server, registry=offline_registry(tools), judge_tools=functools.partial(mock_judge_tools, tools))
+    elif backend in ("record", "replay"):
+        directory = directory or os.path.join("data", "eval", "cassette")
+        os.environ["POLYMIND_HTTP_CASSETTE"] = f"{backend}:{os.path.join(directory, 'llm')}"
+        # Research tools do their own HTTP, so their results are recorded through the research cache instead
+        os.environ["POLYMIND_RESEARCH_CACHE"] = "disk"
+        os.environ["POLYMIND_RESEARCH_CACHE_DIR"] = os.path.join(directory, "tools")
+        os.environ["POLYMIND_RESEARCH_CACHE_TTL"] = "0"
+        os.environ["POLYMIND_RESEARCH_CACHE_SIZE"] = "1000000"
+        if backend == "replay":
+            os.environ.setdefault("OPENAI_API_KEY", "replay")
+    elif backend != "live":
+        raise ValueError(f"Unknown evaluation backend: {backend}")
+
+    from utils.telemetry import InMemoryExporter, Tracer, set_tracer
+
+    exporter = InMemoryExporter()
+    set_tracer(Tracer([exporter]))
+    _worker.update(exporter=exporter, teams={})
+
+
+def _team(config: EvalConfig):
+    teams = _worker["teams"]
+    if config.name not in teams:
+        from src.teams.judge.judge_team import JudgeTeam
+
+        options = dict(config.options)
+        if "registry" in _worker:
+            options.setdefault("registry", _worker["registry"])
+            options.setdefault("tools", _worker["judge_tools"])
+        teams[config.name] = JudgeTeam(**options)
+    return teams[config.name]
+
+
+def _member_reports(response) -> dict[str, str]:
+    metadata = getattr(response, "metadata", None) or {}
+    if metadata.get("member_reports"):
+        return {r["name"]: r["content"] or "" for r in metadata["member_reports"]}
+    # Team mode: the members' runs hang off the team's response
+    return {
+        (getattr(r, "agent_name", None) or getattr(r, "agent_id", None) or f"member_{i}"): str(getattr(r, "content", "") or "")
+        for i, r in enumerate(getattr(response, "member_responses", None) or [])
+    }
+
+
+def _status(response) -> tuple[str, str | None]:
+    """(status, error) of a finished run: fan-out and routed runs that lost a member report are degraded."""
+    status = getattr(response, "status", None)
+    if str(getattr(status, "value", status)).lower() == "error":
+        return "error", str(response.content)
+    missing = [
+        f"{r['name']}: {r['status']}"
+        for r in (getattr(response, "metadata", None) or {}).get("member_reports") or []
+        if r.get("status") != "completed"
+    ]
+    return ("degraded", ", ".join(missing)) if missing else ("completed", None)
+
+
+def run_case(case: EvalCase, config: EvalConfig) -> CaseResult:
+    """Run one case under one configuration in this worker and account its tokens from the telemetry spans."""
+    exporter = _worker["exporter"]
+    exporter.spans.clear()
+    started = time.perf_counter()
+    try:
+        response = asyncio.run(_team(config).arun(case.question))
+    except Exception as e:
+        return CaseResult(case.id, config.name, "error", time.perf_counter() - started, error=repr(e))
+    latency = time.perf_counter() - started
+
+    status, error = _status(response)
+    result = CaseResult(
+        case.id,
+        config.name,
+        status,
+        latency,
+        answer=str(response.content or ""),
+        reports=_member_reports(response),
+        route=((response.metadata or {}).get("routing") or {}).get("path"),
+        error=error,
+    )
+    for span in exporter.spans:
+        if span.kind not in ("agent", "judge", "team"):
+            continue
+        prompt_tokens = int(span.attributes.get("prompt_tokens") or 0)
+        completion_tokens = int(span.attributes.get("completion_tokens") or 0)
+        result.prompt_tokens += prompt_tokens
+        result.completion_tokens += completion_tokens
+        result.cost += token_cost(span.attributes.get("model"), prompt_tokens, completion_tokens)
+    return result
+
+
+# -- Scoring --
+
+def score(results: list[CaseResult], cases: Sequence[EvalCase], baseline: str, embedder=None) -> list[dict[str, Any]]:
+    """Per-result quality metrics, computed for all results at once over stacked embeddings.
+
+    - ``agreement``: mean pairwise similarity of the member reports (inter-agent agreement)
+    - ``verdict_agreement``: share of members behind the majority ``Verdict:`` line, where they state one
+    - ``coverage``: mean similarity between the final answer and each member report
+    - ``baseline_similarity``: similarity to the baseline configuration's answer to the same case
+    - ``reference_similarity``: similarity to the case's reference answer, when it has one
+    """
+    from src.teams.judge.routing import extract_verdict
+
+    if embedder is None:
+        from utils.retrieval.embeddings import HashingEmbedder
+
+        embedder = HashingEmbedder()
+    completed = [r for r in results if r.status == "completed"]
+    if not completed:
+        return []
+
+    names = sorted({name for r in completed for name in r.reports})
+    runs, width = len(completed), max(len(names), 1)
+    report_texts = [r.reports.get(name, "") for r in completed for name in names] if names else [""] * runs
+    members = embedder.embed(report_texts).reshape(runs, width, -1)
+    mask = np.array([[bool(r.reports.get(name)) for name in names] or [False] for r in completed])
+    answers = embedder.embed([r.answer for r in completed])
+
+    baseline_answers = {r.case_id: r.answer for r in completed if r.config == baseline}
+    has_baseline = np.array([r.case_id in baseline_answers for r in completed])
+    baseline_vectors = embedder.embed([baseline_answers.get(r.case_id, "") for r in completed])
+    references = {c.id: c.reference for c in cases if c.reference}
+    has_reference = np.array([r.case_id in references for r in completed])
+    reference_vectors = embedder.embed([references.get(r.case_id, "") for r in completed])
+
+    metrics = {
+        "agreement": pairwise_agreement(members, mask),
+        "verdict_agreement": verdict_agreement([[extract_verdict(r.reports.get(name, "")) for name in names] for r in completed]),
+        "coverage": coverage(answers, members, mask),
+        "baseline_similarity": rowwise_similarity(answers, baseline_vectors, has_baseline),
+        "reference_similarity": rowwise_similarity(answers, reference_vectors, has_reference),
+    }
+    return [
+        {"case_id": r.case_id, "config": r.config, **{key: _number(values[i]) for key, values in metrics.items()}}
+        for i, r in enumerate(completed)
+    ]
+
+
+def _number(value) -> float | None:
+    return None if value is None or np.isnan(value) else round(float(value), 4)
+
+
+def _values(rows: list[dict[str, Any]], key: str) -> list[float]:
+    return [row[key] if row[key] is not None else np.nan for row in rows]
+
+
+def quality(row: dict[str, Any]) -> float | None:
+    """The headline quality score: agreement with the reference when there is one, else with the baseline."""
+    return row["reference_similarity"] if row["reference_similarity"] is not None else row["baseline_similarity"]
+
+
+@dataclass
+class EvalReport:
+    backend: str
+    baseline: str
+    configs: list[dict[str, Any]]
+    cases: list[dict[str, Any]]
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def summarize_results(results: list[CaseResult], cases: Sequence[EvalCase], configs: Sequence[EvalConfig],
+                      backend: str, embedder=None) -> EvalReport:
+    baseline = configs[0].name
+    scores = {(row["case_id"], row["config"]): row for row in score(results, cases, baseline, embedder)}
+    summaries = []
+    for config in configs:
+        rows = [r for r in results if r.config == config.name]
+        completed = [r for r in rows if r.status == "completed"]
+        degraded = sum(r.status == "degraded" for r in rows)
+        scored = [scores[(r.case_id, r.config)] for r in completed]
+        routed = [r.route for r in completed if r.route]
+
+        summaries.append({
+            "config": config.name,
+            "options": config.options,
+            "cases": len(rows),
+            "errors": len(rows) - len(completed) - degraded,
+            "degraded": degraded,
+            "latency": summarize([r.latency for r in completed]),
+            "tokens": summarize([r.prompt_tokens + r.completion_tokens for r in completed])["mean"],
+            "cost": summarize([r.cost for r in completed])["mean"],
+            "quality": summarize([q if q is not None else np.nan for q in map(quality, scored)])["mean"],
+            **{key: summarize(_values(scored, key))["mean"] for key in
+               ("agreement", "verdict_agreement", "coverage", "baseline_similarity", "reference_similarity")},
+            "fast_path_share": round(routed.count("fast") / len(routed), 4) if routed else None,
+        })
+
+    front = pareto_front(
+        [s["quality"] if s["quality"] is not None else np.nan for s in summaries],
+        [s["cost"] if s["cost"] is not None else np.inf for s in summaries],
+        [s["latency"]["p50"] if s["latency"]["p50"] is not None else np.inf for s in summaries],
+    )
+    for summary, on_front in zip(summaries, front, strict=True):
+        summary["frontier"] = on_front
+
+    rows = [{**r.to_dict(), **scores.get((r.case_id, r.config), {})} for r in results]
+    return EvalReport(backend, baseline, summaries, rows)
+
+
+def evaluate(
+    cases: Sequence[EvalCase],
+    configs: Sequence[EvalConfig],
+    backend: str = "mock",
+    workers: int | None = None,
+    directory: str | None = None,
+    mock_options: dict[str, Any] | None = None,
+    embedder=None,
+    on_result: Callable[[CaseResult], None] | None = None,
+) -> EvalReport:
+    """Run every case under every configuration on a process pool and report quality next to latency and cost.
+
+    The first configuration is the baseline the others' answers are compared with. Each worker process runs
+    one case at a time, so a case's latency is not inflated by the other cases sharing its event loop; workers
+    are spawned rather than forked, since agno and httpx hold threads and locks that a fork would copy.
+    """
+    if not configs:
+        raise ValueError("At least one configuration is required")
+    jobs = [(case, config) for case in cases for config in configs]
+    workers = workers or min(len(jobs), os.cpu_count() or 1) or 1
+    results: list[CaseResult] = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(backend, directory, mock_options or {}),
+    ) as pool:
+        futures = [pool.submit(run_case, case, config) for case, config in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    order = {(case.id, config.name): i for i, (case, config) in enumerate(jobs)}
+    results.sort(key=lambda r: order[(r.case_id, r.config)])
+    return summarize_results(results, cases, configs, backend, embedder)
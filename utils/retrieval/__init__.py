@@ -0,0 +1,9 @@
+# The LanceDB store lives in utils.retrieval.store and is imported explicitly, keeping lancedb off the import path
+# of modules that only need embeddings
+from .embeddings import HashingEmbedder, SentenceTransformerEmbedder, get_embedder
+
+__all__ = [
+    "HashingEmbedder",
+    "SentenceTransformerEmbedder",
+    "get_embedder",
+]
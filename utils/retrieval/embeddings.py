@@ -0,0 +1,82 @@
+import hashlib
+import os
+import re
+from collections.abc import Sequence
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder based on feature hashing.
+
+    It needs no model download or network access, so it is the default for offline runs and tests. Unigrams and
+    bigrams are hashed into ``dim`` signed buckets and the result is L2-normalised, so dot product == cosine.
+    """
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    @property
+    def name(self) -> str:
+        return f"hashing-{self.dim}"
+
+    @property
+    def spec(self) -> str:
+        """The :func:`get_embedder` spec that rebuilds this embedder."""
+        return f"hashing:{self.dim}"
+
+    def _bucket(self, token: str):
+        digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self.dim, 1.0 if (value >> 63) & 1 else -1.0
+
+    def embed_one(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:], strict=False)]:
+            index, sign = self._bucket(feature)
+            vector[index] += sign
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack([self.embed_one(text) for text in texts])
+
+
+class SentenceTransformerEmbedder:
+    """Local sentence-transformers model. Requires the optional ``sentence-transformers`` package."""
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", device: str | None = None):
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name
+        self.model = SentenceTransformer(model_name, device=device)
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    @property
+    def name(self) -> str:
+        return f"st-{self.model_name}"
+
+    @property
+    def spec(self) -> str:
+        return f"sentence-transformers:{self.model_name}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return self.model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+
+
+def get_embedder(spec: str | None = None):
+    """Build an embedder from a spec such as ``hashing``, ``hashing:768`` or ``sentence-transformers:all-MiniLM-L6-v2``."""
+    spec = spec or os.getenv("POLYMIND_EMBEDDER", "hashing")
+    kind, _, arg = spec.partition(":")
+    if kind == "hashing":
+        return HashingEmbedder(dim=int(arg) if arg else 384)
+    if kind == "sentence-transformers":
+        return SentenceTransformerEmbedder(arg or "all-MiniLM-L6-v2")
+    raise ValueError(f"Unknown embedder: {spec}")
@@ -0,0 +1,335 @@
+import hashlib
+import json
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+from agno.utils.log import log_warning
+
+from utils.retrieval.embeddings import get_embedder
+from utils.retrieval.store import KnowledgeStore
+
+TEXT_EXTENSIONS = (".txt", ".md", ".markdown", ".rst", ".jsonl")
+READ_BLOCK = 1 << 16
+MANIFEST_VERSION = 2
+
+
+# ---------------------------------------------------------------------------
+# Discovery and chunking. Everything here is a generator so only one block of
+# one file is held in memory at a time, whatever the size of the corpus.
+# ---------------------------------------------------------------------------
+
+def iter_files(root: str, extensions: Sequence[str] = TEXT_EXTENSIONS) -> Iterator[str]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(tuple(extensions)):
+                yield os.path.join(dirpath, name)
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_text_blocks(path: str) -> Iterator[str]:
+    if path.lower().endswith(".jsonl"):
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield str(json.loads(line).get("text", "")) + "\n\n"
+                    except (json.JSONDecodeError, AttributeError):
+                        continue
+        return
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        yield from iter(lambda: f.read(READ_BLOCK), "")
+
+
+def iter_chunks(blocks: Iterator[str], chunk_size: int = 1000, overlap: int = 200) -> Iterator[str]:
+    """Split a stream of text blocks into ~``chunk_size`` character chunks, breaking on whitespace where possible."""
+    buffer = ""
+    for block in blocks:
+        buffer += block
+        while len(buffer) >= chunk_size:
+            cut = buffer.rfind(" ", chunk_size // 2, chunk_size)
+            cut = chunk_size if cut == -1 else cut
+            chunk = buffer[:cut].strip()
+            if chunk:
+                yield chunk
+            buffer = buffer[max(cut - overlap, 0) if overlap < cut else cut:]
+    tail = buffer.strip()
+    if tail:
+        yield tail
+
+
+# ---------------------------------------------------------------------------
+# Manifest of what has already been ingested, keyed by path relative to the raw root
+# ---------------------------------------------------------------------------
+
+class Manifest:
+    """Ingested files, plus the embedder that produced their vectors (one table holds one vector space)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        # {"name": ..., "dim": ...} of the embedder; None until the first run records it
+        self.embedder: dict | None = None
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.entries = data["files"]
+                self.embedder = data["embedder"]
+            else:
+                # Manifests written before the embedder was recorded are a bare {source: entry} mapping
+                self.entries = data
+
+    def is_current(self, source: str, stat: os.stat_result) -> bool:
+        entry = self.entries.get(source)
+        return entry is not None and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime
+
+    def digest_matches(self, source: str, digest: str) -> bool:
+        entry = self.entries.get(source)
+        return entry is not None and entry["sha256"] == digest
+
+    def mark(self, source: str, digest: str, stat: os.stat_result, chunks: int):
+        self.entries[source] = {"sha256": digest, "size": stat.st_size, "mtime": stat.st_mtime, "chunks": chunks}
+
+    def mark_partial(self, source: str):
+        self.entries[source] = {"sha256": None, "size": -1, "mtime": -1, "chunks": 0}
+
+    def touch(self, source: str, stat: os.stat_result):
+        self.entries[source].update(size=stat.st_size, mtime=stat.st_mtime)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "embedder": self.embedder, "files": self.entries}, f)
+        os.replace(tmp_path, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Embedding workers
+# ---------------------------------------------------------------------------
+
+_worker_embedder = None
+
+
+def _init_worker(embedder_spec: str | None):
+    global _worker_embedder
+    _worker_embedder = get_embedder(embedder_spec)
+
+
+def _embed_texts(texts: list[str]) -> np.ndarray:
+    return _worker_embedder.embed(texts)
+
+
+class _InlineExecutor:
+    """Runs embedding in the calling process (``workers=0``), mainly for debugging and small corpora."""
+
+    def __init__(self, embedder_spec: str | None):
+        _init_worker(embedder_spec)
+
+    def submit(self, fn, *args) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait: bool = True):
+        pass
+
+
+@dataclass
+class IngestStats:
+    files_seen: int = 0
+    files_skipped: int = 0
+    files_ingested: int = 0
+    files_removed: int = 0
+    chunks_written: int = 0
+    sources: list[str] = field(default_factory=list)
+
+    def to_dict(self):
+        return {k: v for k, v in self.__dict__.items() if k != "sources"}
+
+
+class IngestionPipeline:
+    """Incrementally mirrors ``raw_dir`` into a LanceDB table.
+
+    Unchanged files (same size and mtime, or same content hash) are skipped; modified files have their old chunks
+    deleted and are re-embedded. Chunks are embedded in fixed-size batches on a process pool with a bounded number
+    of batches in flight, and written to LanceDB in bulk, so memory stays flat regardless of corpus size.
+
+    The manifest records the embedder (name and dimension) behind the table. A run with a different embedder
+    raises instead of mixing two vector spaces in one table, unless ``reembed`` is set, in which case the table
+    is dropped and the whole corpus is embedded again.
+    """
+
+    def __init__(
+        self,
+        raw_dir: str = os.path.join("data", "raw"),
+        manifest_path: str = os.path.join("data", "processed", "manifest.json"),
+        store: KnowledgeStore | None = None,
+        embedder_spec: str | None = None,
+        workers: int | None = None,
+        batch_size: int = 256,
+        write_batch_size: int = 4096,
+        chunk_size: int = 1000,
+        overlap: int = 200,
+        reembed: bool = False,
+    ):
+        self.raw_dir = raw_dir
+        self.manifest = Manifest(manifest_path)
+        self.embedder_spec = embedder_spec
+        self.store = store or KnowledgeStore(embedder=get_embedder(embedder_spec))
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.write_batch_size = write_batch_size
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.reembed = reembed
+
+    def check_embedder(self):
+        """Record the store's embedder in the manifest, or handle a switch to a different one."""
+        embedder = {"name": self.store.embedder.name, "dim": self.store.embedder.dim}
+        previous = self.manifest.embedder
+        if previous is None:
+            # Nothing recorded (a new or pre-embedder manifest): an existing table is kept only if its dimension fits
+            dim = self.store.dimension()
+            previous = embedder if dim in (None, embedder["dim"]) else {"name": "unknown", "dim": dim}
+        if previous != embedder:
+            if not self.reembed:
+                raise ValueError(
+                    f"{self.store.table_name} was embedded with {previous['name']} ({previous['dim']} dims), not "
+                    f"{embedder['name']} ({embedder['dim']} dims); re-run with reembed=True (--reembed) to rebuild it"
+                )
+            log_warning(f"Embedder changed from {previous['name']} to {embedder['name']}; re-embedding every file")
+            self.store.reset()
+            self.manifest.entries.clear()
+        if self.manifest.embedder != embedder:
+            self.manifest.embedder = embedder
+            self.manifest.save()
+
+    def changed_files(self, stats: IngestStats) -> Iterator[tuple[str, str, str, os.stat_result]]:
+        """Yield (path, source, digest, stat) for new or modified files."""
+        for path in iter_files(self.raw_dir):
+            source = os.path.relpath(path, self.raw_dir)
+            stats.files_seen += 1
+            stats.sources.append(source)
+            stat = os.stat(path)
+            if self.manifest.is_current(source, stat):
+                stats.files_skipped += 1
+                continue
+            digest = file_digest(path)
+            if self.manifest.digest_matches(source, digest):
+                # Touched but not modified
+                self.manifest.touch(source, stat)
+                stats.files_skipped += 1
+                continue
+            yield path, source, digest, stat
+
+    def iter_batches(self, stats: IngestStats) -> Iterator[tuple[list[dict], list[tuple]]]:
+        """Yield (records, finished_files) where finished_files are the files whose last chunk is in ``records``."""
+        records: list[dict] = []
+        finished: list[tuple] = []
+        for path, source, digest, stat in self.changed_files(stats):
+            if source in self.manifest.entries:
+                self.store.delete_source(source)
+            count = 0
+            for count, text in enumerate(iter_chunks(iter_text_blocks(path), self.chunk_size, self.overlap), start=1):
+                records.append({"id": f"{digest[:16]}:{count - 1}", "source": source, "chunk": count - 1, "text": text})
+                if len(records) >= self.batch_size:
+                    yield records, finished
+                    records, finished = [], []
+            finished.append((source, digest, stat, count))
+            stats.files_ingested += 1
+        if records or finished:
+            yield records, finished
+
+    def run(self, prune: bool = True, prune_all: bool = False) -> IngestStats:
+        """Ingest new and modified files and, with ``prune``, remove the chunks of files no longer in ``raw_dir``.
+
+        A ``raw_dir`` that is missing raises, and one without any documents is not taken to mean "delete
+        everything" (a wrong path or an unmounted volume looks the same) unless ``prune_all`` is set.
+        """
+        if not os.path.isdir(self.raw_dir):
+            raise FileNotFoundError(f"Raw document directory not found: {self.raw_dir}")
+        self.check_embedder()
+        stats = IngestStats()
+        if self.workers > 0:
+            # lance is not fork-safe, so workers are spawned
+            executor = ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.embedder_spec,),
+            )
+        else:
+            executor = _InlineExecutor(self.embedder_spec)
+        in_flight: deque = deque()
+        pending_records: list[dict] = []
+        pending_vectors: list[np.ndarray] = []
+        pending_files: list[tuple] = []
+
+        def flush():
+            if pending_records:
+                # Register sources before their first write so a crash mid-file leads to a clean re-ingest, not duplicates
+                new_sources = {r["source"] for r in pending_records} - self.manifest.entries.keys()
+                if new_sources:
+                    for source in new_sources:
+                        self.manifest.mark_partial(source)
+                    self.manifest.save()
+                self.store.add_embedded(pending_records, np.concatenate(pending_vectors))
+                stats.chunks_written += len(pending_records)
+            # Only record a file in the manifest once all of its chunks are durably written
+            for source, digest, stat, count in pending_files:
+                self.manifest.mark(source, digest, stat, count)
+            if pending_records or pending_files:
+                self.manifest.save()
+            pending_records.clear()
+            pending_vectors.clear()
+            pending_files.clear()
+
+        def drain_one():
+            future, records, finished = in_flight.popleft()
+            if records:
+                pending_records.extend(records)
+                pending_vectors.append(future.result())
+            pending_files.extend(finished)
+            if len(pending_records) >= self.write_batch_size:
+                flush()
+
+        try:
+            for records, finished in self.iter_batches(stats):
+                future = executor.submit(_embed_texts, [r["text"] for r in records]) if records else None
+                in_flight.append((future, records, finished))
+                while len(in_flight) > max(self.workers, 1) * 2:
+                    drain_one()
+            while in_flight:
+                drain_one()
+            flush()
+        finally:
+            executor.shutdown(wait=True)
+
+        if prune:
+            seen = set(stats.sources)
+            if not seen and self.manifest.entries and not prune_all:
+                raise ValueError(
+                    f"No documents found in {self.raw_dir}; refusing to prune all {len(self.manifest.entries)} "
+                    "ingested files (pass prune_all=True / --prune-all if that is intended)"
+                )
+            for source in [s for s in self.manifest.entries if s not in seen]:
+                self.store.delete_source(source)
+                del self.manifest.entries[source]
+                stats.files_removed += 1
+        self.manifest.save()
+        return stats
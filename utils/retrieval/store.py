@@ -0,0 +1,197 @@
+import os
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+import lancedb
+import numpy as np
+import pyarrow as pa
+
+from utils.retrieval.embeddings import get_embedder
+
+DEFAULT_TABLE = "knowledge"
+
+# Schema metadata key holding the get_embedder() spec of the embedder that built the table
+EMBEDDER_METADATA_KEY = b"polymind.embedder"
+
+# IVF-PQ needs enough rows to train its codebooks; below this a flat scan is both exact and fast enough
+MIN_ROWS_FOR_INDEX = 4096
+
+
+def knowledge_schema(dim: int, embedder_spec: str | None = None) -> pa.Schema:
+    schema = pa.schema([
+        pa.field("id", pa.string()),
+        pa.field("source", pa.string()),
+        pa.field("chunk", pa.int32()),
+        pa.field("text", pa.string()),
+        pa.field("vector", pa.list_(pa.float32(), dim)),
+    ])
+    return schema.with_metadata({EMBEDDER_METADATA_KEY: embedder_spec.encode()}) if embedder_spec else schema
+
+
+class KnowledgeStore:
+    """On-disk LanceDB table of embedded document chunks with batched top-k search.
+
+    The table records the embedder that built it. Without an explicit ``embedder`` the store embeds queries with
+    that one (``POLYMIND_EMBEDDER`` only applies to a new table); with a different one, searches and writes
+    raise, since vectors from two models are not comparable even when their dimensions match.
+    """
+
+    def __init__(self, path: str | None = None, table_name: str = DEFAULT_TABLE, embedder=None):
+        self.path = path or os.getenv("LANCEDB_PATH", os.path.join("data", "lancedb"))
+        self.table_name = table_name
+        self._embedder = embedder
+        self.db = lancedb.connect(self.path)
+        self._table = None
+        self._checked = False
+        self._lock = threading.Lock()
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            self._embedder = get_embedder(self.recorded_embedder())
+        return self._embedder
+
+    @property
+    def table(self):
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    if self.table_name in self.db.table_names():
+                        self._table = self.db.open_table(self.table_name)
+                    else:
+                        schema = knowledge_schema(self.embedder.dim, getattr(self.embedder, "spec", None))
+                        self._table = self.db.create_table(self.table_name, schema=schema)
+        return self._table
+
+    def exists(self) -> bool:
+        return self._table is not None or self.table_name in self.db.table_names()
+
+    def dimension(self) -> int | None:
+        """Vector dimension of the existing table, or None when it has not been created yet."""
+        if not self.exists():
+            return None
+        return self.table.schema.field("vector").type.list_size
+
+    def recorded_embedder(self) -> str | None:
+        """The embedder spec stored with the table; None for a missing table or one built before it was recorded."""
+        if not self.exists():
+            return None
+        spec = (self.table.schema.metadata or {}).get(EMBEDDER_METADATA_KEY)
+        return spec.decode() if spec else None
+
+    def check_embedder(self):
+        """Raise if the table was built by a different embedder than the one this store embeds with."""
+        if self._checked:
+            return
+        recorded, spec = self.recorded_embedder(), getattr(self.embedder, "spec", None)
+        if recorded is not None and spec is not None and recorded != spec:
+            raise ValueError(f"{self.table_name} was embedded with {recorded}, not {spec}; query it with the same embedder")
+        dim = self.dimension()
+        if dim is not None and dim != self.embedder.dim:
+            raise ValueError(f"{self.table_name} holds {dim}-dim vectors, but {self.embedder.name} produces {self.embedder.dim}")
+        self._checked = True
+
+    def reset(self):
+        """Drop the table; the next write recreates it for the current embedder."""
+        with self._lock:
+            if self.table_name in self.db.table_names():
+                self.db.drop_table(self.table_name)
+            self._table = None
+            self._checked = False
+
+    def count(self) -> int:
+        return self.table.count_rows()
+
+    def add(self, records: Sequence[dict[str, Any]], batch_size: int = 256):
+        """Embed and append ``records`` (dicts with id, source, chunk and text) in batches."""
+        for start in range(0, len(records), batch_size):
+            batch = list(records[start:start + batch_size])
+            vectors = self.embedder.embed([r["text"] for r in batch])
+            self.add_embedded(batch, vectors)
+
+    def add_embedded(self, records: Sequence[dict[str, Any]], vectors: np.ndarray):
+        """Append records whose vectors were computed elsewhere (e.g. by the ingestion worker pool) in one write."""
+        if not records:
+            return
+        self.check_embedder()
+        dim = vectors.shape[1]
+        data = pa.table({
+            "id": [r["id"] for r in records],
+            "source": [r["source"] for r in records],
+            "chunk": pa.array([r["chunk"] for r in records], pa.int32()),
+            "text": [r["text"] for r in records],
+            "vector": pa.FixedSizeListArray.from_arrays(pa.array(vectors.astype(np.float32).ravel()), dim),
+        })
+        self.table.add(data)
+
+    def delete_source(self, source: str):
+        self.table.delete(f"source = '{source.replace(chr(39), chr(39) * 2)}'")
+
+    def create_index(self, index_type: str = "IVF_PQ", metric: str = "cosine", force: bool = False, **kwargs):
+        """Build an ANN index (``IVF_PQ`` or ``IVF_HNSW_SQ``). Skipped for small tables unless ``force`` is set."""
+        rows = self.count()
+        if rows < MIN_ROWS_FOR_INDEX and not force:
+            return False
+        if index_type == "IVF_PQ":
+            kwargs.setdefault("num_partitions", max(1, min(int(np.sqrt(rows)), 1024)))
+            kwargs.setdefault("num_sub_vectors", _num_sub_vectors(self.embedder.dim))
+        self.table.create_index(metric=metric, index_type=index_type, vector_column_name="vector", replace=True, **kwargs)
+        return True
+
+    def has_index(self) -> bool:
+        return self.exists() and any(index.columns == ["vector"] for index in self.table.list_indices())
+
+    def update_index(self, index_type: str = "IVF_PQ", rebuild: bool = False, **kwargs) -> str:
+        """Bring the ANN index up to date after a write; returns built | optimized | skipped.
+
+        The index is trained when the table has none yet (or on ``rebuild``, e.g. after a re-embed). Otherwise
+        ``optimize()`` adds the new rows to the existing index and compacts small fragments, which is
+        incremental, instead of retraining the partitions and codebooks over the whole table.
+        """
+        if rebuild or not self.has_index():
+            return "built" if self.create_index(index_type, **kwargs) else "skipped"
+        self.table.optimize()
+        return "optimized"
+
+    def search(self, query: str, k: int = 5, **kwargs) -> list[dict[str, Any]]:
+        return self.search_batch([query], k=k, **kwargs)[0]
+
+    def search_batch(self, queries: Sequence[str], k: int = 5, nprobes: int = 20, refine_factor: int | None = None,
+                     where: str | None = None) -> list[list[dict[str, Any]]]:
+        """Top-k for many queries with a single embedding call and a single LanceDB query."""
+        if not queries:
+            return []
+        self.check_embedder()
+        vectors = self.embedder.embed(list(queries))
+        query = self.table.search(vectors, vector_column_name="vector").distance_type("cosine").limit(k).nprobes(nprobes)
+        if refine_factor:
+            query = query.refine_factor(refine_factor)
+        if where:
+            query = query.where(where, prefilter=True)
+        rows = query.select(["id", "source", "chunk", "text", "_distance"]).to_arrow().to_pylist()
+
+        results: list[list[dict[str, Any]]] = [[] for _ in queries]
+        for row in rows:
+            # Single-vector queries come back without a query_index column
+            results[row.pop("query_index", 0)].append(row)
+        return results
+
+
+def _num_sub_vectors(dim: int) -> int:
+    for candidate in (96, 64, 48, 32, 24, 16, 8, 4, 2, 1):
+        if dim % candidate == 0 and dim // candidate >= 8:
+            return candidate
+    return 1
+
+
+_stores: dict[str, KnowledgeStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_knowledge_store(path: str | None = None, table_name: str = DEFAULT_TABLE) -> KnowledgeStore:
+    key = f"{path or os.getenv('LANCEDB_PATH', '')}:{table_name}"
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = KnowledgeStore(path=path, table_name=table_name)
+        return _stores[key]
@@ -0,0 +1,38 @@
+from .cache import DiskBackend, MemoryBackend, RedisBackend, SqliteBackend, make_backend
+from .http import (
+    HostPolicy,
+    TokenBucket,
+    get_async_http_client,
+    get_host_policy,
+    get_http_client,
+    set_host_policy,
+)
+from .research_cache import (
+    ResearchCache,
+    get_research_cache,
+    research_cache_hook,
+    set_research_cache,
+)
+from .response_cache import ResponseCache, cached_run, get_response_cache, set_response_cache
+
+__all__ = [
+    "DiskBackend",
+    "MemoryBackend",
+    "RedisBackend",
+    "SqliteBackend",
+    "make_backend",
+    "HostPolicy",
+    "TokenBucket",
+    "get_async_http_client",
+    "get_host_policy",
+    "get_http_client",
+    "set_host_policy",
+    "ResearchCache",
+    "get_research_cache",
+    "research_cache_hook",
+    "set_research_cache",
+    "ResponseCache",
+    "cached_run",
+    "get_response_cache",
+    "set_response_cache",
+]
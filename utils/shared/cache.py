@@ -0,0 +1,218 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Sentinel returned on a cache miss so that falsy values (None, "", []) can still be cached
+MISSING = object()
+
+
+class MemoryBackend:
+    """In-process cache with per-entry TTL and LRU eviction."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskBackend:
+    """Pickle-per-entry cache on disk, shared between worker processes on the same node."""
+
+    def __init__(self, directory: str, max_entries: int = 10000):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + ".pkl")
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return MISSING
+        if expires_at is not None and expires_at < time.time():
+            self._remove(path)
+            return MISSING
+        # Touch the file so the mtime doubles as the LRU clock
+        os.utime(path, None)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        expires_at = time.time() + ttl if ttl else None
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((expires_at, value), f)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def delete(self, key: str):
+        self._remove(self._path(key))
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                self._remove(os.path.join(self.directory, name))
+
+    def _evict(self):
+        entries = [e for e in os.scandir(self.directory) if e.name.endswith(".pkl")]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[: len(entries) - self.max_entries]:
+            self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def __len__(self):
+        return sum(1 for name in os.listdir(self.directory) if name.endswith(".pkl"))
+
+
+class RedisBackend:
+    """Redis-backed cache shared across nodes. LRU is left to the server's maxmemory-policy."""
+
+    def __init__(self, url: str | None = None, prefix: str = "polymind:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url or os.getenv("REDIS_URL", "redis://localhost:6379"))
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return MISSING
+        return pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=int(ttl) if ttl else None)
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+    def __len__(self):
+        return sum(1 for _ in self.client.scan_iter(match=self.prefix + "*"))
+
+
+class SqliteBackend:
+    """Cache table stored alongside agno's session tables, reusing the engine of an agno ``SqliteDb``."""
+
+    def __init__(self, db=None, db_file: str | None = None, table: str = "polymind_cache", max_entries: int = 10000):
+        from sqlalchemy import text
+
+        if db is None and db_file is None:
+            from utils.shared.session_db import get_session_db
+
+            # Same database and (WAL-mode) engine as the session storage
+            db = get_session_db()
+        elif db is None:
+            from agno.db.sqlite import SqliteDb
+
+            db = SqliteDb(db_file=db_file)
+        self.engine = db.db_engine
+        self.table = table
+        self.max_entries = max_entries
+        self._text = text
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+            ))
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)"))
+
+    def get(self, key: str) -> Any:
+        now = time.time()
+        with self.engine.begin() as conn:
+            row = conn.execute(
+                self._text(f"SELECT value, expires_at FROM {self.table} WHERE key = :key"), {"key": key}
+            ).fetchone()
+            if row is None:
+                return MISSING
+            if row.expires_at is not None and row.expires_at < now:
+                conn.execute(self._text(f"DELETE FROM {self.table} WHERE key = :key"), {"key": key})
+                return MISSING
+            conn.execute(self._text(f"UPDATE {self.table} SET accessed_at = :now WHERE key = :key"), {"now": now, "key": key})
+        return pickle.loads(row.value)
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        now = time.time()
+        with self.engine.begin() as conn:
+            conn.execute(
+                self._text(f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) VALUES (:key, :value, :expires_at, :now)"),
+                {"key": key, "value": pickle.dumps(value), "expires_at": now + ttl if ttl else None, "now": now},
+            )
+            conn.execute(
+                self._text(f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET :keep)"),
+                {"keep": self.max_entries},
+            )
+
+    def delete(self, key: str):
+        with self.engine.begin() as conn:
+            conn.execute(self._text(f"DELETE FROM {self.table} WHERE key = :key"), {"key": key})
+
+    def clear(self):
+        with self.engine.begin() as conn:
+            conn.execute(self._text(f"DELETE FROM {self.table}"))
+
+    def __len__(self):
+        with self.engine.connect() as conn:
+            return conn.execute(self._text(f"SELECT COUNT(*) FROM {self.table}")).scalar()
+
+
+def make_backend(kind: str = "memory", namespace: str = "default", max_entries: int = 1024,
+                 directory: str | None = None, url: str | None = None, db_file: str | None = None):
+    if kind == "memory":
+        return MemoryBackend(max_entries=max_entries)
+    if kind == "disk":
+        return DiskBackend(directory or os.path.join("data", "cache", namespace), max_entries=max_entries)
+    if kind == "redis":
+        return RedisBackend(url=url, prefix=f"polymind:{namespace}:")
+    if kind == "sqlite":
+        return SqliteBackend(db_file=db_file, table=f"polymind_{namespace}_cache", max_entries=max_entries)
+    raise ValueError(f"Unknown cache backend: {kind}")
@@ -0,0 +1,379 @@
+import asyncio
+import email.utils
+import os
+import random
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+from agno.utils.log import log_debug
+
+# Responses worth retrying: provider throttling and transient upstream failures
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError, httpx.PoolTimeout)
+
+
+class TokenBucket:
+    """Thread-safe token bucket. ``reserve`` books a token and returns how long the caller must wait for it,
+    so sync callers sleep and async callers await without holding the lock."""
+
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = rate
+        self.capacity = float(burst or max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+def parse_rate_limits(spec: str) -> dict[str, tuple[float, int | None]]:
+    """``api.openai.com=8:16,hacker-news.firebaseio.com=20`` -> {host: (requests per second, burst)}"""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        host, _, value = item.partition("=")
+        rate, _, burst = value.partition(":")
+        limits[host.strip()] = (float(rate), int(burst) if burst else None)
+    return limits
+
+
+def parse_host_concurrency(spec: str) -> dict[str, int]:
+    """``api.openai.com=64,hacker-news.firebaseio.com=8`` -> {host: concurrent requests}"""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        host, _, value = item.partition("=")
+        limits[host.strip()] = int(value)
+    return limits
+
+
+def retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or an HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        parsed = email.utils.parsedate_to_datetime(value)
+        return max(parsed.timestamp() - time.time(), 0.0) if parsed else None
+
+
+class HostPolicy:
+    """Outbound limits shared by every client in the process: per-host concurrency, per-host token buckets
+    and retry with jittered exponential backoff (``Retry-After`` wins when the server sends one)."""
+
+    def __init__(
+        self,
+        rate_limits: dict[str, tuple[float, int | None]] | None = None,
+        max_per_host: int = 16,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        host_concurrency: dict[str, int] | None = None,
+    ):
+        self.rate_limits = rate_limits or {}
+        self.max_per_host = max_per_host
+        # Per-host overrides of max_per_host, e.g. a higher limit for the LLM provider than for scraped sites
+        self.host_concurrency = host_concurrency or {}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retries = 0
+        self._buckets: dict[str, TokenBucket] = {}
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket | None:
+        if host not in self.rate_limits:
+            return None
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(*self.rate_limits[host])
+            return self._buckets[host]
+
+    def token_delay(self, host: str) -> float:
+        bucket = self.bucket(host)
+        return bucket.reserve() if bucket else 0.0
+
+    def concurrency(self, host: str) -> int:
+        return self.host_concurrency.get(host, self.max_per_host)
+
+    def semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.concurrency(host))
+            return self._semaphores[host]
+
+    def backoff(self, attempt: int, response: httpx.Response | None = None) -> float:
+        with self._lock:
+            self.retries += 1
+        hinted = retry_after(response.headers.get("retry-after")) if response is not None else None
+        if hinted is not None:
+            return min(hinted, self.backoff_max)
+        # Full jitter: spreads synchronized clients out instead of retrying in lockstep
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def should_retry(self, attempt: int, response: httpx.Response) -> bool:
+        return response.status_code in RETRY_STATUSES and attempt < self.max_retries
+
+    @contextmanager
+    def limit(self, host: str):
+        """Applies the host's concurrency and rate limits to code that does its own HTTP (e.g. via requests)."""
+        with self.semaphore(host):
+            delay = self.token_delay(host)
+            if delay:
+                time.sleep(delay)
+            yield
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream, release):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class PolicyTransport(httpx.BaseTransport):
+    """Wraps a pooled transport with the host policy. The per-host slot is held until the response is closed,
+    so long streaming completions count against the host for as long as they run."""
+
+    def __init__(self, policy: HostPolicy, transport: httpx.BaseTransport):
+        self.policy = policy
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self.policy.semaphore(host)
+        semaphore.acquire()
+        try:
+            attempt = 0
+            while True:
+                delay = self.policy.token_delay(host)
+                if delay:
+                    time.sleep(delay)
+                try:
+                    response = self.transport.handle_request(request)
+                except RETRY_EXCEPTIONS as e:
+                    if attempt >= self.policy.max_retries:
+                        raise
+                    log_debug(f"Retrying {request.method} {request.url} after {e!r}")
+                    time.sleep(self.policy.backoff(attempt))
+                    attempt += 1
+                    continue
+                if self.policy.should_retry(attempt, response):
+                    delay = self.policy.backoff(attempt, response)
+                    log_debug(f"Retrying {request.method} {request.url} in {delay:.2f}s after HTTP {response.status_code}")
+                    response.close()
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                if response.is_closed:
+                    # Already fully read (e.g. an in-memory response), so there is no stream to hold the slot
+                    semaphore.release()
+                else:
+                    response.stream = _ReleasingStream(response.stream, semaphore.release)
+                return response
+        except BaseException:
+            semaphore.release()
+            raise
+
+    def close(self):
+        self.transport.close()
+
+
+class AsyncPolicyTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`PolicyTransport`. Concurrency slots are per event loop; the token buckets
+    (and so the request rate) are shared with every other client in the process."""
+
+    def __init__(self, policy: HostPolicy, transport: httpx.AsyncBaseTransport):
+        self.policy = policy
+        self.transport = transport
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.policy.concurrency(host))
+        return self._semaphores[host]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self.semaphore(host)
+        await semaphore.acquire()
+        try:
+            attempt = 0
+            while True:
+                delay = self.policy.token_delay(host)
+                if delay:
+                    await asyncio.sleep(delay)
+                try:
+                    response = await self.transport.handle_async_request(request)
+                except RETRY_EXCEPTIONS as e:
+                    if attempt >= self.policy.max_retries:
+                        raise
+                    log_debug(f"Retrying {request.method} {request.url} after {e!r}")
+                    await asyncio.sleep(self.policy.backoff(attempt))
+                    attempt += 1
+                    continue
+                if self.policy.should_retry(attempt, response):
+                    delay = self.policy.backoff(attempt, response)
+                    log_debug(f"Retrying {request.method} {request.url} in {delay:.2f}s after HTTP {response.status_code}")
+                    await response.aclose()
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                if response.is_closed:
+                    semaphore.release()
+                else:
+                    response.stream = _AsyncReleasingStream(response.stream, semaphore.release)
+                return response
+        except BaseException:
+            semaphore.release()
+            raise
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=int(os.getenv("POLYMIND_HTTP_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("POLYMIND_HTTP_MAX_KEEPALIVE", "50")),
+        keepalive_expiry=30,
+    )
+
+
+def _recorded(transport):
+    """Routes the transport through the HTTP cassette when ``POLYMIND_HTTP_CASSETTE`` is set (offline evaluation)."""
+    if not os.getenv("POLYMIND_HTTP_CASSETTE"):
+        return transport
+    from utils.evaluation.cassette import AsyncCassetteTransport, CassetteTransport, get_cassette
+
+    wrapper = AsyncCassetteTransport if isinstance(transport, httpx.AsyncBaseTransport) else CassetteTransport
+    return wrapper(get_cassette(), transport)
+
+
+# Applied per request by the OpenAI client too, which passes its own timeout
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Every member, judge and reasoning call goes to the LLM provider, so it gets more room than the per-host default
+DEFAULT_HOST_CONCURRENCY = "api.openai.com=64"
+
+_policy: HostPolicy | None = None
+_client: httpx.Client | None = None
+# httpx.AsyncClient connections belong to the loop that opened them, so there is one client per event loop,
+# stored with the async generator that closes it when the loop shuts down
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, Any]]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_host_policy() -> HostPolicy:
+    global _policy
+    if _policy is None:
+        with _lock:
+            if _policy is None:
+                _policy = HostPolicy(
+                    rate_limits=parse_rate_limits(os.getenv("POLYMIND_HTTP_RATE_LIMITS", "")),
+                    max_per_host=int(os.getenv("POLYMIND_HTTP_MAX_PER_HOST", "16")),
+                    max_retries=int(os.getenv("POLYMIND_HTTP_MAX_RETRIES", "3")),
+                    host_concurrency=parse_host_concurrency(
+                        os.getenv("POLYMIND_HTTP_HOST_CONCURRENCY", DEFAULT_HOST_CONCURRENCY)
+                    ),
+                )
+    return _policy
+
+
+def set_host_policy(policy: HostPolicy):
+    global _policy, _client
+    with _lock:
+        _policy = policy
+        _client = None
+        _async_clients.clear()
+
+
+def get_http_client() -> httpx.Client:
+    """The process-wide pooled sync client used by model clients and tools."""
+    global _client
+    if _client is None:
+        policy = get_host_policy()
+        with _lock:
+            if _client is None:
+                transport = PolicyTransport(policy, _recorded(httpx.HTTPTransport(limits=_limits())))
+                _client = httpx.Client(transport=transport, timeout=DEFAULT_TIMEOUT, follow_redirects=True)
+    return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """The pooled async client for the running event loop, closed when that loop shuts down."""
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is None:
+        policy = get_host_policy()
+        with _lock:
+            # Loops closed without shutting down their async generators leave their client behind; drop it
+            for stale in [other for other in list(_async_clients.keys()) if other.is_closed()]:
+                _async_clients.pop(stale, None)
+            entry = _async_clients.get(loop)
+            if entry is None:
+                transport = AsyncPolicyTransport(policy, _recorded(httpx.AsyncHTTPTransport(limits=_limits())))
+                client = httpx.AsyncClient(transport=transport, timeout=DEFAULT_TIMEOUT, follow_redirects=True)
+                entry = _async_clients[loop] = (client, _close_with_loop(client))
+    return entry[0]
+
+
+async def _closing_with_loop(client: httpx.AsyncClient):
+    """Stays suspended on the client's loop until the loop shuts down. ``asyncio.run`` (so each
+    ``JudgeTeam.run`` and evaluation case) and uvicorn finalise every suspended async generator before closing
+    their loop, which closes the client and its connections instead of leaking one pool per loop."""
+    try:
+        yield
+    finally:
+        with _lock:
+            _async_clients.pop(asyncio.get_running_loop(), None)
+        await client.aclose()
+
+
+def _close_with_loop(client: httpx.AsyncClient):
+    closer = _closing_with_loop(client)
+    # asend() registers the generator with the running loop; stepping it by hand runs it up to its yield
+    try:
+        closer.asend(None).send(None)
+    except StopIteration:
+        pass
+    # The loop only holds its async generators weakly, so the caller keeps this one alive
+    return closer
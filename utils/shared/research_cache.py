@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextvars import ContextVar
+from typing import Any
+
+from utils.shared.cache import MISSING, make_backend
+
+# Tool functions whose results depend only on their arguments and are safe to share between agents.
+# Stateful tools such as ReasoningTools' think/analyze must never be cached.
+CACHEABLE_TOOLS = {
+    "google_search",
+    "read_article",
+    "get_top_hackernews_stories",
+    "get_user_details",
+    "duckduckgo_search",
+    "duckduckgo_news",
+}
+
+def cacheable(value: Any) -> bool:
+    """Tools such as Newspaper4k and the Hacker News client report failures by returning an "Error ..." string
+    instead of raising. Such a result is handed to the callers already waiting on it, but never stored, so one
+    transient failure is not served to every agent for the whole TTL."""
+    return not (isinstance(value, str) and value.lstrip().lower().startswith("error"))
+
+
+# Outcome of the most recent lookup in this context (hit | miss | coalesced), read by the telemetry tool hook
+last_cache_status: ContextVar[str | None] = ContextVar("research_cache_status", default=None)
+
+
+class ResearchCache:
+    """Process-wide cache for research tool calls.
+
+    Identical requests that are already in flight are merged, so when the Judge Team hands one topic
+    to all four members each search or article download only hits the network once.
+    """
+
+    def __init__(self, backend=None, ttl: float = 900, max_entries: int = 1024):
+        self.backend = backend if backend is not None else make_backend("memory", max_entries=max_entries)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(function_name: str, arguments: dict[str, Any]) -> str:
+        payload = json.dumps(arguments, sort_keys=True, default=str)
+        return f"{function_name}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        value = self.backend.get(key)
+        if value is not MISSING:
+            with self._lock:
+                self.hits += 1
+            last_cache_status.set("hit")
+            return value
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            last_cache_status.set("coalesced")
+            return future.result()
+
+        last_cache_status.set("miss")
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            if cacheable(value):
+                self.backend.set(key, value, self.ttl)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "entries": len(self.backend),
+        }
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = self.coalesced = 0
+
+
+_research_cache: ResearchCache | None = None
+_research_cache_lock = threading.Lock()
+
+
+def get_research_cache() -> ResearchCache:
+    global _research_cache
+    if _research_cache is None:
+        with _research_cache_lock:
+            if _research_cache is None:
+                backend = make_backend(
+                    os.getenv("POLYMIND_RESEARCH_CACHE", "memory"),
+                    namespace="research",
+                    max_entries=int(os.getenv("POLYMIND_RESEARCH_CACHE_SIZE", "1024")),
+                    directory=os.getenv("POLYMIND_RESEARCH_CACHE_DIR"),
+                )
+                _research_cache = ResearchCache(backend, ttl=float(os.getenv("POLYMIND_RESEARCH_CACHE_TTL", "900")))
+    return _research_cache
+
+
+def set_research_cache(cache: ResearchCache):
+    global _research_cache
+    with _research_cache_lock:
+        _research_cache = cache
+
+
+def research_cache_hook(function_name: str, function_call: Callable, arguments: dict[str, Any]):
+    """Agno tool hook that routes research tool calls through the shared cache."""
+    if function_name not in CACHEABLE_TOOLS:
+        return function_call(**arguments)
+    cache = get_research_cache()
+    return cache.get_or_fetch(cache.key(function_name, arguments), lambda: function_call(**arguments))
@@ -0,0 +1,206 @@
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from utils.shared.cache import MISSING, make_backend
+
+# Sentence punctuation and quotes around words only; symbols that change the meaning ("C++", "C#", "3.5") stay
+_PUNCTUATION = re.compile(r"[.,;:!?\"'()\[\]{}]+(?=\s|$)|(?<!\S)[\"'(\[{]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class ResponseCache:
+    """Cache of finished agent/team responses keyed by who answered and what was asked.
+
+    The scope covers the agent or team name, a hash of its instructions, the model id and temperature, so editing
+    a prompt or switching models never serves a stale answer. A team's scope also covers its members' scopes. Within a scope, lookups are by the normalised topic
+    and, when ``similarity_threshold`` is set, by cosine similarity of topic embeddings to catch near-duplicates.
+    """
+
+    def __init__(self, backend=None, ttl: float = 3600, max_entries: int = 1024,
+                 similarity_threshold: float | None = None, embedder=None):
+        self.backend = backend if backend is not None else make_backend("memory", max_entries=max_entries)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        if similarity_threshold is not None and embedder is None:
+            from utils.retrieval.embeddings import HashingEmbedder
+
+            embedder = HashingEmbedder()
+        self.embedder = embedder
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        # scope -> OrderedDict(key -> topic vector); only kept when semantic lookup is enabled
+        self._vectors: dict[str, OrderedDict[str, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(topic: str) -> str:
+        return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", topic.lower())).strip()
+
+    @staticmethod
+    def scope(name: str, instructions: Any, model_id: str | None, temperature: float | None, variant: str = "") -> str:
+        instructions_hash = hashlib.sha256(repr(instructions).encode()).hexdigest()[:16]
+        return f"{name}|{instructions_hash}|{model_id}|{temperature}|{variant}"
+
+    @classmethod
+    def scope_for(cls, runner, variant: str = "", members=None) -> str:
+        """Build the scope of an agno Agent or Team. ``members`` defaults to a Team's members; pass the agents
+        whose reports an Agent judges (fan-out and routing) so changing one of them changes the scope too."""
+        model = getattr(runner, "model", None)
+        members = getattr(runner, "members", None) if members is None else members
+        instructions = getattr(runner, "instructions", None)
+        if members:
+            instructions = (instructions, [cls.scope_for(member) for member in members])
+        return cls.scope(
+            getattr(runner, "name", type(runner).__name__),
+            instructions,
+            getattr(model, "id", None),
+            getattr(model, "temperature", None),
+            variant,
+        )
+
+    def _key(self, scope: str, normalized_topic: str) -> str:
+        digest = hashlib.sha256(f"{scope}\n{normalized_topic}".encode()).hexdigest()
+        return f"response:{digest}"
+
+    def get(self, scope: str, topic: str) -> Any:
+        normalized = self.normalize(topic)
+        value = self.backend.get(self._key(scope, normalized))
+        if value is not MISSING:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        if self.similarity_threshold is not None:
+            key, similarity = self._nearest(scope, normalized)
+            if key is not None and similarity >= self.similarity_threshold:
+                value = self.backend.get(key)
+                if value is not MISSING:
+                    with self._lock:
+                        self.semantic_hits += 1
+                    return value
+
+        with self._lock:
+            self.misses += 1
+        return MISSING
+
+    def set(self, scope: str, topic: str, value: Any):
+        normalized = self.normalize(topic)
+        key = self._key(scope, normalized)
+        self.backend.set(key, value, self.ttl)
+        if self.similarity_threshold is not None:
+            vector = self.embedder.embed([normalized])[0]
+            with self._lock:
+                vectors = self._vectors.setdefault(scope, OrderedDict())
+                vectors[key] = vector
+                vectors.move_to_end(key)
+                while len(vectors) > self.max_entries:
+                    vectors.popitem(last=False)
+
+    def _nearest(self, scope: str, normalized: str) -> tuple[str | None, float]:
+        with self._lock:
+            vectors = self._vectors.get(scope)
+            if not vectors:
+                return None, 0.0
+            keys = list(vectors.keys())
+            matrix = np.stack(list(vectors.values()))
+        query = self.embedder.embed([normalized])[0]
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        return keys[best], float(similarities[best])
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.semantic_hits + self.misses
+        return {
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.semantic_hits) / lookups if lookups else 0.0,
+            "entries": len(self.backend),
+        }
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            self._vectors.clear()
+            self.hits = self.semantic_hits = self.misses = 0
+
+
+_response_cache: ResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache | None:
+    """The process-wide response cache, or None when POLYMIND_RESPONSE_CACHE is off (the default)."""
+    global _response_cache
+    kind = os.getenv("POLYMIND_RESPONSE_CACHE", "off")
+    if kind == "off":
+        return None
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                max_entries = int(os.getenv("POLYMIND_RESPONSE_CACHE_SIZE", "1024"))
+                threshold = os.getenv("POLYMIND_RESPONSE_CACHE_SIMILARITY")
+                _response_cache = ResponseCache(
+                    make_backend(kind, namespace="response", max_entries=max_entries),
+                    ttl=float(os.getenv("POLYMIND_RESPONSE_CACHE_TTL", "3600")),
+                    max_entries=max_entries,
+                    similarity_threshold=float(threshold) if threshold else None,
+                )
+    return _response_cache
+
+
+def set_response_cache(cache: ResponseCache | None):
+    global _response_cache
+    with _response_cache_lock:
+        _response_cache = cache
+
+
+def cached_run(runner, topic: str, run: Callable[[], Any], stream: bool = False, variant: str = "", members=None) -> Any:
+    """Serve ``run()`` for ``runner`` (an agno Agent or Team) from the response cache when possible.
+
+    Streaming runs bypass the cache, and only successfully completed responses are stored: a debate whose
+    judge finished on reports from members that timed out, failed or were cut off is not cached.
+    """
+    cache = get_response_cache()
+    if cache is None or stream:
+        return run()
+    scope = cache.scope_for(runner, variant, members)
+    value = cache.get(scope, topic)
+    if value is not MISSING:
+        return value
+    response = run()
+    if _is_completed(response):
+        cache.set(scope, topic, response)
+    return response
+
+
+async def acached_run(runner, topic: str, run: Callable[[], Any], variant: str = "", members=None) -> Any:
+    cache = get_response_cache()
+    if cache is None:
+        return await run()
+    scope = cache.scope_for(runner, variant, members)
+    value = cache.get(scope, topic)
+    if value is not MISSING:
+        return value
+    response = await run()
+    if _is_completed(response):
+        cache.set(scope, topic, response)
+    return response
+
+
+def _is_completed(response: Any) -> bool:
+    status = getattr(response, "status", None)
+    if response is None or getattr(status, "value", status) not in (None, "COMPLETED"):
+        return False
+    # Fan-out and routed debates record each member's outcome; a degraded one would be served for the whole TTL
+    reports = (getattr(response, "metadata", None) or {}).get("member_reports") or []
+    return all(report.get("status") == "completed" for report in reports)
@@ -0,0 +1,353 @@
+import atexit
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any
+
+from agno.db.base import SessionType
+from agno.db.sqlite import SqliteDb
+from agno.db.utils import CustomJSONEncoder
+from agno.session import AgentSession, TeamSession, WorkflowSession
+from agno.utils.log import log_debug, log_warning
+from sqlalchemy import event, text
+
+try:
+    import fcntl
+except ImportError:  # Windows: flushes are only serialised within the process
+    fcntl = None
+
+SESSION_CLASSES = {
+    SessionType.AGENT.value: AgentSession,
+    SessionType.TEAM.value: TeamSession,
+    SessionType.WORKFLOW.value: WorkflowSession,
+}
+
+
+@contextmanager
+def _file_lock(path: str | None):
+    """Exclusive lock on ``path`` across processes (e.g. uvicorn workers sharing one database file)."""
+    if path is None or fcntl is None:
+        yield
+        return
+    with open(path, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _session_type(session) -> str:
+    if isinstance(session, TeamSession):
+        return SessionType.TEAM.value
+    if isinstance(session, WorkflowSession):
+        return SessionType.WORKFLOW.value
+    return SessionType.AGENT.value
+
+
+class SessionDb(SqliteDb):
+    """agno's ``SqliteDb`` tuned for long-running AgentOS workers.
+
+    - WAL journal, so readers (the session endpoints, other workers) never wait on the writer.
+    - Write-behind: sessions are serialised on the request path, but the database writes happen on a background
+      thread in batches of up to ``batch_size``. Several saves of the same session are merged into one write,
+      and reads see pending writes.
+    - Bounded history: only the last ``history_runs`` runs (with their members' runs) stay on the session row
+      that agno loads on every run. Older runs move to an archive table and are paged back in with
+      :meth:`get_runs` / :meth:`get_run` only when someone asks for them.
+
+    Several workers can share the file. A worker may have loaded a session before another worker's save of it
+    was flushed, so each flush merges the runs already on the row into the pending save by run id, under a
+    lock file that serialises the flushes of all workers. Other session fields are last-writer-wins. Pending
+    writes live in memory until the next flush, so a killed worker (SIGKILL, OOM) loses up to
+    ``flush_interval`` seconds of saves; ``flush_interval=0`` writes through on every save instead.
+    """
+
+    def __init__(
+        self,
+        db_file: str | None = None,
+        history_runs: int = 20,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+        archive_table: str = "polymind_run_archive",
+        **kwargs: Any,
+    ):
+        super().__init__(db_file=db_file, **kwargs)
+        self.history_runs = max(1, history_runs)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.archive_table = archive_table
+        self.writes = 0
+        self.flushes = 0
+        self.archived = 0
+
+        event.listen(self.db_engine, "connect", self._configure_connection)
+        # Connections opened before the listener was attached would miss the pragmas
+        self.db_engine.dispose()
+        with self.db_engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {archive_table} (session_id TEXT NOT NULL, run_id TEXT NOT NULL, "
+                "created_at INTEGER, run TEXT NOT NULL, PRIMARY KEY (session_id, run_id))"
+            ))
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {archive_table}_recent ON {archive_table} (session_id, created_at)"))
+
+        # session_id -> (session type, serialised session); only the latest save of each session is kept
+        self._pending: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._archive: list[dict[str, Any]] = []
+        # The batch being written, still served to readers until it is committed
+        self._flushing: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._lock_path = f"{self.db_file}.lock" if self.db_file else None
+        self._thread = None
+        if flush_interval > 0:
+            self._thread = threading.Thread(target=self._writer, name="session-db-writer", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        # Durable at checkpoints rather than on every commit; a crash can lose the last moments, not corrupt the file
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+    # -- Writes --
+
+    def upsert_session(self, session, deserialize: bool | None = True):
+        serialized = session.to_dict()
+        serialized["runs"], evicted = self._split_history(serialized.get("runs") or [])
+        with self._lock:
+            self._pending[serialized["session_id"]] = (_session_type(session), serialized)
+            self._archive.extend(
+                {"session_id": serialized["session_id"], "run_id": run.get("run_id"), "created_at": run.get("created_at"),
+                 "run": json.dumps(run, cls=CustomJSONEncoder)}
+                for run in evicted
+            )
+            self.writes += 1
+            full = len(self._pending) >= self.batch_size
+        if self._thread is None:
+            self.flush()
+        elif full:
+            self._wake.set()
+        # agno ignores the return value; give back the session as it will be stored
+        return session if deserialize else serialized
+
+    def _split_history(self, runs: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """(kept, evicted): the last ``history_runs`` top-level runs stay, and member runs go with their team run."""
+        top_level = [run.get("run_id") for run in runs if not run.get("parent_run_id")]
+        if len(top_level) <= self.history_runs:
+            return runs, []
+        keep = set(top_level[-self.history_runs:])
+        kept, evicted = [], []
+        for run in runs:
+            (kept if (run.get("parent_run_id") or run.get("run_id")) in keep else evicted).append(run)
+        return kept, evicted
+
+    def _writer(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                log_warning(f"Session write-behind flush failed: {e}")
+
+    def flush(self):
+        """Write all pending sessions and archived runs in one batch."""
+        with self._write_lock, _file_lock(self._lock_path):
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                archive, self._archive = self._archive, []
+                self._flushing = pending
+            if not pending and not archive:
+                return
+            try:
+                merged, evicted = self._merge_stored_runs(pending)
+                archive = archive + evicted
+                if archive:
+                    with self.db_engine.begin() as conn:
+                        conn.execute(text(
+                            f"INSERT OR REPLACE INTO {self.archive_table} (session_id, run_id, created_at, run) "
+                            "VALUES (:session_id, :run_id, :created_at, :run)"
+                        ), archive)
+                        self.archived += len(archive)
+                sessions = [SESSION_CLASSES[kind].from_dict(data) for kind, data in merged.values()]
+                super().upsert_sessions([s for s in sessions if s is not None], deserialize=False)
+            except Exception:
+                # Put the batch back (newer saves win) so a transient error such as a locked database loses nothing
+                with self._lock:
+                    self._pending = {**pending, **self._pending}
+                    self._archive = archive + self._archive
+                raise
+            finally:
+                with self._lock:
+                    self._flushing = {}
+            self.flushes += 1
+            log_debug(f"Flushed {len(pending)} sessions and {len(archive)} archived runs")
+
+    def _merge_stored_runs(self, pending: dict[str, tuple[str, dict[str, Any]]]):
+        """Add the runs another worker saved since this worker loaded each session; returns (sessions, evicted)."""
+        table = self._get_table(table_type="sessions")
+        if table is None:
+            return pending, []
+        with self.db_engine.connect() as conn:
+            rows = conn.execute(
+                table.select().with_only_columns(table.c.session_id, table.c.runs).where(table.c.session_id.in_(list(pending)))
+            ).fetchall()
+        merged, evicted = dict(pending), []
+        for session_id, stored in rows:
+            stored = json.loads(stored) if isinstance(stored, str) else stored
+            kind, data = pending[session_id]
+            runs = data.get("runs") or []
+            known = {run.get("run_id") for run in runs}
+            missing = [run for run in stored or [] if run.get("run_id") not in known]
+            if not missing:
+                continue
+            # Python's sort is stable, so member runs stay next to the team run they were saved with
+            combined = sorted(missing + runs, key=lambda run: run.get("created_at") or 0)
+            kept, dropped = self._split_history(combined)
+            merged[session_id] = (kind, {**data, "runs": kept})
+            evicted.extend(
+                {"session_id": session_id, "run_id": run.get("run_id"), "created_at": run.get("created_at"),
+                 "run": json.dumps(run, cls=CustomJSONEncoder)}
+                for run in dropped
+            )
+        return merged, evicted
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    # -- Reads --
+
+    def _pending_session(self, session_id: str, session_type=None, user_id: str | None = None):
+        with self._lock:
+            entry = self._pending.get(session_id) or self._flushing.get(session_id)
+        if entry is None:
+            return None
+        kind, data = entry
+        if session_type is not None and getattr(session_type, "value", session_type) != kind:
+            return None
+        if user_id is not None and data.get("user_id") != user_id:
+            return None
+        return kind, data
+
+    def get_session(self, session_id: str, session_type, user_id: str | None = None, deserialize: bool | None = True):
+        pending = self._pending_session(session_id, session_type, user_id)
+        if pending is not None:
+            kind, data = pending
+            return SESSION_CLASSES[kind].from_dict(data) if deserialize else dict(data)
+        return super().get_session(session_id, session_type, user_id=user_id, deserialize=deserialize)
+
+    def get_sessions(self, *args, **kwargs):
+        # Listings and counts come straight from SQL, so pending sessions are written out first
+        self.flush()
+        return super().get_sessions(*args, **kwargs)
+
+    def _discard(self, session_ids: list[str]) -> bool:
+        """Drop pending writes and archived runs of deleted sessions; True if any write was pending."""
+        with self._lock:
+            pending = [self._pending.pop(session_id, None) for session_id in session_ids]
+            self._archive = [run for run in self._archive if run["session_id"] not in session_ids]
+        with self.db_engine.begin() as conn:
+            for session_id in session_ids:
+                conn.execute(text(f"DELETE FROM {self.archive_table} WHERE session_id = :id"), {"id": session_id})
+        return any(entry is not None for entry in pending)
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._write_lock:
+            was_pending = self._discard([session_id])
+            return super().delete_session(session_id) or was_pending
+
+    def delete_sessions(self, session_ids: list[str]) -> None:
+        with self._write_lock:
+            self._discard(session_ids)
+            super().delete_sessions(session_ids)
+
+    def _recent_runs(self, session_id: str) -> list[dict[str, Any]]:
+        """The runs still on the session row, oldest first."""
+        pending = self._pending_session(session_id)
+        if pending is not None:
+            return list(pending[1].get("runs") or [])
+        table = self._get_table(table_type="sessions")
+        if table is None:
+            return []
+        with self.db_engine.connect() as conn:
+            runs = conn.execute(table.select().with_only_columns(table.c.runs).where(table.c.session_id == session_id)).scalar()
+        if isinstance(runs, str):
+            runs = json.loads(runs)
+        return runs or []
+
+    def get_runs(self, session_id: str, limit: int = 20, offset: int = 0) -> list[dict[str, Any]]:
+        """A page of a session's runs, newest first, across the session row and the archive."""
+        recent = self._recent_runs(session_id)[::-1]
+        page = recent[offset:offset + limit]
+        if len(page) < limit:
+            self.flush()
+            with self.db_engine.connect() as conn:
+                rows = conn.execute(text(
+                    f"SELECT run FROM {self.archive_table} WHERE session_id = :id "
+                    "ORDER BY created_at DESC, rowid DESC LIMIT :limit OFFSET :offset"
+                ), {"id": session_id, "limit": limit - len(page), "offset": max(0, offset - len(recent))}).fetchall()
+            page.extend(json.loads(row.run) for row in rows)
+        return page
+
+    def get_run(self, session_id: str, run_id: str) -> dict[str, Any] | None:
+        for run in self._recent_runs(session_id):
+            if run.get("run_id") == run_id:
+                return run
+        self.flush()
+        with self.db_engine.connect() as conn:
+            row = conn.execute(
+                text(f"SELECT run FROM {self.archive_table} WHERE session_id = :id AND run_id = :run_id"),
+                {"id": session_id, "run_id": run_id},
+            ).fetchone()
+        return json.loads(row.run) if row else None
+
+    def count_runs(self, session_id: str) -> int:
+        self.flush()
+        with self.db_engine.connect() as conn:
+            archived = conn.execute(
+                text(f"SELECT COUNT(*) FROM {self.archive_table} WHERE session_id = :id"), {"id": session_id}
+            ).scalar()
+        return len(self._recent_runs(session_id)) + archived
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+        return {"writes": self.writes, "flushes": self.flushes, "archived_runs": self.archived, "pending": pending}
+
+
+_session_db: SessionDb | None = None
+_session_db_lock = threading.Lock()
+
+
+def get_session_db() -> SessionDb:
+    global _session_db
+    if _session_db is None:
+        with _session_db_lock:
+            if _session_db is None:
+                _session_db = SessionDb(
+                    db_file=os.getenv("POLYMIND_DB_FILE", os.path.join("data", "polymind.db")),
+                    history_runs=int(os.getenv("POLYMIND_SESSION_HISTORY_RUNS", "20")),
+                    batch_size=int(os.getenv("POLYMIND_DB_BATCH_SIZE", "64")),
+                    flush_interval=float(os.getenv("POLYMIND_DB_FLUSH_INTERVAL", "0.5")),
+                )
+    return _session_db
+
+
+def set_session_db(db: SessionDb):
+    global _session_db
+    with _session_db_lock:
+        _session_db = db
@@ -0,0 +1,20 @@
+from .exporters import InMemoryExporter, JsonlExporter, OTLPExporter, make_exporter
+from .instrument import hook_toolkits, instrument, telemetry_tool_hook
+from .metrics import LatencyHistogram, MetricsRegistry
+from .spans import Span, Tracer, get_tracer, set_tracer
+
+__all__ = [
+    "InMemoryExporter",
+    "JsonlExporter",
+    "OTLPExporter",
+    "make_exporter",
+    "hook_toolkits",
+    "instrument",
+    "telemetry_tool_hook",
+    "LatencyHistogram",
+    "MetricsRegistry",
+    "Span",
+    "Tracer",
+    "get_tracer",
+    "set_tracer",
+]
@@ -0,0 +1,126 @@
+import json
+import os
+import threading
+from collections import deque
+
+from agno.utils.log import log_warning
+
+
+class InMemoryExporter:
+    """Keeps the most recent spans in memory; meant for tests and debugging."""
+
+    def __init__(self, max_spans: int = 10000):
+        self.spans = deque(maxlen=max_spans)
+
+    def export(self, span):
+        self.spans.append(span)
+
+    def flush(self):
+        pass
+
+
+class JsonlExporter:
+    """Appends one JSON object per finished span to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+
+    def flush(self):
+        pass
+
+
+class OTLPExporter:
+    """Batches spans and posts them to an OTLP/HTTP collector as JSON (``{endpoint}/v1/traces``).
+
+    Spans are queued and shipped from a background thread so the hot path never waits on the collector.
+    """
+
+    def __init__(self, endpoint: str | None = None, service_name: str = "polymind", batch_size: int = 256,
+                 interval: float = 5.0, headers: dict[str, str] | None = None):
+        self.endpoint = (endpoint or os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318")).rstrip("/")
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.interval = interval
+        self.headers = headers or {}
+        self._queue = deque(maxlen=batch_size * 64)
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span):
+        self._queue.append(span)
+        if len(self._queue) >= self.batch_size:
+            self._wake.set()
+
+    def flush(self):
+        while self._queue:
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            self._post(batch)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                log_warning(f"OTLP export failed: {e}")
+
+    def _post(self, spans: list):
+        import httpx
+
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{"scope": {"name": "polymind"}, "spans": [_otlp_span(s) for s in spans]}],
+            }]
+        }
+        httpx.post(f"{self.endpoint}/v1/traces", json=payload, headers=self.headers, timeout=10)
+
+
+def _attribute(key, value):
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span):
+    return {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "parentSpanId": span.parent_id or "",
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(int(span.start_time * 1e9)),
+        "endTimeUnixNano": str(int(span.end_time * 1e9)),
+        "attributes": [_attribute(k, v) for k, v in span.attributes.items() if v is not None]
+        + [_attribute("polymind.kind", span.kind)],
+        "status": {"code": 2 if span.status == "error" else 1},
+    }
+
+
+def make_exporter(spec: str | None = None):
+    """``none``, ``memory``, ``jsonl:<path>`` or ``otlp[:<endpoint>]``; defaults to $POLYMIND_TELEMETRY_EXPORTER."""
+    spec = spec or os.getenv("POLYMIND_TELEMETRY_EXPORTER", "none")
+    kind, _, arg = spec.partition(":")
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return InMemoryExporter()
+    if kind == "jsonl":
+        return JsonlExporter(arg or os.path.join("data", "telemetry", "spans.jsonl"))
+    if kind == "otlp":
+        return OTLPExporter(arg or None)
+    raise ValueError(f"Unknown telemetry exporter: {spec}")
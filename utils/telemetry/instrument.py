@@ -0,0 +1,151 @@
+import inspect
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from utils.shared.research_cache import CACHEABLE_TOOLS, last_cache_status
+from utils.telemetry.spans import Span, Tracer, _current_span, get_tracer
+
+
+def telemetry_tool_hook(function_name: str, function_call: Callable, arguments: dict[str, Any]):
+    """Agno tool hook that times each tool call. List it before research_cache_hook so it sees cache outcomes."""
+    tracer = get_tracer()
+    token = last_cache_status.set(None)
+    try:
+        with tracer.span(function_name, "tool", tool=function_name) as span:
+            result = function_call(**arguments)
+            status = last_cache_status.get()
+            if status is not None:
+                span.set(cache_status=status)
+            if function_name in CACHEABLE_TOOLS and status not in ("hit", "coalesced") and isinstance(result, str):
+                span.set(bytes_fetched=len(result.encode()))
+            return result
+    finally:
+        last_cache_status.reset(token)
+
+
+def hook_toolkits(toolkits: Sequence, hooks: list[Callable]) -> list:
+    """Attach sync tool hooks to the functions of ``toolkits`` directly.
+
+    For an agno Team, use this instead of ``Team(tool_hooks=...)``. Team-level hooks also wrap the team's async
+    delegation tool, and under ``arun`` a sync hook's ``function_call`` returns a coroutine it cannot await, so
+    the members would never run.
+    """
+    for toolkit in toolkits:
+        for function in getattr(toolkit, "functions", {}).values():
+            function.tool_hooks = list(hooks)
+    return list(toolkits)
+
+
+def _record_usage(span: Span, item: Any):
+    metrics = getattr(item, "metrics", None)
+    if metrics is not None and getattr(metrics, "input_tokens", None) is not None:
+        span.set(prompt_tokens=metrics.input_tokens, completion_tokens=metrics.output_tokens)
+    model = getattr(item, "model", None)
+    if isinstance(model, str):
+        span.set(model=model)
+
+
+def _traced_iterator(tracer: Tracer, span: Span, iterator):
+    error = None
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                _current_span.reset(token)
+            _record_usage(span, item)
+            yield item
+    except GeneratorExit:
+        span.status = "cancelled"
+        raise
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        tracer.finish(span, error)
+
+
+async def _traced_async_iterator(tracer: Tracer, span: Span, iterator):
+    error = None
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                _current_span.reset(token)
+            _record_usage(span, item)
+            yield item
+    except GeneratorExit:
+        span.status = "cancelled"
+        raise
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        tracer.finish(span, error)
+
+
+async def _traced_coroutine(tracer: Tracer, span: Span, coroutine):
+    token = _current_span.set(span)
+    try:
+        result = await coroutine
+    except BaseException as e:
+        _current_span.reset(token)
+        tracer.finish(span, e)
+        raise
+    _current_span.reset(token)
+    _record_usage(span, result)
+    tracer.finish(span)
+    return result
+
+
+def instrument(runner, kind: str = "agent"):
+    """Wrap ``run``/``arun`` of an agno Agent or Team instance in timed spans (streaming and non-streaming)."""
+    if getattr(runner, "_polymind_instrumented", False):
+        return runner
+    name = runner.name or type(runner).__name__
+    model_id = getattr(getattr(runner, "model", None), "id", None)
+    run, arun = runner.run, runner.arun
+
+    def traced_run(*args, **kwargs):
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return run(*args, **kwargs)
+        span = tracer.start(name, kind, model=model_id)
+        token = _current_span.set(span)
+        try:
+            result = run(*args, **kwargs)
+        except BaseException as e:
+            _current_span.reset(token)
+            tracer.finish(span, e)
+            raise
+        _current_span.reset(token)
+        if inspect.isgenerator(result):
+            return _traced_iterator(tracer, span, result)
+        _record_usage(span, result)
+        tracer.finish(span)
+        return result
+
+    def traced_arun(*args, **kwargs):
+        tracer = get_tracer()
+        result = arun(*args, **kwargs)
+        if not tracer.enabled:
+            return result
+        span = tracer.start(name, kind, model=model_id)
+        if inspect.iscoroutine(result):
+            return _traced_coroutine(tracer, span, result)
+        if hasattr(result, "__anext__"):
+            return _traced_async_iterator(tracer, span, result)
+        tracer.finish(span)
+        return result
+
+    runner.run = traced_run
+    runner.arun = traced_arun
+    runner._polymind_instrumented = True
+    return runner
@@ -0,0 +1,83 @@
+import bisect
+import threading
+from collections.abc import Sequence
+
+# Upper bounds in milliseconds; LLM calls and web fetches span from a few ms (cache hits) to minutes
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000, 30000, 60000, 120000, 300000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, cheap enough to update on every span."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, duration_ms: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, duration_ms)] += 1
+            self.count += 1
+            self.total_ms += duration_ms
+            self.max_ms = max(self.max_ms, duration_ms)
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket containing the q-th quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "max_ms": self.max_ms,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": [{"le": le, "count": c} for le, c in zip(self.buckets + ["+Inf"], self.counts, strict=True)],
+        }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self.counters: dict[tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, kind: str, name: str, duration_ms: float):
+        key = (kind, name)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(key, LatencyHistogram())
+        histogram.observe(duration_ms)
+
+    def increment(self, kind: str, name: str, counter: str, value: float = 1):
+        with self._lock:
+            key = (kind, name, counter)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def snapshot(self, kinds: list[str] | None = None):
+        result: dict[str, dict[str, dict]] = {}
+        for (kind, name), histogram in list(self.histograms.items()):
+            if kinds is None or kind in kinds:
+                result.setdefault(kind, {})[name] = {"latency": histogram.to_dict()}
+        for (kind, name, counter), value in list(self.counters.items()):
+            if kinds is None or kind in kinds:
+                result.setdefault(kind, {}).setdefault(name, {})[counter] = value
+        return result
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
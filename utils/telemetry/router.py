@@ -0,0 +1,21 @@
+from agno.os.auth import get_authentication_dependency
+from agno.os.settings import AgnoAPISettings
+from fastapi import APIRouter, Depends, Query
+
+from utils.telemetry.spans import get_tracer
+
+
+def get_telemetry_router(settings: AgnoAPISettings | None = None) -> APIRouter:
+    """Latency and counter snapshots, guarded by the AgentOS security key like the rest of the API."""
+    router = APIRouter(
+        prefix="/telemetry",
+        tags=["Telemetry"],
+        dependencies=[Depends(get_authentication_dependency(settings or AgnoAPISettings()))],
+    )
+
+    @router.get("/latency")
+    def latency(kind: str | None = Query(None, description="agent, team, judge, tool or compaction")):
+        """Per-agent, per-tool and per-team latency histograms plus token, byte, cache and compaction counters."""
+        return get_tracer().metrics.snapshot([kind] if kind else None)
+
+    return router
@@ -0,0 +1,130 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from agno.utils.log import log_warning
+
+from utils.telemetry.exporters import make_exporter
+from utils.telemetry.metrics import MetricsRegistry
+
+
+@dataclass
+class Span:
+    name: str
+    # agent | team | judge | tool
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_time: float = 0.0
+    end_time: float = 0.0
+    status: str = "ok"
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_time - self.start_time) * 1000
+
+    def set(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+_current_span: ContextVar[Span | None] = ContextVar("polymind_current_span", default=None)
+
+
+class Tracer:
+    """Creates spans, feeds their durations into latency histograms and hands them to the exporters."""
+
+    def __init__(self, exporters: list | None = None, enabled: bool = True):
+        self.exporters = list(exporters or [])
+        self.enabled = enabled
+        self.metrics = MetricsRegistry()
+
+    def start(self, name: str, kind: str, **attributes: Any) -> Span:
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            kind=kind,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time(),
+            attributes={k: v for k, v in attributes.items() if v is not None},
+        )
+
+    def finish(self, span: Span, error: BaseException | None = None):
+        span.end_time = time.time()
+        if error is not None:
+            span.status = "error"
+            span.attributes["error"] = repr(error)
+        self.metrics.observe(span.kind, span.name, span.duration_ms)
+        for counter in ("prompt_tokens", "completion_tokens", "bytes_fetched"):
+            if span.attributes.get(counter):
+                self.metrics.increment(span.kind, span.name, counter, span.attributes[counter])
+        if "cache_status" in span.attributes:
+            self.metrics.increment(span.kind, span.name, f"cache_{span.attributes['cache_status']}")
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                log_warning(f"Telemetry exporter {type(exporter).__name__} failed: {e}")
+
+    @contextmanager
+    def span(self, name: str, kind: str, **attributes: Any):
+        if not self.enabled:
+            yield Span(name, kind, "", "")
+            return
+        span = self.start(name, kind, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            _current_span.reset(token)
+            self.finish(span, e)
+            raise
+        _current_span.reset(token)
+        self.finish(span)
+
+    def flush(self):
+        for exporter in self.exporters:
+            exporter.flush()
+
+
+_tracer: Tracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                exporter = make_exporter()
+                _tracer = Tracer(
+                    exporters=[exporter] if exporter else [],
+                    enabled=os.getenv("POLYMIND_TELEMETRY", "on") != "off",
+                )
+    return _tracer
+
+
+def set_tracer(tracer: Tracer):
+    global _tracer
+    with _tracer_lock:
+        _tracer = tracer